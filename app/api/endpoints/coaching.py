@@ -1,11 +1,18 @@
+import json
 import logging
-from fastapi import APIRouter, HTTPException, status, Depends
+from typing import AsyncIterator, Optional, Tuple
+from fastapi import APIRouter, HTTPException, status, Depends, Query, Request
+from fastapi.responses import StreamingResponse
+from app.core.config import settings
+from app.core.deadline import Deadline
 from app.schemas.coaching import ResumePayload, CoachingResult, ErrorResponse
+from app.services.batch_runner import parse_jsonl, run_batch
 from app.services.coaching_service import (
     get_coaching_service,
     CoachingService,
     CoachingServiceError,
 )
+from app.services.container import get_service_container
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -58,6 +65,10 @@ router = APIRouter()
 )
 async def create_coaching_session(
     payload: ResumePayload,
+    bypass_cache: bool = Query(False, description="세션 결과 캐시와 LLM 응답 캐시를 사용하지 않고 새로 생성"),
+    enable_quality_optimization: bool = Query(
+        True, description="품질 최적화 모드 사용 여부 (false이면 단일 전략으로 빠르게 생성)"
+    ),
     coaching_service: CoachingService = Depends(get_coaching_service),
 ) -> CoachingResult:
     """
@@ -66,6 +77,8 @@ async def create_coaching_session(
     - **career_summary**: 경력 요약 (필수)
     - **job_duties**: 수행 직무 (필수)
     - **technical_skills**: 보유 기술 스킬 리스트 (필수)
+    - **bypass_cache**: 캐시된 결과 대신 새로 생성 (쿼리 파라미터, 선택)
+    - **enable_quality_optimization**: 품질 최적화 모드 사용 여부 (쿼리 파라미터, 기본값 true)
 
     반환값:
     - **session_id**: 고유 세션 식별자
@@ -76,7 +89,14 @@ async def create_coaching_session(
         logger.info(f"코칭 세션 요청 수신: {payload.career_summary[:50]}...")
 
         # 코칭 서비스를 통한 세션 생성
-        result = await coaching_service.create_coaching_session(payload)
+        # 요청 전체 데드라인을 서비스와 모든 LLM 호출에 전파
+        deadline = Deadline.after(settings.request_timeout_seconds)
+        result = await coaching_service.create_coaching_session(
+            payload,
+            enable_quality_optimization=enable_quality_optimization,
+            use_cache=not bypass_cache,
+            deadline=deadline,
+        )
 
         logger.info(f"코칭 세션 생성 성공: {result.session_id}")
         return result
@@ -104,18 +124,137 @@ async def create_coaching_session(
         )
 
 
+async def _format_sse(events: AsyncIterator[Tuple[str, dict]]) -> AsyncIterator[str]:
+    """(이벤트명, 데이터) 스트림을 server-sent events 형식으로 변환"""
+    async for event, data in events:
+        yield f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+@router.post(
+    "/coaching-sessions/stream",
+    summary="📡 코칭 세션 스트리밍 생성",
+    description="""
+## 코칭 세션 스트리밍 생성 (Server-Sent Events)
+
+전체 결과를 기다리지 않고, 면접 질문과 학습 단계가 생성되는 즉시 이벤트로 전달합니다.
+첫 콘텐츠까지의 대기 시간을 수 초에서 1초 미만으로 줄이기 위한 엔드포인트입니다.
+
+### 📨 이벤트 종류
+- **session**: 세션 ID (`{"session_id": "..."}`)
+- **interview_question**: 검증된 면접 질문 1개
+- **learning_step**: 검증된 학습 단계 1개
+- **complete**: 최종 코칭 결과 전체 (`CoachingResult` 형식)
+- **error**: 생성 실패 (`{"detail": "..."}`)
+
+### ⚠️ 참고
+- 스트리밍 중 전달된 항목은 미리보기이며, **complete** 이벤트의 결과가 최종 결과입니다.
+- 후보 경쟁(품질 최적화)은 사용하지 않고 표준 모드로 생성합니다.
+    """,
+    response_class=StreamingResponse,
+    responses={
+        200: {"description": "이벤트 스트림", "content": {"text/event-stream": {}}},
+        422: {"description": "유효성 검사 실패", "model": ErrorResponse},
+    },
+)
+async def stream_coaching_session(
+    payload: ResumePayload,
+    bypass_cache: bool = Query(False, description="세션 결과 캐시를 사용하지 않고 새로 생성"),
+    coaching_service: CoachingService = Depends(get_coaching_service),
+) -> StreamingResponse:
+    """이력서 정보를 기반으로 코칭 세션을 스트리밍으로 생성합니다."""
+    logger.info(f"스트리밍 코칭 세션 요청 수신: {payload.career_summary[:50]}...")
+
+    deadline = Deadline.after(settings.request_timeout_seconds)
+    events = coaching_service.stream_coaching_session(
+        payload, use_cache=not bypass_cache, deadline=deadline
+    )
+    return StreamingResponse(
+        _format_sse(events),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.post(
+    "/coaching-sessions:batch",
+    summary="📦 코칭 세션 일괄 생성 (JSONL)",
+    description="""
+## 코칭 세션 일괄 생성
+
+여러 이력서를 한 번의 요청으로 처리합니다. 요청 본문은 JSONL(한 줄에 하나의 JSON 객체)이며,
+각 줄은 `ResumePayload` 형식입니다. 선택적으로 `id`(또는 `request_id`) 필드로 항목을 식별할 수 있습니다.
+
+### ⚙️ 처리 방식
+- **concurrency**: 동시에 처리할 이력서 수 (기본값은 서버 설정)
+- 결과는 **완료되는 순서대로** JSONL 스트림으로 반환됩니다.
+- 각 항목에는 처리를 시작한 시점부터 단일 세션 요청과 같은 제한 시간이 적용됩니다.
+- 형식 오류나 생성 실패는 해당 줄의 `error`로 기록되고 나머지 항목은 계속 처리됩니다.
+
+### 📄 결과 줄 형식
+```json
+{"index": 0, "id": "cohort-001", "status": "succeeded", "result": {...}, "error": null}
+```
+    """,
+    response_class=StreamingResponse,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/x-ndjson": {"schema": {"type": "string"}}},
+        }
+    },
+    responses={
+        200: {
+            "description": "항목별 결과 JSONL 스트림",
+            "content": {"application/x-ndjson": {}},
+        },
+    },
+)
+async def create_coaching_sessions_batch(
+    request: Request,
+    concurrency: Optional[int] = Query(
+        None,
+        ge=1,
+        le=settings.batch_max_concurrency,
+        description="동시 처리 수 (기본값: 서버 설정)",
+    ),
+    enable_quality_optimization: bool = Query(True, description="품질 최적화 모드 사용 여부"),
+    coaching_service: CoachingService = Depends(get_coaching_service),
+) -> StreamingResponse:
+    """JSONL 이력서 목록을 일괄 처리하고 결과를 JSONL로 스트리밍합니다."""
+    body = (await request.body()).decode("utf-8")
+    items = list(parse_jsonl(body.splitlines()))
+    logger.info(f"일괄 코칭 요청 수신: {len(items)}개 항목")
+
+    async def runner(payload: ResumePayload) -> CoachingResult:
+        # 항목마다 처리를 시작한 시점부터 단일 세션 요청과 같은 데드라인을 적용
+        return await coaching_service.create_coaching_session(
+            payload,
+            enable_quality_optimization=enable_quality_optimization,
+            deadline=Deadline.after(settings.request_timeout_seconds),
+        )
+
+    async def lines() -> AsyncIterator[str]:
+        async for record in run_batch(
+            items, runner, concurrency or settings.batch_concurrency
+        ):
+            yield json.dumps(record, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
 @router.get(
     "/health",
     summary="🏥 서비스 상태 확인",
     description="""
 ## 서비스 헬스 체크
 
-코칭 서비스와 LLM API 연동 상태를 실시간으로 확인합니다.
+코칭 서비스와 LLM API 연동 상태를 확인합니다.
+LLM 가용성은 최근 실제 호출의 성공/실패율과 백그라운드 프로브의 캐시된 결과로 판단하므로,
+이 엔드포인트 호출 자체는 LLM API를 호출하지 않습니다 (과금 없음).
 
 ### 📋 체크 항목
 - **코칭 서비스 상태**: 내부 서비스 로직 정상 동작 여부
-- **LLM API 연결**: OpenAI API 연결 및 응답 상태
-- **시스템 리소스**: 메모리, CPU 사용량 등
+- **LLM API 연결**: 최근 호출 오류율 및 주기적 프로브 결과
 
 ### ✅ 정상 응답
 ```json
@@ -150,6 +289,7 @@ async def health_check(
             return {
                 "status": "healthy",
                 "llm_service": "available",
+                "circuit_breaker": coaching_service.get_circuit_breaker_state(),
                 "message": "All services are operational",
             }
         else:
@@ -164,3 +304,62 @@ async def health_check(
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"서비스 상태 확인 실패: {str(e)}",
         )
+
+
+@router.get(
+    "/health/live",
+    summary="💓 라이브니스 체크",
+    description="프로세스가 요청을 받을 수 있는지만 확인합니다. 외부 의존성은 확인하지 않습니다.",
+)
+async def liveness_check():
+    """라이브니스 체크 엔드포인트"""
+    return {"status": "alive"}
+
+
+@router.get(
+    "/health/ready",
+    summary="🚦 레디니스 체크",
+    description="""
+## 레디니스 체크
+
+LLM 가용성을 캐시된 상태(최근 실제 호출 오류율, 백그라운드 프로브 결과)로 판단합니다.
+LLM API를 직접 호출하지 않으므로 로드 밸런서가 자주 호출해도 비용이 발생하지 않습니다.
+준비되지 않은 경우 503을 반환합니다.
+    """,
+)
+async def readiness_check(
+    coaching_service: CoachingService = Depends(get_coaching_service),
+):
+    """레디니스 체크 엔드포인트"""
+    readiness = coaching_service.get_readiness()
+
+    if not readiness["ready"]:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="LLM 서비스 사용 불가",
+        )
+
+    return {"status": "ready", **readiness}
+
+
+@router.get(
+    "/metrics",
+    summary="📈 서비스 운영 지표",
+    description="""
+## 서비스 운영 지표
+
+LLM 요청 승인 계층(동시성 제한, 요청률/토큰률 버킷)의 상태와 대기 시간 지표를 반환합니다.
+
+### 📋 주요 지표
+- **active / waiting**: 실행 중 / 대기 중인 LLM 요청 수
+- **queue_wait_avg_seconds / p95 / max**: 승인 대기 시간
+- **startup.warmup_seconds**: 서비스 시작 시 단계별 워밍업 시간
+    """,
+)
+async def get_metrics(
+    coaching_service: CoachingService = Depends(get_coaching_service),
+):
+    """서비스 운영 지표 엔드포인트"""
+    metrics = coaching_service.get_metrics()
+    metrics["startup"] = get_service_container().get_metrics()
+    return metrics
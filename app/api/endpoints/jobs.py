@@ -0,0 +1,77 @@
+import logging
+from datetime import datetime, timezone
+from fastapi import APIRouter, HTTPException, status, Depends
+from app.schemas.coaching import ResumePayload, CoachingJobStatus, ErrorResponse
+from app.services.job_queue import get_job_queue, CoachingJob, CoachingJobQueue
+
+logger = logging.getLogger(__name__)
+router = APIRouter()
+
+
+def _to_status(job: CoachingJob) -> CoachingJobStatus:
+    """작업 상태를 응답 모델로 변환"""
+    return CoachingJobStatus(
+        job_id=job.job_id,
+        status=job.status,
+        created_at=datetime.fromtimestamp(job.created_at, tz=timezone.utc),
+        updated_at=datetime.fromtimestamp(job.updated_at, tz=timezone.utc),
+        result=job.result,
+        error=job.error,
+    )
+
+
+@router.post(
+    "/coaching-jobs",
+    response_model=CoachingJobStatus,
+    status_code=status.HTTP_202_ACCEPTED,
+    summary="📥 코칭 세션 비동기 작업 등록",
+    description="""
+## 코칭 세션 비동기 작업 등록
+
+품질 최적화 세션은 생성에 오래 걸릴 수 있어 HTTP 연결과 프록시 타임아웃을 점유합니다.
+이 엔드포인트는 작업을 큐에 등록하고 작업 ID를 즉시 반환하며,
+백그라운드 워커가 제한된 동시성으로 코칭 세션을 생성합니다.
+
+### 🔄 사용 흐름
+1. `POST /api/v1/coaching-jobs`로 이력서 정보 전송 → `job_id` 수신
+2. `GET /api/v1/coaching-jobs/{job_id}`로 상태 조회
+3. `status`가 `succeeded`이면 `result`에 코칭 결과 포함
+
+영구 저장소(SQLite)를 설정하면 서버 재시작 후에도 미완료 작업이 다시 실행됩니다.
+    """,
+    responses={
+        202: {"description": "작업이 등록됨", "model": CoachingJobStatus},
+        422: {"description": "유효성 검사 실패", "model": ErrorResponse},
+    },
+)
+async def create_coaching_job(
+    payload: ResumePayload,
+    job_queue: CoachingJobQueue = Depends(get_job_queue),
+) -> CoachingJobStatus:
+    """이력서 정보를 코칭 작업으로 등록하고 작업 ID를 반환합니다."""
+    job = await job_queue.submit(payload)
+    return _to_status(job)
+
+
+@router.get(
+    "/coaching-jobs/{job_id}",
+    response_model=CoachingJobStatus,
+    summary="🔎 코칭 작업 상태 조회",
+    description="작업 상태(queued, running, succeeded, failed)와 완료된 코칭 결과를 반환합니다.",
+    responses={
+        200: {"description": "작업 상태", "model": CoachingJobStatus},
+        404: {"description": "작업을 찾을 수 없음", "model": ErrorResponse},
+    },
+)
+async def get_coaching_job(
+    job_id: str,
+    job_queue: CoachingJobQueue = Depends(get_job_queue),
+) -> CoachingJobStatus:
+    """코칭 작업 상태 조회 엔드포인트"""
+    job = await job_queue.get(job_id)
+    if job is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"코칭 작업을 찾을 수 없습니다: {job_id}",
+        )
+    return _to_status(job)
@@ -0,0 +1,150 @@
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from typing import List, Optional, TextIO
+
+from app.core.config import settings
+from app.schemas.coaching import CoachingResult, ResumePayload
+from app.services.batch_backend import (
+    BatchBackendError,
+    LocalBatchService,
+    OpenAIBatchService,
+)
+from app.services.batch_runner import parse_jsonl, run_batch
+from app.services.coaching_service import (
+    create_coaching_sessions_offline,
+    get_coaching_service,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def run_batch_file(
+    source: TextIO,
+    output: TextIO,
+    concurrency: int,
+    enable_quality_optimization: bool = True,
+) -> dict:
+    """JSONL 이력서 파일을 일괄 처리하고 결과를 완료 순서대로 JSONL로 기록"""
+    coaching_service = get_coaching_service()
+
+    async def runner(payload: ResumePayload) -> CoachingResult:
+        return await coaching_service.create_coaching_session(
+            payload, enable_quality_optimization=enable_quality_optimization
+        )
+
+    summary = {"succeeded": 0, "failed": 0}
+    async for record in run_batch(parse_jsonl(source), runner, concurrency):
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        output.flush()
+        summary[record["status"]] += 1
+    return summary
+
+
+async def run_offline_batch_file(source: TextIO, output: TextIO, batch_service) -> dict:
+    """
+    JSONL 이력서 파일을 Batch API로 일괄 처리하고 결과를 입력 순서대로 기록
+
+    배치 작업 자체가 실패하면 유효한 항목마다 실패 레코드를 기록합니다.
+    """
+    items = list(parse_jsonl(source))
+    valid = [item for item in items if item.payload is not None]
+    result_by_index = {}
+    try:
+        # 배치 서비스가 연 HTTP 연결은 이벤트 루프가 끝나기 전에 닫음
+        async with batch_service:
+            results = await create_coaching_sessions_offline(
+                [item.payload for item in valid], batch_service
+            )
+        result_by_index = {item.index: result for item, result in zip(valid, results)}
+    except BatchBackendError as e:
+        logger.error(f"배치 작업 실패: {str(e)}")
+        for item in valid:
+            item.error = str(e)
+
+    summary = {"succeeded": 0, "failed": 0}
+    for item in items:
+        result = result_by_index.get(item.index)
+        record = {
+            "index": item.index,
+            "id": item.item_id,
+            "status": "succeeded" if result is not None else "failed",
+            "result": result.model_dump(mode="json") if result is not None else None,
+            "error": item.error,
+        }
+        output.write(json.dumps(record, ensure_ascii=False) + "\n")
+        summary[record["status"]] += 1
+    return summary
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """CLI 진입점"""
+    parser = argparse.ArgumentParser(
+        prog="python -m app.cli", description="AI Career Coach 일괄 처리 도구"
+    )
+    subcommands = parser.add_subparsers(dest="command", required=True)
+
+    batch = subcommands.add_parser("batch", help="JSONL 이력서 파일 일괄 처리")
+    batch.add_argument("input", help="입력 JSONL 파일 ('-'이면 표준 입력)")
+    batch.add_argument("-o", "--output", default="-", help="결과 JSONL 파일 ('-'이면 표준 출력)")
+    batch.add_argument(
+        "-c",
+        "--concurrency",
+        type=int,
+        default=settings.batch_concurrency,
+        help="동시 처리 수",
+    )
+    batch.add_argument("--no-optimize", action="store_true", help="품질 최적화 모드 사용 안 함")
+
+    offline = subcommands.add_parser(
+        "offline", help="OpenAI Batch API로 JSONL 이력서 파일 일괄 처리 (비대화형, 저비용)"
+    )
+    offline.add_argument("input", help="입력 JSONL 파일 ('-'이면 표준 입력)")
+    offline.add_argument(
+        "-o", "--output", default="-", help="결과 JSONL 파일 ('-'이면 표준 출력)"
+    )
+    offline.add_argument(
+        "--local-dir",
+        help="OpenAI 대신 파일 기반 배치 대역 사용 (출력 파일이 생길 때까지 폴링)",
+    )
+
+    args = parser.parse_args(argv)
+    logging.basicConfig(level=logging.WARNING, stream=sys.stderr)
+
+    source = sys.stdin if args.input == "-" else open(args.input, encoding="utf-8")
+    output = (
+        sys.stdout if args.output == "-" else open(args.output, "w", encoding="utf-8")
+    )
+    try:
+        if args.command == "offline":
+            batch_service = (
+                LocalBatchService(args.local_dir)
+                if args.local_dir
+                else OpenAIBatchService()
+            )
+            job = run_offline_batch_file(source, output, batch_service)
+        else:
+            job = run_batch_file(
+                source,
+                output,
+                max(1, args.concurrency),
+                enable_quality_optimization=not args.no_optimize,
+            )
+        summary = asyncio.run(job)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+        if output is not sys.stdout:
+            output.close()
+
+    print(
+        f"완료: 성공 {summary['succeeded']}건, 실패 {summary['failed']}건",
+        file=sys.stderr,
+    )
+    return 0 if summary["failed"] == 0 else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -13,8 +13,89 @@ class Settings(BaseSettings):
     environment: str = "development"
     log_level: str = "INFO"
 
+    # LLM Provider Configuration (openai, mock)
+    llm_provider: str = "openai"
+
+    # Mock LLM Provider Configuration (부하 테스트용)
+    llm_mock_latency_seconds: float = 0.5
+    llm_mock_latency_spread: float = 0.0
+    llm_mock_latency_distribution: str = "fixed"
+    llm_mock_error_rate: float = 0.0
+    llm_mock_seed: Optional[int] = None
+
     # OpenAI Configuration
     openai_api_key: Optional[str] = None
+    openai_base_url: str = "https://api.openai.com/v1"
+
+    # Timeout Configuration
+    request_timeout_seconds: float = 60.0
+    llm_request_timeout_seconds: float = 30.0
+    llm_min_attempt_seconds: float = 2.0
+
+    # LLM Rate Limiting Configuration (0 이하이면 비활성화)
+    llm_max_concurrency: int = 32
+    llm_requests_per_minute: int = 3500
+    llm_tokens_per_minute: int = 160000
+
+    # Hedged Request Configuration
+    llm_hedging_enabled: bool = False
+    llm_hedging_percentile: float = 95.0
+    llm_hedging_max_ratio: float = 0.1
+    llm_hedging_min_samples: int = 20
+
+    # LLM Response Cache Configuration
+    llm_cache_enabled: bool = True
+    llm_cache_ttl_seconds: int = 86400
+    llm_cache_max_bytes: int = 32 * 1024 * 1024
+    llm_cache_sqlite_path: Optional[str] = None
+
+    # Quality Optimization Configuration
+    optimization_early_exit: bool = True
+    optimization_quality_threshold: float = 4.0
+    optimization_min_candidates: int = 1
+    optimization_deadline_seconds: float = 30.0
+
+    # CPU Executor Configuration (thread, process, none; 작업자 수 0이면 기본값)
+    cpu_executor: str = "thread"
+    cpu_executor_workers: int = 2
+
+    # Event Loop Monitor Configuration
+    loop_monitor_interval_seconds: float = 0.05
+
+    # Startup Warm-up Configuration
+    startup_warmup_enabled: bool = True
+    startup_probe_timeout_seconds: float = 5.0
+
+    # Session Result Cache Configuration
+    session_cache_enabled: bool = True
+    session_cache_ttl_seconds: int = 3600
+    session_cache_max_bytes: int = 16 * 1024 * 1024
+
+    # Coaching Job Queue Configuration
+    job_workers: int = 4
+    job_store_sqlite_path: Optional[str] = None
+
+    # Batch Processing Configuration
+    batch_concurrency: int = 8
+    batch_max_concurrency: int = 64
+
+    # OpenAI Batch API Configuration
+    batch_api_completion_window: str = "24h"
+    batch_api_poll_interval_seconds: float = 30.0
+    batch_api_timeout_seconds: float = 24 * 3600
+
+    # Health Check Configuration
+    health_probe_interval_seconds: float = 60.0
+    health_window_seconds: float = 300.0
+    health_error_rate_threshold: float = 0.5
+    health_min_samples: int = 5
+
+    # Circuit Breaker Configuration
+    circuit_breaker_failure_rate: float = 0.5
+    circuit_breaker_window_size: int = 20
+    circuit_breaker_min_calls: int = 5
+    circuit_breaker_open_seconds: float = 30.0
+    circuit_breaker_half_open_max_calls: int = 2
 
     # Application Configuration
     app_name: str = "AI Career Coach API"
@@ -0,0 +1,36 @@
+import time
+from contextvars import ContextVar
+from typing import Optional
+
+
+class Deadline:
+    """요청 단위 종료 시각 (monotonic 기준)"""
+
+    def __init__(self, expires_at: float, clock=time.monotonic):
+        self.expires_at = expires_at
+        self._clock = clock
+
+    @classmethod
+    def after(cls, seconds: float, clock=time.monotonic) -> "Deadline":
+        """현재 시각으로부터 seconds 뒤에 만료되는 데드라인 생성"""
+        return cls(clock() + seconds, clock)
+
+    def remaining(self) -> float:
+        """남은 시간 (초, 만료 시 0)"""
+        return max(0.0, self.expires_at - self._clock())
+
+    @property
+    def expired(self) -> bool:
+        """만료 여부"""
+        return self.remaining() <= 0
+
+    def timeout(self, cap: Optional[float] = None) -> float:
+        """cap과 남은 시간 중 작은 값"""
+        remaining = self.remaining()
+        return remaining if cap is None else min(cap, remaining)
+
+
+# 현재 요청의 데드라인 (서비스 계층에서 설정하고 LLM 클라이언트에서 참조)
+current_deadline: ContextVar[Optional[Deadline]] = ContextVar(
+    "request_deadline", default=None
+)
@@ -0,0 +1,124 @@
+import asyncio
+import functools
+import time
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from app.core.config import settings
+
+EXECUTOR_KINDS = ("thread", "process", "none")
+
+
+def _timed_call(func: Callable[..., Any], args: Tuple[Any, ...]) -> Tuple[Any, float]:
+    """작업자에서 함수를 실행하고 (결과, 실행 시간) 반환 (프로세스 풀 전달을 위해 모듈 수준)"""
+    started_at = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - started_at
+
+
+class CPUExecutor:
+    """
+    파싱/검증/품질 평가 같은 CPU 작업을 이벤트 루프 밖의 작업자 풀에서 실행하는 실행기
+
+    kind는 thread(스레드 풀), process(프로세스 풀), none(이벤트 루프에서 직접 실행) 중 하나입니다.
+    프로세스 풀에 넘기는 함수와 인자는 pickle 가능해야 하므로 모듈 수준 함수를 사용합니다.
+    """
+
+    def __init__(self, kind: str = "thread", max_workers: Optional[int] = None):
+        if kind not in EXECUTOR_KINDS:
+            raise ValueError(f"지원하지 않는 실행기 종류: {kind}")
+        self.kind = kind
+        self.max_workers = max_workers
+        self._executor: Optional[Executor] = None
+
+        # 지표
+        self.tasks = 0
+        self.items = 0
+        self.failures = 0
+        self.run_seconds_total = 0.0
+        self.run_seconds_max = 0.0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _get_executor(self) -> Executor:
+        if self._executor is None:
+            if self.kind == "process":
+                self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix="cpu-executor"
+                )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any, items: int = 1) -> Any:
+        """
+        함수를 작업자 풀에서 실행하고 결과 반환
+
+        Args:
+            func: 실행할 함수 (process 종류는 pickle 가능한 모듈 수준 함수)
+            *args: 함수 인자
+            items: 이 작업에 묶인 작업 항목 수 (지표용)
+        """
+        started_at = time.perf_counter()
+        try:
+            if self.kind == "none":
+                result, run_seconds = _timed_call(func, args)
+            else:
+                loop = asyncio.get_running_loop()
+                result, run_seconds = await loop.run_in_executor(
+                    self._get_executor(), functools.partial(_timed_call, func, args)
+                )
+        except Exception:
+            self.failures += 1
+            raise
+
+        # 작업자 대기 시간 = 전체 소요 시간 - 실행 시간
+        wait_seconds = max(0.0, time.perf_counter() - started_at - run_seconds)
+        self.tasks += 1
+        self.items += items
+        self.run_seconds_total += run_seconds
+        self.run_seconds_max = max(self.run_seconds_max, run_seconds)
+        self.wait_seconds_total += wait_seconds
+        self.wait_seconds_max = max(self.wait_seconds_max, wait_seconds)
+        return result
+
+    def shutdown(self, wait: bool = True) -> None:
+        """작업자 풀 종료 (다음 실행 시 다시 생성)"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """실행 작업 수와 실행/대기 시간 지표"""
+        return {
+            "kind": self.kind,
+            "max_workers": self.max_workers,
+            "tasks": self.tasks,
+            "items": self.items,
+            "failures": self.failures,
+            "run_avg_seconds": (
+                self.run_seconds_total / self.tasks if self.tasks else 0.0
+            ),
+            "run_max_seconds": self.run_seconds_max,
+            "wait_avg_seconds": (
+                self.wait_seconds_total / self.tasks if self.tasks else 0.0
+            ),
+            "wait_max_seconds": self.wait_seconds_max,
+        }
+
+
+# 전역 CPU 실행기 인스턴스
+_cpu_executor: Optional[CPUExecutor] = None
+
+
+def get_cpu_executor() -> CPUExecutor:
+    """CPU 실행기 싱글톤 인스턴스 반환"""
+    global _cpu_executor
+
+    if _cpu_executor is None:
+        _cpu_executor = CPUExecutor(
+            kind=settings.cpu_executor,
+            max_workers=settings.cpu_executor_workers or None,
+        )
+
+    return _cpu_executor
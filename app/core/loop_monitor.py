@@ -0,0 +1,78 @@
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+from app.core.config import settings
+
+
+class EventLoopLagMonitor:
+    """주기적으로 잠들었다 깨어나는 시간의 지연으로 이벤트 루프 차단 정도를 측정"""
+
+    def __init__(self, interval_seconds: float = 0.05, window_size: int = 1200):
+        self.interval_seconds = interval_seconds
+        self._samples: Deque[float] = deque(maxlen=window_size)
+        self._task: Optional[asyncio.Task] = None
+        self.max_lag_seconds = 0.0
+
+    @property
+    def running(self) -> bool:
+        """측정 중 여부"""
+        return self._task is not None and not self._task.done()
+
+    def start(self) -> None:
+        """백그라운드 측정 시작"""
+        if not self.running:
+            self._task = asyncio.ensure_future(self._run())
+
+    async def stop(self) -> None:
+        """백그라운드 측정 중지"""
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def reset(self) -> None:
+        """측정값 초기화"""
+        self._samples.clear()
+        self.max_lag_seconds = 0.0
+
+    def record(self, lag_seconds: float) -> None:
+        """지연 시간 1회 기록"""
+        self._samples.append(lag_seconds)
+        self.max_lag_seconds = max(self.max_lag_seconds, lag_seconds)
+
+    async def _run(self) -> None:
+        while True:
+            started_at = time.perf_counter()
+            await asyncio.sleep(self.interval_seconds)
+            self.record(
+                max(0.0, time.perf_counter() - started_at - self.interval_seconds)
+            )
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """최근 윈도우의 평균/p99/최대 지연 시간"""
+        recent = sorted(self._samples)
+        p99 = recent[min(len(recent) - 1, int(len(recent) * 0.99))] if recent else 0.0
+        return {
+            "samples": len(recent),
+            "lag_avg_seconds": sum(recent) / len(recent) if recent else 0.0,
+            "lag_p99_seconds": p99,
+            "lag_max_seconds": self.max_lag_seconds,
+        }
+
+
+# 전역 이벤트 루프 지연 측정기 인스턴스
+_loop_monitor: Optional[EventLoopLagMonitor] = None
+
+
+def get_loop_monitor() -> EventLoopLagMonitor:
+    """이벤트 루프 지연 측정기 싱글톤 인스턴스 반환"""
+    global _loop_monitor
+
+    if _loop_monitor is None:
+        _loop_monitor = EventLoopLagMonitor(
+            interval_seconds=settings.loop_monitor_interval_seconds
+        )
+
+    return _loop_monitor
@@ -1,7 +1,24 @@
+import logging
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from app.core.config import settings
-from app.api.endpoints import coaching
+from app.api.endpoints import coaching, jobs
+from app.services.container import get_service_container
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """시작 시 서비스 생성/워밍업과 백그라운드 작업 시작, 종료 시 정리"""
+    container = get_service_container()
+    await container.start()
+    try:
+        yield
+    finally:
+        await container.stop()
+
 
 # FastAPI 앱 인스턴스 생성
 app = FastAPI(
@@ -43,6 +60,7 @@ app = FastAPI(
         "name": "MIT License",
         "url": "https://opensource.org/licenses/MIT",
     },
+    lifespan=lifespan,
 )
 
 # CORS 미들웨어 설정
@@ -56,6 +74,7 @@ app.add_middleware(
 
 # 라우터 등록
 app.include_router(coaching.router, prefix="/api/v1", tags=["coaching"])
+app.include_router(jobs.router, prefix="/api/v1", tags=["jobs"])
 
 
 @app.get("/")
@@ -1,4 +1,5 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 from pydantic import BaseModel, Field
 from uuid import UUID, uuid4
 
@@ -106,6 +107,23 @@ class CoachingResult(BaseModel):
         }
 
 
+class CoachingJobStatus(BaseModel):
+    """Response model for asynchronous coaching job."""
+
+    job_id: str = Field(..., description="작업 식별자")
+    status: str = Field(
+        ..., description="작업 상태 (queued, running, succeeded, failed)"
+    )
+    created_at: datetime = Field(..., description="작업 등록 시각")
+    updated_at: datetime = Field(..., description="마지막 상태 변경 시각")
+    result: Optional[CoachingResult] = Field(
+        None, description="완료된 코칭 결과 (succeeded 상태에서만 포함)"
+    )
+    error: Optional[str] = Field(
+        None, description="실패 사유 (failed 상태에서만 포함)"
+    )
+
+
 class ErrorResponse(BaseModel):
     """Error response model."""
 
@@ -0,0 +1,255 @@
+import asyncio
+import json
+import logging
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+from uuid import uuid4
+
+import httpx
+
+from app.core.config import settings
+from app.services.llm_client import LLMClientError, build_json_prompt
+
+logger = logging.getLogger(__name__)
+
+BATCH_ENDPOINT = "/v1/chat/completions"
+
+# 배치 상태 (OpenAI Batch API와 동일한 값)
+COMPLETED = "completed"
+TERMINAL_FAILURE_STATUSES = ("failed", "expired", "cancelled")
+
+
+class BatchBackendError(LLMClientError):
+    """배치 제출, 조회, 결과 처리 관련 오류"""
+
+    pass
+
+
+def build_batch_request(
+    custom_id: str,
+    prompt: str,
+    model: str = "gpt-3.5-turbo-1106",
+    temperature: float = 0.7,
+    max_tokens: Optional[int] = None,
+) -> Dict[str, Any]:
+    """generate_json_completion과 같은 요청 본문의 Batch API 입력 줄 생성"""
+    body: Dict[str, Any] = {
+        "model": model,
+        "messages": [{"role": "user", "content": build_json_prompt(prompt)}],
+        "temperature": temperature,
+        "response_format": {"type": "json_object"},
+    }
+    if max_tokens:
+        body["max_tokens"] = max_tokens
+
+    return {
+        "custom_id": custom_id,
+        "method": "POST",
+        "url": BATCH_ENDPOINT,
+        "body": body,
+    }
+
+
+def parse_batch_output(output: str) -> Dict[str, Optional[str]]:
+    """Batch API 출력 JSONL을 custom_id별 응답 내용으로 변환 (실패한 요청은 None)"""
+    contents: Dict[str, Optional[str]] = {}
+    for line in output.splitlines():
+        if not line.strip():
+            continue
+        record = json.loads(line)
+        response = record.get("response") or {}
+        content = None
+        if not record.get("error") and response.get("status_code") == 200:
+            try:
+                content = response["body"]["choices"][0]["message"]["content"]
+            except (KeyError, IndexError, TypeError):
+                content = None
+        if content is None:
+            logger.warning(
+                f"배치 요청 실패 ({record.get('custom_id')}): {record.get('error')}"
+            )
+        contents[record["custom_id"]] = content
+    return contents
+
+
+class BatchService(ABC):
+    """배치 작업 제출/조회 인터페이스"""
+
+    @abstractmethod
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        """입력 줄을 제출하고 배치 ID 반환"""
+
+    @abstractmethod
+    async def get_status(self, batch_id: str) -> str:
+        """배치 상태 조회"""
+
+    @abstractmethod
+    async def get_output(self, batch_id: str) -> str:
+        """완료된 배치의 출력 JSONL 조회"""
+
+    async def run(
+        self,
+        requests: List[Dict[str, Any]],
+        poll_interval_seconds: float,
+        timeout_seconds: float,
+    ) -> Dict[str, Optional[str]]:
+        """제출 후 완료될 때까지 폴링하고 custom_id별 응답 내용 반환"""
+        batch_id = await self.submit(requests)
+        logger.info(f"배치 제출 완료: {batch_id} ({len(requests)}개 요청)")
+
+        started_at = time.monotonic()
+        while True:
+            status = await self.get_status(batch_id)
+            if status == COMPLETED:
+                break
+            if status in TERMINAL_FAILURE_STATUSES:
+                raise BatchBackendError(f"배치 처리 실패 ({batch_id}): {status}")
+            if time.monotonic() - started_at >= timeout_seconds:
+                raise BatchBackendError(f"배치 처리 시간 초과 ({batch_id}): {status}")
+            await asyncio.sleep(poll_interval_seconds)
+
+        return parse_batch_output(await self.get_output(batch_id))
+
+    async def aclose(self) -> None:
+        """연결 등 서비스가 직접 만든 리소스 정리 (기본 구현은 정리할 리소스 없음)"""
+
+    async def __aenter__(self) -> "BatchService":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
+
+class OpenAIBatchService(BatchService):
+    """OpenAI Batch API 클라이언트 (설치된 openai SDK에 batches가 없어 HTTP로 직접 호출)"""
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        base_url: Optional[str] = None,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
+        api_key = api_key or settings.openai_api_key
+        if not api_key:
+            raise LLMClientError("OpenAI API key가 설정되지 않았습니다.")
+
+        # 주입받은 클라이언트는 호출자가 닫고, 직접 만든 클라이언트만 aclose에서 닫음
+        self._owns_client = http_client is None
+        self.http_client = http_client or httpx.AsyncClient(
+            base_url=base_url or settings.openai_base_url,
+            timeout=settings.llm_request_timeout_seconds,
+        )
+        self.http_client.headers["Authorization"] = f"Bearer {api_key}"
+        self._output_file_ids: Dict[str, str] = {}
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self.http_client.aclose()
+
+    async def _request(self, method: str, url: str, **kwargs) -> httpx.Response:
+        response = await self.http_client.request(method, url, **kwargs)
+        if response.status_code >= 400:
+            raise BatchBackendError(
+                f"Batch API 오류 ({response.status_code}): {response.text}"
+            )
+        return response
+
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        content = "\n".join(json.dumps(r, ensure_ascii=False) for r in requests)
+        upload = await self._request(
+            "POST",
+            "/files",
+            data={"purpose": "batch"},
+            files={
+                "file": ("batch.jsonl", content.encode("utf-8"), "application/jsonl")
+            },
+        )
+        batch = await self._request(
+            "POST",
+            "/batches",
+            json={
+                "input_file_id": upload.json()["id"],
+                "endpoint": BATCH_ENDPOINT,
+                "completion_window": settings.batch_api_completion_window,
+            },
+        )
+        return batch.json()["id"]
+
+    async def get_status(self, batch_id: str) -> str:
+        batch = (await self._request("GET", f"/batches/{batch_id}")).json()
+        if batch.get("output_file_id"):
+            self._output_file_ids[batch_id] = batch["output_file_id"]
+        return batch["status"]
+
+    async def get_output(self, batch_id: str) -> str:
+        output_file_id = self._output_file_ids.get(batch_id)
+        if output_file_id is None:
+            await self.get_status(batch_id)
+            output_file_id = self._output_file_ids.get(batch_id)
+        if output_file_id is None:
+            raise BatchBackendError(f"배치 출력 파일이 없습니다: {batch_id}")
+        return (await self._request("GET", f"/files/{output_file_id}/content")).text
+
+
+class LocalBatchService(BatchService):
+    """
+    파일 기반 배치 서비스 대역 (로컬 개발/테스트용)
+
+    제출 시 <batch_id>.input.jsonl을 기록하고, <batch_id>.output.jsonl이 생기면 완료로 봅니다.
+    responder가 있으면 상태 조회 시 입력 본문마다 responder를 호출해 Batch API와 같은 형식의
+    출력 파일을 직접 생성합니다.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        responder: Optional[Callable[[Dict[str, Any]], str]] = None,
+    ):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.responder = responder
+
+    def input_path(self, batch_id: str) -> Path:
+        """배치 입력 파일 경로"""
+        return self.directory / f"{batch_id}.input.jsonl"
+
+    def output_path(self, batch_id: str) -> Path:
+        """배치 출력 파일 경로"""
+        return self.directory / f"{batch_id}.output.jsonl"
+
+    async def submit(self, requests: List[Dict[str, Any]]) -> str:
+        batch_id = f"batch_{uuid4().hex}"
+        content = "\n".join(json.dumps(r, ensure_ascii=False) for r in requests)
+        self.input_path(batch_id).write_text(content + "\n", encoding="utf-8")
+        return batch_id
+
+    async def get_status(self, batch_id: str) -> str:
+        if not self.input_path(batch_id).exists():
+            return "failed"
+        if not self.output_path(batch_id).exists() and self.responder is not None:
+            self._process(batch_id)
+        return COMPLETED if self.output_path(batch_id).exists() else "in_progress"
+
+    async def get_output(self, batch_id: str) -> str:
+        return self.output_path(batch_id).read_text(encoding="utf-8")
+
+    def _process(self, batch_id: str) -> None:
+        lines = []
+        for line in self.input_path(batch_id).read_text(encoding="utf-8").splitlines():
+            if not line.strip():
+                continue
+            request = json.loads(line)
+            record: Dict[str, Any] = {"custom_id": request["custom_id"], "error": None}
+            try:
+                content = self.responder(request["body"])
+                record["response"] = {
+                    "status_code": 200,
+                    "body": {"choices": [{"message": {"content": content}}]},
+                }
+            except Exception as e:
+                record["response"] = None
+                record["error"] = {"message": str(e)}
+            lines.append(json.dumps(record, ensure_ascii=False))
+        self.output_path(batch_id).write_text("\n".join(lines) + "\n", encoding="utf-8")
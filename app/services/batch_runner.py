@@ -0,0 +1,118 @@
+import asyncio
+import json
+import logging
+from dataclasses import dataclass
+from typing import (
+    Any,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+from pydantic import ValidationError
+
+from app.schemas.coaching import CoachingResult, ResumePayload
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BatchItem:
+    """JSONL 한 줄에 해당하는 배치 항목"""
+
+    index: int
+    item_id: str
+    payload: Optional[ResumePayload] = None
+    error: Optional[str] = None
+
+
+def parse_jsonl(lines: Iterable[str]) -> Iterator[BatchItem]:
+    """
+    JSONL 줄을 배치 항목으로 변환 (빈 줄은 건너뜀)
+
+    각 줄은 ResumePayload 필드를 가진 JSON 객체이며, 선택적으로 id 또는 request_id로
+    항목 식별자를 지정할 수 있습니다. 형식 오류는 해당 항목의 오류로 기록합니다.
+    """
+    index = 0
+    for line in lines:
+        line = line.strip()
+        if not line:
+            continue
+
+        item = BatchItem(index=index, item_id=str(index))
+        index += 1
+        try:
+            data = json.loads(line)
+            if not isinstance(data, dict):
+                raise ValueError("각 줄은 JSON 객체여야 합니다")
+            item.item_id = str(data.get("id", data.get("request_id", item.item_id)))
+            item.payload = ResumePayload(**data)
+        except ValidationError as e:
+            item.error = f"유효성 검사 실패: {e.errors()}"
+        except ValueError as e:
+            item.error = f"JSON 형식 오류: {str(e)}"
+        yield item
+
+
+def _to_record(
+    item: BatchItem, result: Optional[CoachingResult], error: Optional[str]
+) -> Dict[str, Any]:
+    return {
+        "index": item.index,
+        "id": item.item_id,
+        "status": "failed" if error else "succeeded",
+        "result": result.model_dump(mode="json") if result is not None else None,
+        "error": error,
+    }
+
+
+async def run_batch(
+    items: Iterable[BatchItem],
+    runner: Callable[[ResumePayload], Awaitable[CoachingResult]],
+    concurrency: int,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    동시 실행 창(concurrency) 안에서 배치 항목을 처리하고 완료 순서대로 결과 전달
+
+    항목별 오류는 해당 결과 레코드에 기록하고 나머지 항목은 계속 처리합니다.
+    """
+
+    async def run_item(item: BatchItem) -> Dict[str, Any]:
+        try:
+            return _to_record(item, await runner(item.payload), None)
+        except Exception as e:
+            logger.warning(f"배치 항목 처리 실패 ({item.item_id}): {str(e)}")
+            return _to_record(item, None, str(e))
+
+    pending = set()
+    try:
+        for item in items:
+            if item.error is not None:
+                yield _to_record(item, None, item.error)
+                continue
+
+            # 실행 창이 가득 차면 하나가 끝날 때까지 대기
+            while len(pending) >= concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+
+            pending.add(asyncio.ensure_future(run_item(item)))
+
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        # 소비자가 중단하면 남은 항목도 취소
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,212 @@
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from app.schemas.coaching import (
+    CoachingResult,
+    InterviewQuestion,
+    LearningPath,
+    ResumePayload,
+)
+from app.services.prompt_builder import PromptBuilder
+from app.services.quality_evaluator import (
+    QualityEvaluator,
+    QualityScore,
+    get_quality_evaluator,
+)
+from app.services.result_parser import (
+    fallback_interview_questions,
+    fallback_learning_path,
+    parse_interview_questions,
+    parse_learning_path,
+)
+from app.services.resume_features import ResumeFeatures, extract_resume_features
+
+logger = logging.getLogger(__name__)
+
+# 후보 생성에 사용하는 LLM 호출 파라미터
+INTERVIEW_QUESTIONS_MAX_TOKENS = 2000
+LEARNING_PATH_MAX_TOKENS = 1500
+
+
+@dataclass(frozen=True)
+class CandidateSpec:
+    """단일 후보 세션을 구성하는 프롬프트 조합"""
+
+    persona: str
+    strategy: str
+    interview_prompt: str
+    learning_path_prompt: str
+
+
+@dataclass(frozen=True)
+class CandidateResponses:
+    """후보 세션의 LLM 응답 (호출할 수 없었던 응답은 None으로 두고 대체 콘텐츠 사용)"""
+
+    interview_response: Optional[str]
+    learning_path_response: Optional[str]
+
+
+@dataclass
+class CandidatePlan:
+    """후보 세션 생성 계획 (중복 프롬프트 제거 포함)"""
+
+    specs: List[CandidateSpec] = field(default_factory=list)
+
+    @property
+    def unique_prompts(self) -> Dict[str, int]:
+        """고유 프롬프트와 해당 프롬프트의 최대 토큰 수"""
+        prompts: Dict[str, int] = {}
+        for spec in self.specs:
+            prompts.setdefault(spec.interview_prompt, INTERVIEW_QUESTIONS_MAX_TOKENS)
+            prompts.setdefault(spec.learning_path_prompt, LEARNING_PATH_MAX_TOKENS)
+        return prompts
+
+    @property
+    def total_requests(self) -> int:
+        """중복 제거 전 LLM 호출 수"""
+        return len(self.specs) * 2
+
+    @property
+    def unique_requests(self) -> int:
+        """중복 제거 후 실제 LLM 호출 수"""
+        return len(self.unique_prompts)
+
+
+class CandidatePlanner:
+    """전략 × 페르소나 조합의 프롬프트를 미리 구성하는 플래너"""
+
+    def __init__(self, prompt_builder: PromptBuilder):
+        self.prompt_builder = prompt_builder
+
+    def plan(
+        self,
+        resume_data: ResumePayload,
+        strategies: List[str],
+        personas: List[str],
+        features: Optional[ResumeFeatures] = None,
+    ) -> CandidatePlan:
+        """후보별 프롬프트를 구성하고 동일 프롬프트는 한 번만 생성"""
+        features = features or extract_resume_features(resume_data)
+
+        # 학습 경로 프롬프트는 페르소나에만 의존하므로 페르소나별로 한 번만 구성
+        learning_path_prompts = {
+            persona: self.prompt_builder.build_learning_path_prompt(
+                resume_data, persona, features
+            )
+            for persona in personas
+        }
+
+        plan = CandidatePlan()
+        for strategy in strategies:
+            for persona in personas:
+                plan.specs.append(
+                    CandidateSpec(
+                        persona=persona,
+                        strategy=strategy,
+                        interview_prompt=self.prompt_builder.build_interview_questions_prompt(
+                            resume_data, persona, strategy, features
+                        ),
+                        learning_path_prompt=learning_path_prompts[persona],
+                    )
+                )
+
+        logger.info(
+            f"후보 계획 수립: 후보 {len(plan.specs)}개, "
+            f"LLM 호출 {plan.total_requests}회 → {plan.unique_requests}회"
+        )
+        return plan
+
+
+class SharedCompletionPool:
+    """세션 내 동일 프롬프트의 LLM 요청을 한 번만 실행하고 결과를 공유"""
+
+    def __init__(self, llm_client, use_cache: bool = True):
+        self.llm_client = llm_client
+        self.use_cache = use_cache
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    def request(
+        self,
+        prompt: str,
+        max_tokens: int,
+        cache_validator: Optional[Callable[[str], bool]] = None,
+    ) -> asyncio.Task:
+        """프롬프트에 대한 공유 LLM 요청 태스크 반환 (최초 요청 시 생성)"""
+        task = self._tasks.get(prompt)
+        if task is None:
+            task = asyncio.ensure_future(
+                self.llm_client.generate_json_completion(
+                    prompt=prompt,
+                    model="gpt-3.5-turbo-1106",
+                    temperature=0.7,
+                    max_tokens=max_tokens,
+                    cache_validator=cache_validator,
+                    use_cache=self.use_cache,
+                )
+            )
+            self._tasks[prompt] = task
+        return task
+
+    @property
+    def issued_requests(self) -> int:
+        """실제로 발행된 LLM 요청 수"""
+        return len(self._tasks)
+
+    def cancel_pending(self) -> None:
+        """아직 완료되지 않은 요청 취소"""
+        for task in self._tasks.values():
+            if not task.done():
+                task.cancel()
+            elif not task.cancelled():
+                # 대기자 없이 실패한 요청의 예외를 소비하여 경고 방지
+                task.exception()
+
+
+def score_candidate_responses(
+    responses: Sequence[CandidateResponses],
+    resume_data: ResumePayload,
+    features: Optional[ResumeFeatures] = None,
+    evaluator: Optional[QualityEvaluator] = None,
+) -> List[Tuple[CoachingResult, QualityScore]]:
+    """
+    후보 응답 일괄 처리 (JSON 파싱, 모델 검증, 품질 평가)
+
+    세션에서 함께 완료된 후보들을 CPU 실행기 작업 하나로 묶기 위한 모듈 수준 함수로,
+    페르소나별로 공유되는 학습 경로처럼 같은 응답은 한 번만 파싱합니다.
+    evaluator를 생략하면 작업자에서 품질 평가자를 가져옵니다 (프로세스 풀용).
+    """
+    evaluator = evaluator or get_quality_evaluator()
+    parsed_questions: Dict[Optional[str], List[InterviewQuestion]] = {}
+    parsed_paths: Dict[Optional[str], LearningPath] = {}
+
+    results = []
+    for candidate in responses:
+        questions_response = candidate.interview_response
+        if questions_response not in parsed_questions:
+            parsed_questions[questions_response] = (
+                parse_interview_questions(questions_response, resume_data)
+                if questions_response is not None
+                else fallback_interview_questions(resume_data)
+            )
+
+        path_response = candidate.learning_path_response
+        if path_response not in parsed_paths:
+            parsed_paths[path_response] = (
+                parse_learning_path(path_response, resume_data)
+                if path_response is not None
+                else fallback_learning_path(resume_data)
+            )
+
+        results.append(
+            CoachingResult(
+                session_id=uuid4(),
+                interview_questions=parsed_questions[questions_response],
+                learning_path=parsed_paths[path_response],
+            )
+        )
+
+    scores = evaluator.evaluate_candidates(results, resume_data, features).scores
+    return list(zip(results, scores))
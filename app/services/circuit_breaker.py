@@ -0,0 +1,147 @@
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Deque, Dict, Optional
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+@dataclass(frozen=True)
+class BreakerPermit:
+    """allow_request가 발급한 요청 허가 (발급 당시 상태 세대와 half-open 프로브 여부)"""
+
+    generation: int
+    probe: bool = False
+
+
+class CircuitBreaker:
+    """
+    실패율 기반 서킷 브레이커 (closed → open → half_open → closed)
+
+    상태가 바뀔 때마다 세대가 증가하며, 요청 결과는 허가를 받은 세대에만 반영합니다.
+    이전 상태에서 허가된 요청이 늦게 끝나도 현재 상태를 바꾸지 않고 stale_outcomes로만 집계하므로,
+    half-open에서 closed로의 전환은 half-open 프로브 결과로만 결정됩니다.
+    """
+
+    def __init__(
+        self,
+        failure_rate_threshold: float,
+        window_size: int,
+        min_calls: int,
+        open_seconds: float,
+        half_open_max_calls: int,
+        clock=time.monotonic,
+    ):
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_seconds = open_seconds
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+
+        self.state = CLOSED
+        self._outcomes: Deque[bool] = deque(maxlen=window_size)
+        self._opened_at = 0.0
+        self._generation = 0
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self.rejected = 0
+        self.stale_outcomes = 0
+
+    @property
+    def failure_rate(self) -> float:
+        """최근 윈도우의 실패율"""
+        if not self._outcomes:
+            return 0.0
+        return sum(1 for ok in self._outcomes if not ok) / len(self._outcomes)
+
+    def allow_request(self) -> Optional[BreakerPermit]:
+        """요청 허가 발급 (거부 시 None, 허가 시 반드시 결과를 기록하거나 반환해야 함)"""
+        if self.state == OPEN:
+            if self._clock() - self._opened_at < self.open_seconds:
+                self.rejected += 1
+                return None
+            # 대기 시간이 지나면 제한된 요청으로 복구 여부 확인
+            self._half_open()
+
+        if self.state == HALF_OPEN:
+            if self._half_open_in_flight >= self.half_open_max_calls:
+                self.rejected += 1
+                return None
+            self._half_open_in_flight += 1
+            return BreakerPermit(self._generation, probe=True)
+
+        return BreakerPermit(self._generation)
+
+    def record_success(self, permit: BreakerPermit) -> None:
+        """허가된 요청의 성공 기록"""
+        if not self._is_current(permit):
+            return
+
+        if permit.probe:
+            self._half_open_in_flight -= 1
+            self._half_open_successes += 1
+            if self._half_open_successes >= self.half_open_max_calls:
+                self._close()
+            return
+
+        self._outcomes.append(True)
+
+    def record_failure(self, permit: BreakerPermit) -> None:
+        """허가된 요청의 실패 기록"""
+        if not self._is_current(permit):
+            return
+
+        if permit.probe:
+            self._half_open_in_flight -= 1
+            self._open()
+            return
+
+        self._outcomes.append(False)
+        if (
+            len(self._outcomes) >= self.min_calls
+            and self.failure_rate >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def release(self, permit: BreakerPermit) -> None:
+        """결과 없이 끝난 요청(취소, 공급자 상태와 무관한 오류 등)의 허가 반환"""
+        if permit.probe and permit.generation == self._generation:
+            self._half_open_in_flight -= 1
+
+    def _is_current(self, permit: BreakerPermit) -> bool:
+        """허가가 현재 상태 세대에서 발급되었는지 확인 (이전 세대 결과는 집계만)"""
+        if permit.generation != self._generation:
+            self.stale_outcomes += 1
+            return False
+        return True
+
+    def _open(self) -> None:
+        self.state = OPEN
+        self._opened_at = self._clock()
+        self._generation += 1
+
+    def _half_open(self) -> None:
+        self.state = HALF_OPEN
+        self._half_open_in_flight = 0
+        self._half_open_successes = 0
+        self._generation += 1
+
+    def _close(self) -> None:
+        self.state = CLOSED
+        self._outcomes.clear()
+        self._generation += 1
+
+    def get_status(self) -> Dict[str, Any]:
+        """브레이커 상태 요약"""
+        return {
+            "state": self.state,
+            "failure_rate": self.failure_rate,
+            "window_samples": len(self._outcomes),
+            "rejected": self.rejected,
+            "stale_outcomes": self.stale_outcomes,
+            "open_for_seconds": (
+                self._clock() - self._opened_at if self.state == OPEN else 0.0
+            ),
+        }
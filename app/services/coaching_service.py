@@ -1,8 +1,14 @@
-import json
+import asyncio
 import logging
-from typing import List
+from typing import AsyncIterator, List, Optional, Tuple
 from uuid import uuid4
 
+from pydantic import ValidationError
+
+from app.core.config import settings
+from app.core.deadline import Deadline, current_deadline
+from app.core.executor import get_cpu_executor
+from app.core.loop_monitor import get_loop_monitor
 from app.schemas.coaching import (
     ResumePayload,
     CoachingResult,
@@ -10,7 +16,37 @@ from app.schemas.coaching import (
     LearningPath,
     LearningStep,
 )
-from app.services.llm_client import get_llm_client, LLMClientError
+from app.services.batch_backend import BatchService, build_batch_request
+from app.services.candidate_planner import (
+    CandidatePlanner,
+    CandidateResponses,
+    CandidateSpec,
+    SharedCompletionPool,
+    INTERVIEW_QUESTIONS_MAX_TOKENS,
+    LEARNING_PATH_MAX_TOKENS,
+    score_candidate_responses,
+)
+from app.services.circuit_breaker import OPEN
+from app.services.llm_client import (
+    get_llm_client,
+    LLMClientError,
+    CircuitOpenError,
+    DeadlineExceededError,
+)
+from app.services.rate_limiter import admission_key
+from app.services.result_parser import (
+    build_coaching_results,
+    fallback_interview_questions,
+    fallback_learning_path,
+    is_valid_interview_questions_response,
+    is_valid_learning_path_response,
+    parse_interview_questions,
+    parse_learning_path,
+)
+from app.services.resume_features import ResumeFeatures, extract_resume_features
+from app.services.session_cache import SessionResultCache, make_session_cache_key
+from app.services.single_flight import SingleFlight
+from app.services.stream_parser import JSONArrayStreamParser
 from app.services.prompt_builder import get_prompt_builder
 from app.services.quality_evaluator import get_quality_evaluator
 
@@ -23,6 +59,31 @@ class CoachingServiceError(Exception):
     pass
 
 
+async def _gather_or_cancel(*aws) -> list:
+    """여러 작업을 동시에 실행하고, 하나라도 실패하면 나머지 작업을 취소"""
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        done, pending = await asyncio.wait(
+            tasks, return_when=asyncio.FIRST_EXCEPTION
+        )
+    except asyncio.CancelledError:
+        # 호출자가 취소되면 하위 작업도 함께 정리
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+    for task in pending:
+        task.cancel()
+
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        failed = next(task for task in done if task.exception() is not None)
+        raise failed.exception()
+
+    return [task.result() for task in tasks]
+
+
 class CoachingService:
     """커리어 코칭 핵심 비즈니스 로직을 담당하는 서비스"""
 
@@ -30,15 +91,39 @@ class CoachingService:
         self.llm_client = get_llm_client()
         self.prompt_builder = get_prompt_builder()
         self.quality_evaluator = get_quality_evaluator()
+        self.candidate_planner = CandidatePlanner(self.prompt_builder)
+
+        # 파싱/검증/품질 평가를 이벤트 루프 밖에서 실행하는 실행기
+        self.cpu_executor = get_cpu_executor()
+
+        # 정규화된 이력서 기준 세션 결과 캐시 (비활성화 시 None)
+        self.session_cache = (
+            SessionResultCache(
+                max_bytes=settings.session_cache_max_bytes,
+                ttl_seconds=settings.session_cache_ttl_seconds,
+            )
+            if settings.session_cache_enabled
+            else None
+        )
+
+        # 동일 요청 병합기
+        self.in_flight_sessions = SingleFlight()
 
     async def create_coaching_session(
-        self, resume_data: ResumePayload, enable_quality_optimization: bool = True
+        self,
+        resume_data: ResumePayload,
+        enable_quality_optimization: bool = True,
+        use_cache: bool = True,
+        deadline: Optional[Deadline] = None,
     ) -> CoachingResult:
         """
         이력서 데이터를 기반으로 개인 맞춤형 코칭 세션 생성
 
         Args:
             resume_data: 이력서 정보
+            enable_quality_optimization: 품질 최적화 모드 사용 여부
+            use_cache: 캐시 사용 여부 (False이면 세션 결과 캐시와 LLM 응답 캐시 모두 조회하지 않음)
+            deadline: 요청 데드라인 (모든 LLM 호출에 전파)
 
         Returns:
             생성된 코칭 결과
@@ -49,12 +134,38 @@ class CoachingService:
         try:
             logger.info(f"코칭 세션 생성 시작: {resume_data.career_summary[:50]}...")
 
-            if enable_quality_optimization:
-                # 품질 최적화 모드: 여러 전략으로 생성하고 최고 품질 선택
-                result = await self._create_optimized_session(resume_data)
+            session_key = make_session_cache_key(
+                resume_data, enable_quality_optimization
+            )
+
+            # 캐시 적중 시 프롬프트 구성, LLM 호출, 품질 평가를 모두 생략
+            if use_cache and self.session_cache is not None:
+                cached = self.session_cache.get(session_key)
+                if cached is not None:
+                    logger.info(f"세션 캐시 적중: {cached.session_id}")
+                    return cached
+
+            def create_session():
+                return self._create_session(
+                    resume_data,
+                    enable_quality_optimization,
+                    session_key,
+                    deadline,
+                    use_cache,
+                )
+
+            if use_cache:
+                # 동일한 이력서의 동시 요청은 하나의 실행 결과를 공유
+                # (합류한 요청은 먼저 시작한 요청의 데드라인을 따르므로 데드라인이 더 길면 합류하지 않음)
+                result, joined = await self.in_flight_sessions.do(
+                    session_key, create_session, deadline
+                )
             else:
-                # 일반 모드: 단일 전략으로 생성
-                result = await self._create_standard_session(resume_data)
+                # 새로 생성을 요청했으므로 진행 중인 요청에 합류하지 않음
+                result, joined = await create_session(), False
+            if joined:
+                result = result.model_copy(update={"session_id": uuid4()})
+                logger.info(f"진행 중인 동일 요청에 합류: {result.session_id}")
 
             logger.info(f"코칭 세션 생성 완료: {result.session_id}")
             return result
@@ -63,44 +174,302 @@ class CoachingService:
             logger.error(f"코칭 세션 생성 실패: {str(e)}")
             raise CoachingServiceError(f"코칭 세션 생성 중 오류 발생: {str(e)}")
 
+    async def stream_coaching_session(
+        self,
+        resume_data: ResumePayload,
+        use_cache: bool = True,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[Tuple[str, dict]]:
+        """
+        면접 질문과 학습 단계를 생성되는 대로 전달하는 스트리밍 코칭 세션
+
+        후보 경쟁은 전체 응답이 있어야 평가할 수 있으므로 표준 모드로 생성합니다.
+        스트리밍 중 전달된 항목은 미리보기이며, 마지막 complete 이벤트의 결과가 최종 결과입니다.
+        (응답 파싱에 실패하면 최종 결과는 대체 콘텐츠로 구성됩니다.)
+
+        Yields:
+            (이벤트명, 데이터) - session, interview_question, learning_step, complete, error
+        """
+        logger.info(f"스트리밍 코칭 세션 시작: {resume_data.career_summary[:50]}...")
+
+        session_key = make_session_cache_key(resume_data, False)
+        if use_cache and self.session_cache is not None:
+            cached = self.session_cache.get(session_key)
+            if cached is not None:
+                logger.info(f"세션 캐시 적중: {cached.session_id}")
+                yield "session", {"session_id": str(cached.session_id)}
+                for question in cached.interview_questions:
+                    yield "interview_question", question.model_dump()
+                for step in cached.learning_path.steps:
+                    yield "learning_step", step.model_dump()
+                yield "complete", cached.model_dump(mode="json")
+                return
+
+        session_id = uuid4()
+        yield "session", {"session_id": str(session_id)}
+
+        queue: asyncio.Queue = asyncio.Queue()
+        producer = asyncio.ensure_future(
+            self._stream_session(resume_data, session_id, session_key, queue, deadline)
+        )
+        try:
+            while True:
+                event, data = await queue.get()
+                yield event, data
+                if event in ("complete", "error"):
+                    break
+        finally:
+            # 클라이언트 연결이 끊기면 진행 중인 LLM 스트림도 중단
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+
+    async def _stream_session(
+        self,
+        resume_data: ResumePayload,
+        session_id,
+        session_key: str,
+        queue: asyncio.Queue,
+        deadline: Optional[Deadline],
+    ) -> None:
+        """두 스트림을 동시에 생성하고 이벤트를 큐로 전달"""
+        admission_key.set(uuid4().hex)
+        current_deadline.set(deadline)
+        features = extract_resume_features(resume_data)
+        try:
+            interview_questions, learning_path = await _gather_or_cancel(
+                self._stream_interview_questions(resume_data, queue, features),
+                self._stream_learning_path(resume_data, queue, features),
+            )
+            result = CoachingResult(
+                session_id=session_id,
+                interview_questions=interview_questions,
+                learning_path=learning_path,
+            )
+            if self.session_cache is not None and not self._is_fallback_result(
+                result, resume_data
+            ):
+                self.session_cache.set(session_key, result)
+
+            logger.info(f"스트리밍 코칭 세션 완료: {session_id}")
+            await queue.put(("complete", result.model_dump(mode="json")))
+        except Exception as e:
+            logger.error(f"스트리밍 코칭 세션 실패: {str(e)}")
+            await queue.put(("error", {"detail": str(e)}))
+
+    async def _stream_interview_questions(
+        self,
+        resume_data: ResumePayload,
+        queue: asyncio.Queue,
+        features: Optional[ResumeFeatures] = None,
+    ) -> List[InterviewQuestion]:
+        """면접 질문을 스트리밍으로 생성하며 완성된 질문을 큐로 전달"""
+        try:
+            prompt = self.prompt_builder.build_interview_questions_prompt(
+                resume_data, features=features
+            )
+            response = await self._stream_json_items(
+                prompt,
+                INTERVIEW_QUESTIONS_MAX_TOKENS,
+                "interview_questions",
+                InterviewQuestion,
+                "interview_question",
+                queue,
+            )
+            return await self.cpu_executor.run(
+                parse_interview_questions, response, resume_data
+            )
+
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warning(f"LLM 호출 불가, 대체 면접 질문 사용: {str(e)}")
+            return self._generate_fallback_questions(resume_data)
+
+        except LLMClientError as e:
+            logger.error(f"LLM 호출 실패: {str(e)}")
+            raise CoachingServiceError(f"면접 질문 생성 실패: {str(e)}")
+
+    async def _stream_learning_path(
+        self,
+        resume_data: ResumePayload,
+        queue: asyncio.Queue,
+        features: Optional[ResumeFeatures] = None,
+    ) -> LearningPath:
+        """학습 경로를 스트리밍으로 생성하며 완성된 학습 단계를 큐로 전달"""
+        try:
+            prompt = self.prompt_builder.build_learning_path_prompt(
+                resume_data, features=features
+            )
+            response = await self._stream_json_items(
+                prompt,
+                LEARNING_PATH_MAX_TOKENS,
+                "steps",
+                LearningStep,
+                "learning_step",
+                queue,
+            )
+            return await self.cpu_executor.run(
+                parse_learning_path, response, resume_data
+            )
+
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warning(f"LLM 호출 불가, 대체 학습 경로 사용: {str(e)}")
+            return self._generate_fallback_learning_path(resume_data)
+
+        except LLMClientError as e:
+            logger.error(f"LLM 호출 실패: {str(e)}")
+            raise CoachingServiceError(f"학습 경로 생성 실패: {str(e)}")
+
+    async def _stream_json_items(
+        self,
+        prompt: str,
+        max_tokens: int,
+        array_key: str,
+        item_model,
+        event: str,
+        queue: asyncio.Queue,
+    ) -> str:
+        """JSON 스트림에서 배열 요소가 완성될 때마다 검증 후 큐로 전달하고 전체 응답 반환"""
+        parser = JSONArrayStreamParser(array_key)
+        chunks = []
+        async for delta in self.llm_client.stream_json_completion(
+            prompt=prompt,
+            model="gpt-3.5-turbo-1106",
+            temperature=0.7,
+            max_tokens=max_tokens,
+        ):
+            chunks.append(delta)
+            for item_data in parser.feed(delta):
+                try:
+                    item = item_model.model_validate(item_data)
+                except ValidationError as e:
+                    logger.warning(f"스트리밍 항목 검증 실패: {str(e)}")
+                    continue
+                await queue.put((event, item.model_dump()))
+
+        return "".join(chunks)
+
+    async def _create_session(
+        self,
+        resume_data: ResumePayload,
+        enable_quality_optimization: bool,
+        session_key: str,
+        deadline: Optional[Deadline] = None,
+        use_cache: bool = True,
+    ) -> CoachingResult:
+        """모드에 따라 세션을 생성하고 결과를 캐시에 저장"""
+        # 이 세션에서 발생하는 LLM 호출을 하나의 공정 큐잉 단위로 묶음
+        admission_key.set(uuid4().hex)
+        # 하위 LLM 호출이 모두 같은 데드라인을 따르도록 컨텍스트에 설정
+        current_deadline.set(deadline)
+
+        # 이력서 특징은 요청당 한 번만 추출해 프롬프트 구성과 품질 평가에서 공유
+        features = extract_resume_features(resume_data)
+
+        if enable_quality_optimization:
+            # 품질 최적화 모드: 여러 전략으로 생성하고 최고 품질 선택
+            result = await self._create_optimized_session(
+                resume_data, features, use_cache
+            )
+        else:
+            # 일반 모드: 단일 전략으로 생성
+            result = await self._create_standard_session(
+                resume_data, features, use_cache
+            )
+
+        # 대체 콘텐츠가 섞인 결과는 장애 복구 후에도 남지 않도록 캐시하지 않음
+        if self.session_cache is not None and not self._is_fallback_result(
+            result, resume_data
+        ):
+            self.session_cache.set(session_key, result)
+
+        return result
+
     async def _create_optimized_session(
-        self, resume_data: ResumePayload
+        self,
+        resume_data: ResumePayload,
+        features: Optional[ResumeFeatures] = None,
+        use_cache: bool = True,
     ) -> CoachingResult:
         """품질 최적화된 코칭 세션 생성 (A/B 테스트)"""
-        import asyncio
-
         logger.info("품질 최적화 모드로 세션 생성 중...")
+        features = features or extract_resume_features(resume_data)
 
         # 다양한 전략으로 병렬 생성
         strategies = ["balanced", "technical_deep", "system_design"]
         personas = ["senior_engineer", "tech_lead", "platform_architect"]
 
-        tasks = []
-        for strategy in strategies:
-            for persona in personas:
-                task = self._generate_candidate_session(resume_data, persona, strategy)
-                tasks.append(task)
+        # 고유 프롬프트를 먼저 구성하고 동일 프롬프트의 LLM 호출은 공유
+        plan = self.candidate_planner.plan(resume_data, strategies, personas, features)
+        pool = SharedCompletionPool(self.llm_client, use_cache)
 
-        # 모든 후보 결과 생성
-        candidates = await asyncio.gather(*tasks, return_exceptions=True)
+        candidate_tasks = [
+            asyncio.ensure_future(
+                self._generate_candidate_session(resume_data, spec, pool)
+            )
+            for spec in plan.specs
+        ]
 
-        # 유효한 결과만 필터링
+        # 완료되는 순서대로 평가하고, 임계값을 넘는 후보가 나오면 조기 종료
         valid_candidates = []
-        for candidate in candidates:
-            if not isinstance(candidate, Exception):
-                try:
-                    # 품질 평가
-                    quality_score = self.quality_evaluator.evaluate_coaching_result(
-                        candidate, resume_data
+        deadline_expired = False
+        race_deadline = Deadline.after(settings.optimization_deadline_seconds)
+        request_deadline = current_deadline.get()
+        if (
+            request_deadline is not None
+            and request_deadline.expires_at < race_deadline.expires_at
+        ):
+            race_deadline = request_deadline
+        pending = set(candidate_tasks)
+        try:
+            while pending:
+                timeout = race_deadline.remaining()
+                if timeout <= 0:
+                    deadline_expired = True
+                    logger.warning(
+                        f"최적화 마감 시간 초과, 미완료 후보 {len(pending)}개 취소"
                     )
-                    valid_candidates.append((candidate, quality_score))
-                    logger.info(f"후보 세션 품질 점수: {quality_score.overall:.2f}")
-                except Exception as e:
-                    logger.warning(f"품질 평가 실패: {str(e)}")
+                    break
+
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                # 같은 시점에 완료된 후보는 실행기 작업 하나로 파싱/평가
+                valid_candidates.extend(
+                    await self._score_candidates(
+                        [
+                            task.result()
+                            for task in done
+                            if not task.cancelled() and task.exception() is None
+                        ],
+                        resume_data,
+                        features,
+                    )
+                )
+
+                if self._should_stop_early(valid_candidates):
+                    logger.info(
+                        f"품질 임계값 도달, 미완료 후보 {len(pending)}개 취소 후 조기 종료"
+                    )
+                    break
+        finally:
+            # 남은 후보와 공유 요청을 취소하여 토큰 사용 중단
+            for task in pending:
+                task.cancel()
+            pool.cancel_pending()
+            await asyncio.gather(*pending, return_exceptions=True)
+
+        logger.info(
+            f"후보 {len(plan.specs)}개 중 {len(valid_candidates)}개 평가, "
+            f"LLM 호출 {pool.issued_requests}회 사용"
+        )
 
         if not valid_candidates:
+            if deadline_expired:
+                logger.warning("마감 시간 내 유효한 후보 없음, 대체 콘텐츠 사용")
+                return self._generate_fallback_result(resume_data)
             logger.warning("모든 최적화 시도 실패, 표준 모드로 대체")
-            return await self._create_standard_session(resume_data)
+            return await self._create_standard_session(
+                resume_data, features, use_cache
+            )
 
         # 최고 품질 선택
         best_candidate, best_score = max(valid_candidates, key=lambda x: x[1].overall)
@@ -112,27 +481,77 @@ class CoachingService:
 
         return best_candidate
 
+    async def _score_candidates(
+        self,
+        candidates: List[CandidateResponses],
+        resume_data: ResumePayload,
+        features: Optional[ResumeFeatures] = None,
+    ) -> list:
+        """후보 응답 일괄 파싱/품질 평가 (실패 시 후보별로 다시 처리해 실패한 후보만 제외)"""
+        if not candidates:
+            return []
+
+        # 프로세스 풀 작업자는 자체 품질 평가자를 사용
+        evaluator = (
+            None if self.cpu_executor.kind == "process" else self.quality_evaluator
+        )
+        try:
+            scored = await self.cpu_executor.run(
+                score_candidate_responses,
+                candidates,
+                resume_data,
+                features,
+                evaluator,
+                items=len(candidates),
+            )
+        except Exception as e:
+            if len(candidates) == 1:
+                logger.warning(f"품질 평가 실패: {str(e)}")
+                return []
+            logger.warning(f"일괄 품질 평가 실패, 후보별 평가로 대체: {str(e)}")
+            scored = []
+            for candidate in candidates:
+                scored.extend(
+                    await self._score_candidates([candidate], resume_data, features)
+                )
+            return scored
+
+        for _, quality_score in scored:
+            logger.info(f"후보 세션 품질 점수: {quality_score.overall:.2f}")
+        return scored
+
+    def _should_stop_early(self, valid_candidates: list) -> bool:
+        """품질 임계값과 최소 후보 수를 만족하면 조기 종료"""
+        if not settings.optimization_early_exit:
+            return False
+        if len(valid_candidates) < settings.optimization_min_candidates:
+            return False
+        return any(
+            score.overall >= settings.optimization_quality_threshold
+            for _, score in valid_candidates
+        )
+
     async def _create_standard_session(
-        self, resume_data: ResumePayload
+        self,
+        resume_data: ResumePayload,
+        features: Optional[ResumeFeatures] = None,
+        use_cache: bool = True,
     ) -> CoachingResult:
         """표준 코칭 세션 생성"""
+        features = features or extract_resume_features(resume_data)
 
         # 병렬로 면접 질문과 학습 경로 생성
-        interview_questions_task = self._generate_interview_questions(resume_data)
-        learning_path_task = self._generate_learning_path(resume_data)
-
-        # 두 작업 동시 실행
-        import asyncio
-
-        interview_questions, learning_path = await asyncio.gather(
-            interview_questions_task, learning_path_task, return_exceptions=True
+        interview_questions_task = self._generate_interview_questions(
+            resume_data, features=features, use_cache=use_cache
+        )
+        learning_path_task = self._generate_learning_path(
+            resume_data, features=features, use_cache=use_cache
         )
 
-        # 예외 처리
-        if isinstance(interview_questions, Exception):
-            raise interview_questions
-        if isinstance(learning_path, Exception):
-            raise learning_path
+        # 두 작업 동시 실행 (한쪽 실패 시 나머지 취소)
+        interview_questions, learning_path = await _gather_or_cancel(
+            interview_questions_task, learning_path_task
+        )
 
         # 결과 조합
         result = CoachingResult(
@@ -144,35 +563,67 @@ class CoachingService:
         return result
 
     async def _generate_candidate_session(
-        self, resume_data: ResumePayload, persona: str, strategy: str
-    ) -> CoachingResult:
-        """특정 페르소나와 전략으로 후보 세션 생성"""
+        self,
+        resume_data: ResumePayload,
+        spec: CandidateSpec,
+        pool: SharedCompletionPool,
+    ) -> CandidateResponses:
+        """특정 페르소나와 전략의 후보 응답 수집 (파싱과 평가는 실행기에서 일괄 처리)"""
         try:
-            # 커스텀 프롬프트로 생성
-            interview_questions = await self._generate_interview_questions(
-                resume_data, persona, strategy
+            # 공유 풀을 통해 동일 프롬프트는 한 번만 호출하고, 두 작업은 동시 실행
+            interview_response, learning_path_response = await _gather_or_cancel(
+                self._await_shared_response(
+                    pool.request(
+                        spec.interview_prompt,
+                        INTERVIEW_QUESTIONS_MAX_TOKENS,
+                        is_valid_interview_questions_response,
+                    ),
+                    "면접 질문 생성 실패",
+                ),
+                self._await_shared_response(
+                    pool.request(
+                        spec.learning_path_prompt,
+                        LEARNING_PATH_MAX_TOKENS,
+                        is_valid_learning_path_response,
+                    ),
+                    "학습 경로 생성 실패",
+                ),
             )
-            learning_path = await self._generate_learning_path(resume_data, persona)
 
-            return CoachingResult(
-                session_id=uuid4(),
-                interview_questions=interview_questions,
-                learning_path=learning_path,
-            )
+            return CandidateResponses(interview_response, learning_path_response)
         except Exception as e:
             logger.warning(
-                f"후보 세션 생성 실패 (persona={persona}, strategy={strategy}): {str(e)}"
+                f"후보 세션 생성 실패 (persona={spec.persona}, strategy={spec.strategy}): {str(e)}"
             )
             raise e
 
+    async def _await_shared_response(
+        self, shared_task, error_message: str
+    ) -> Optional[str]:
+        """공유 LLM 요청 결과 대기 (호출할 수 없으면 대체 콘텐츠를 뜻하는 None)"""
+        try:
+            # 다른 후보와 공유하는 요청이므로 개별 후보 취소가 전파되지 않도록 보호
+            return await asyncio.shield(shared_task)
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warning(f"LLM 호출 불가, 대체 콘텐츠 사용: {str(e)}")
+            return None
+        except LLMClientError as e:
+            logger.error(f"LLM 호출 실패: {str(e)}")
+            raise CoachingServiceError(f"{error_message}: {str(e)}")
+
     async def _generate_interview_questions(
-        self, resume_data: ResumePayload, persona_type: str = None, strategy: str = None
+        self,
+        resume_data: ResumePayload,
+        persona_type: str = None,
+        strategy: str = None,
+        features: Optional[ResumeFeatures] = None,
+        use_cache: bool = True,
     ) -> List[InterviewQuestion]:
         """면접 질문 생성"""
         try:
             # 프롬프트 구성
             prompt = self.prompt_builder.build_interview_questions_prompt(
-                resume_data, persona_type, strategy
+                resume_data, persona_type, strategy, features
             )
 
             # LLM 호출
@@ -180,48 +631,35 @@ class CoachingService:
                 prompt=prompt,
                 model="gpt-3.5-turbo-1106",
                 temperature=0.7,
-                max_tokens=2000,
+                max_tokens=INTERVIEW_QUESTIONS_MAX_TOKENS,
+                cache_validator=is_valid_interview_questions_response,
+                use_cache=use_cache,
             )
 
-            # JSON 파싱
-            try:
-                parsed_response = json.loads(response)
-                questions_data = parsed_response.get("interview_questions", [])
-
-                if len(questions_data) != 5:
-                    raise ValueError(
-                        f"예상된 5개 질문이 아닌 {len(questions_data)}개 질문이 생성됨"
-                    )
-
-                # Pydantic 모델로 변환
-                questions = []
-                for q_data in questions_data:
-                    question = InterviewQuestion(
-                        question=q_data["question"],
-                        intent=q_data["intent"],
-                        category=q_data["category"],
-                    )
-                    questions.append(question)
-
-                logger.info(f"면접 질문 {len(questions)}개 생성 완료")
-                return questions
+            return await self.cpu_executor.run(
+                parse_interview_questions, response, resume_data
+            )
 
-            except (json.JSONDecodeError, KeyError, ValueError) as e:
-                logger.warning(f"LLM 응답 파싱 실패, 대체 로직 사용: {str(e)}")
-                return self._generate_fallback_questions(resume_data)
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warning(f"LLM 호출 불가, 대체 면접 질문 사용: {str(e)}")
+            return self._generate_fallback_questions(resume_data)
 
         except LLMClientError as e:
             logger.error(f"LLM 호출 실패: {str(e)}")
             raise CoachingServiceError(f"면접 질문 생성 실패: {str(e)}")
 
     async def _generate_learning_path(
-        self, resume_data: ResumePayload, persona_type: str = None
+        self,
+        resume_data: ResumePayload,
+        persona_type: str = None,
+        features: Optional[ResumeFeatures] = None,
+        use_cache: bool = True,
     ) -> LearningPath:
         """학습 경로 생성"""
         try:
             # 프롬프트 구성
             prompt = self.prompt_builder.build_learning_path_prompt(
-                resume_data, persona_type
+                resume_data, persona_type, features
             )
 
             # LLM 호출
@@ -229,32 +667,18 @@ class CoachingService:
                 prompt=prompt,
                 model="gpt-3.5-turbo-1106",
                 temperature=0.7,
-                max_tokens=1500,
+                max_tokens=LEARNING_PATH_MAX_TOKENS,
+                cache_validator=is_valid_learning_path_response,
+                use_cache=use_cache,
             )
 
-            # JSON 파싱
-            try:
-                parsed_response = json.loads(response)
-                path_data = parsed_response.get("learning_path", {})
-
-                # 학습 단계 변환
-                steps = []
-                for step_data in path_data.get("steps", []):
-                    step = LearningStep(
-                        title=step_data["title"],
-                        description=step_data["description"],
-                        resources=step_data["resources"],
-                    )
-                    steps.append(step)
-
-                learning_path = LearningPath(summary=path_data["summary"], steps=steps)
-
-                logger.info(f"학습 경로 생성 완료: {len(steps)}개 단계")
-                return learning_path
+            return await self.cpu_executor.run(
+                parse_learning_path, response, resume_data
+            )
 
-            except (json.JSONDecodeError, KeyError) as e:
-                logger.warning(f"LLM 응답 파싱 실패, 대체 로직 사용: {str(e)}")
-                return self._generate_fallback_learning_path(resume_data)
+        except (CircuitOpenError, DeadlineExceededError) as e:
+            logger.warning(f"LLM 호출 불가, 대체 학습 경로 사용: {str(e)}")
+            return self._generate_fallback_learning_path(resume_data)
 
         except LLMClientError as e:
             logger.error(f"LLM 호출 실패: {str(e)}")
@@ -264,81 +688,42 @@ class CoachingService:
         self, resume_data: ResumePayload
     ) -> List[InterviewQuestion]:
         """LLM 실패 시 대체 면접 질문 생성"""
-        logger.info("대체 면접 질문 생성 중...")
-
-        # 기술 스킬 기반 질문 생성
-        primary_skills = resume_data.technical_skills[:3]
-
-        questions = [
-            InterviewQuestion(
-                question=f"{resume_data.career_summary}을 바탕으로, 가장 도전적이었던 기술적 문제는 무엇이었고 어떻게 해결하셨나요?",
-                intent="문제 해결 능력과 기술적 깊이를 평가합니다.",
-                category="Technical Deep-Dive",
-            ),
-            InterviewQuestion(
-                question=f"{', '.join(primary_skills)} 기술을 사용한 프로젝트에서 성능 최적화를 어떻게 진행하셨나요?",
-                intent="성능 최적화 경험과 기술적 접근 방식을 검증합니다.",
-                category="System Design",
-            ),
-            InterviewQuestion(
-                question="팀원과 기술적 의견 차이가 있을 때 어떻게 해결하시나요?",
-                intent="협업 능력과 커뮤니케이션 스킬을 평가합니다.",
-                category="Behavioral",
-            ),
-            InterviewQuestion(
-                question="현재 시스템에서 장애가 발생했을 때의 대응 절차를 설명해주세요.",
-                intent="장애 대응 능력과 시스템 운영 경험을 평가합니다.",
-                category="Problem Solving",
-            ),
-            InterviewQuestion(
-                question="향후 3-5년간 기술적 성장 목표는 무엇인가요?",
-                intent="자기계발 의지와 장기적 비전을 평가합니다.",
-                category="Career Vision",
-            ),
-        ]
-
-        return questions
+        return fallback_interview_questions(resume_data)
 
     def _generate_fallback_learning_path(
         self, resume_data: ResumePayload
     ) -> LearningPath:
         """LLM 실패 시 대체 학습 경로 생성"""
-        logger.info("대체 학습 경로 생성 중...")
-
-        primary_skills = resume_data.technical_skills[:3]
-
-        steps = [
-            LearningStep(
-                title="기술적 깊이 강화",
-                description=f"현재 보유한 {', '.join(primary_skills)} 기술의 고급 개념과 최적화 기법을 학습하고 실제 프로젝트에 적용",
-                resources=[f"{skill} 고급 가이드" for skill in primary_skills[:2]]
-                + ["성능 최적화 패턴"],
-            ),
-            LearningStep(
-                title="시스템 설계 역량 개발",
-                description="대규모 시스템 아키텍처 설계 경험을 쌓기 위한 사이드 프로젝트 진행",
-                resources=[
-                    "System Design Interview",
-                    "마이크로서비스 아키텍처",
-                    "분산 시스템 설계",
-                ],
-            ),
-            LearningStep(
-                title="기술 리더십 함양",
-                description="코드 리뷰 문화 구축, 기술 문서 작성, 팀 내 지식 공유 활동 참여",
-                resources=[
-                    "Effective Code Review",
-                    "기술 블로깅",
-                    "컨퍼런스 발표 준비",
-                ],
-            ),
-        ]
+        return fallback_learning_path(resume_data)
+
+    def _is_fallback_result(
+        self, result: CoachingResult, resume_data: ResumePayload
+    ) -> bool:
+        """결과에 대체 콘텐츠가 포함되었는지 확인"""
+        return result.interview_questions == self._generate_fallback_questions(
+            resume_data
+        ) or result.learning_path == self._generate_fallback_learning_path(
+            resume_data
+        )
 
-        return LearningPath(
-            summary=f"현재 {', '.join(primary_skills)} 경험을 바탕으로 시니어 개발자로 성장하기 위한 체계적인 학습 경로를 제안합니다.",
-            steps=steps,
+    def _generate_fallback_result(self, resume_data: ResumePayload) -> CoachingResult:
+        """대체 면접 질문과 학습 경로로 코칭 결과 구성"""
+        return CoachingResult(
+            session_id=uuid4(),
+            interview_questions=self._generate_fallback_questions(resume_data),
+            learning_path=self._generate_fallback_learning_path(resume_data),
         )
 
+    def get_metrics(self) -> dict:
+        """코칭 서비스 운영 지표 반환"""
+        metrics = {"llm": self.llm_client.get_metrics()}
+        if self.session_cache is not None:
+            metrics["session_cache"] = self.session_cache.get_metrics()
+        metrics["single_flight"] = self.in_flight_sessions.get_metrics()
+        metrics["cpu_executor"] = self.cpu_executor.get_metrics()
+        metrics["event_loop"] = get_loop_monitor().get_metrics()
+        return metrics
+
     async def health_check(self) -> bool:
         """서비스 상태 확인"""
         try:
@@ -347,6 +732,85 @@ class CoachingService:
             logger.error(f"코칭 서비스 헬스체크 실패: {str(e)}")
             return False
 
+    def get_circuit_breaker_state(self) -> str:
+        """LLM 서킷 브레이커 상태 (closed/open/half_open)"""
+        return self.llm_client.circuit_breaker.state
+
+    def get_readiness(self) -> dict:
+        """요청 처리 준비 상태 (LLM 호출 없이 캐시된 상태로 판단)"""
+        llm_status = self.llm_client.health_monitor.get_status()
+        breaker_status = self.llm_client.circuit_breaker.get_status()
+        return {
+            "ready": llm_status["available"] and breaker_status["state"] != OPEN,
+            "llm": llm_status,
+            "circuit_breaker": breaker_status,
+        }
+
+
+async def create_coaching_sessions_offline(
+    resumes: List[ResumePayload],
+    batch_service: BatchService,
+) -> List[CoachingResult]:
+    """
+    여러 이력서의 프롬프트를 하나의 배치로 제출하여 코칭 세션 일괄 생성 (비대화형, 저비용)
+
+    실시간 응답이 필요 없는 코호트 처리를 위한 경로로, 표준 모드 프롬프트를 사용하고
+    응답은 실시간 경로와 같은 파서로 변환합니다. 실패한 요청은 대체 콘텐츠로 채웁니다.
+    LLM 클라이언트를 만들지 않으므로 실시간 LLM 공급자 설정 없이 실행할 수 있습니다.
+
+    Args:
+        resumes: 이력서 목록
+        batch_service: 배치 제출/조회 백엔드
+
+    Returns:
+        입력 순서와 같은 코칭 결과 목록
+    """
+    prompt_builder = get_prompt_builder()
+    requests = []
+    for index, resume in enumerate(resumes):
+        features = extract_resume_features(resume)
+        requests.append(
+            build_batch_request(
+                f"{index}:interview_questions",
+                prompt_builder.build_interview_questions_prompt(
+                    resume, features=features
+                ),
+                max_tokens=INTERVIEW_QUESTIONS_MAX_TOKENS,
+            )
+        )
+        requests.append(
+            build_batch_request(
+                f"{index}:learning_path",
+                prompt_builder.build_learning_path_prompt(
+                    resume, features=features
+                ),
+                max_tokens=LEARNING_PATH_MAX_TOKENS,
+            )
+        )
+
+    contents = await batch_service.run(
+        requests,
+        poll_interval_seconds=settings.batch_api_poll_interval_seconds,
+        timeout_seconds=settings.batch_api_timeout_seconds,
+    )
+
+    # 응답 파싱과 모델 검증은 작업 하나로 묶어 실행기에서 처리
+    results = await get_cpu_executor().run(
+        build_coaching_results,
+        [
+            (
+                contents.get(f"{index}:interview_questions"),
+                contents.get(f"{index}:learning_path"),
+                resume,
+            )
+            for index, resume in enumerate(resumes)
+        ],
+        items=len(resumes),
+    )
+
+    logger.info(f"배치 코칭 세션 {len(results)}개 생성 완료")
+    return results
+
 
 # 전역 코칭 서비스 인스턴스
 _coaching_service = None
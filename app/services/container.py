@@ -0,0 +1,200 @@
+import asyncio
+import logging
+import time
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional
+
+from app.core.config import settings
+from app.core.executor import get_cpu_executor
+from app.core.loop_monitor import get_loop_monitor
+from app.schemas.coaching import ResumePayload
+from app.services.candidate_planner import (
+    CandidateResponses,
+    score_candidate_responses,
+)
+from app.services.coaching_service import CoachingService, get_coaching_service
+from app.services.job_queue import get_job_queue
+from app.services.llm_client import LLMClient, LLMClientError, get_llm_client
+from app.services.llm_providers import build_mock_content
+from app.services.prompt_builder import get_prompt_builder
+from app.services.quality_evaluator import (
+    VECTORIZED_MIN_CANDIDATES,
+    get_quality_evaluator,
+)
+from app.services.resume_features import extract_resume_features
+
+logger = logging.getLogger(__name__)
+
+# 워밍업용 이력서 (실제 요청과 같은 경로로 프롬프트 렌더링/파싱/품질 평가 실행)
+WARMUP_RESUME = ResumePayload(
+    career_summary="5년차 백엔드 개발자, Spring Boot/MSA 기반 커머스 서비스 개발",
+    job_duties="주문 및 결제 시스템 MSA 전환 프로젝트 리딩, Kafka 기반 이벤트 처리 설계",
+    technical_skills=["Java", "Spring Boot", "Kafka", "Redis", "AWS"],
+)
+
+
+class ServiceContainer:
+    """
+    애플리케이션 수명 동안 공유하는 서비스 묶음
+
+    FastAPI lifespan 시작 시 서비스를 한 번 생성하고 워밍업(프롬프트 렌더링, 응답 파싱/품질 평가,
+    CPU 작업자 풀 생성, LLM HTTP 연결 풀 생성)한 뒤 백그라운드 작업을 시작합니다.
+    배포 직후 첫 요청이 생성/초기화 비용을 치르지 않도록 단계별 소요 시간을 기록합니다.
+    """
+
+    def __init__(self):
+        self.prompt_builder = None
+        self.quality_evaluator = None
+        self.cpu_executor = None
+        self.loop_monitor = None
+        self.job_queue = None
+        self.llm_client: Optional[LLMClient] = None
+        self.coaching_service: Optional[CoachingService] = None
+        self.llm_error: Optional[str] = None
+        self.started = False
+
+        # 단계별 시작 소요 시간 (초)
+        self.warmup_seconds: Dict[str, float] = {}
+
+    @contextmanager
+    def _timed(self, step: str) -> Iterator[None]:
+        started_at = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.warmup_seconds[step] = time.perf_counter() - started_at
+
+    async def start(self) -> None:
+        """서비스 생성, 워밍업, 백그라운드 작업 시작"""
+        if self.started:
+            return
+
+        started_at = time.perf_counter()
+        self.warmup_seconds = {}
+
+        with self._timed("services"):
+            self._build_services()
+
+        probe_ok = None
+        if settings.startup_warmup_enabled:
+            with self._timed("prompts_and_scoring"):
+                await self._warm_up_scoring()
+            if self.llm_client is not None:
+                with self._timed("llm_connection"):
+                    probe_ok = await self._warm_up_llm_connection()
+
+        with self._timed("background_tasks"):
+            self.loop_monitor.start()
+            if self.llm_client is not None:
+                # 워밍업 프로브를 마쳤으면 다음 주기부터 프로브
+                self.llm_client.start_health_probe(
+                    settings.health_probe_interval_seconds
+                    if probe_ok is not None
+                    else 0.0
+                )
+            # 영구 저장소에 남은 미완료 작업을 다시 실행
+            await self.job_queue.start()
+
+        self.warmup_seconds["total"] = time.perf_counter() - started_at
+        self.started = True
+        logger.info(
+            f"서비스 시작 완료 ({self.warmup_seconds['total']:.3f}초): "
+            + ", ".join(
+                f"{step} {seconds:.3f}초"
+                for step, seconds in self.warmup_seconds.items()
+                if step != "total"
+            )
+        )
+
+    async def stop(self) -> None:
+        """백그라운드 작업 중지와 연결/작업자 풀 정리"""
+        if not self.started:
+            return
+
+        await self.job_queue.stop()
+        if self.llm_client is not None:
+            await self.llm_client.stop_health_probe()
+            await self.llm_client.close()
+        await self.loop_monitor.stop()
+        self.cpu_executor.shutdown()
+        self.started = False
+
+    def _build_services(self) -> None:
+        """모든 서비스 싱글톤 생성 (LLM 설정 오류 시 LLM 의존 서비스만 제외)"""
+        self.prompt_builder = get_prompt_builder()
+        self.quality_evaluator = get_quality_evaluator()
+        self.cpu_executor = get_cpu_executor()
+        self.loop_monitor = get_loop_monitor()
+        self.job_queue = get_job_queue()
+
+        try:
+            self.llm_client = get_llm_client()
+            self.coaching_service = get_coaching_service()
+            self.llm_error = None
+        except LLMClientError as e:
+            logger.warning(f"LLM 클라이언트를 생성하지 못했습니다: {str(e)}")
+            self.llm_error = str(e)
+
+    async def _warm_up_scoring(self) -> None:
+        """워밍업 이력서로 프롬프트 렌더링 후 CPU 실행기에서 응답 파싱/일괄 품질 평가"""
+        features = extract_resume_features(WARMUP_RESUME)
+        interview_prompt = self.prompt_builder.build_interview_questions_prompt(
+            WARMUP_RESUME, features=features
+        )
+        learning_path_prompt = self.prompt_builder.build_learning_path_prompt(
+            WARMUP_RESUME, features=features
+        )
+
+        # 일괄 평가 경로까지 실행되도록 벡터화 최소 후보 수만큼 구성
+        candidates = [
+            CandidateResponses(
+                build_mock_content(interview_prompt),
+                build_mock_content(learning_path_prompt),
+            )
+        ] * VECTORIZED_MIN_CANDIDATES
+        evaluator = (
+            None if self.cpu_executor.kind == "process" else self.quality_evaluator
+        )
+        await self.cpu_executor.run(
+            score_candidate_responses,
+            candidates,
+            WARMUP_RESUME,
+            features,
+            evaluator,
+            items=len(candidates),
+        )
+
+    async def _warm_up_llm_connection(self) -> Optional[bool]:
+        """과금 없는 프로브로 LLM HTTP 연결 풀을 열고 헬스 상태 초기화 (시간 초과 시 None)"""
+        try:
+            return await asyncio.wait_for(
+                self.llm_client.health_monitor.run_probe(self.llm_client.probe),
+                timeout=settings.startup_probe_timeout_seconds,
+            )
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"LLM 연결 워밍업 시간 초과 ({settings.startup_probe_timeout_seconds}초)"
+            )
+            return None
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """시작 여부와 단계별 워밍업 시간"""
+        return {
+            "started": self.started,
+            "warmup_seconds": dict(self.warmup_seconds),
+            "llm_error": self.llm_error,
+        }
+
+
+# 전역 서비스 컨테이너 인스턴스
+_service_container: Optional[ServiceContainer] = None
+
+
+def get_service_container() -> ServiceContainer:
+    """서비스 컨테이너 싱글톤 인스턴스 반환"""
+    global _service_container
+
+    if _service_container is None:
+        _service_container = ServiceContainer()
+
+    return _service_container
@@ -0,0 +1,106 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class LLMHealthMonitor:
+    """실제 호출 결과와 주기적 프로브 결과로 LLM 가용성을 판단하는 모니터"""
+
+    def __init__(
+        self,
+        window_seconds: float,
+        error_rate_threshold: float,
+        min_samples: int,
+        clock=time.monotonic,
+    ):
+        self.window_seconds = window_seconds
+        self.error_rate_threshold = error_rate_threshold
+        self.min_samples = min_samples
+        self._clock = clock
+        self._outcomes: Deque[Tuple[float, bool]] = deque()
+
+        self.last_probe_ok: Optional[bool] = None
+        self.last_probe_at: Optional[float] = None
+        self.last_probe_error: Optional[str] = None
+
+    def record_success(self) -> None:
+        """실제 LLM 호출 성공 기록"""
+        self._record(True)
+
+    def record_failure(self) -> None:
+        """실제 LLM 호출 실패 기록"""
+        self._record(False)
+
+    def _record(self, ok: bool) -> None:
+        now = self._clock()
+        self._outcomes.append((now, ok))
+        self._expire(now)
+
+    def _expire(self, now: float) -> None:
+        while self._outcomes and self._outcomes[0][0] < now - self.window_seconds:
+            self._outcomes.popleft()
+
+    def passive_stats(self) -> Dict[str, Any]:
+        """최근 실제 호출의 표본 수와 오류율"""
+        self._expire(self._clock())
+        samples = len(self._outcomes)
+        failures = sum(1 for _, ok in self._outcomes if not ok)
+        return {
+            "samples": samples,
+            "error_rate": failures / samples if samples else 0.0,
+        }
+
+    def is_available(self) -> bool:
+        """LLM 가용성 판단 (표본이 충분하면 실제 호출 기준, 아니면 마지막 프로브 기준)"""
+        stats = self.passive_stats()
+        if stats["samples"] >= self.min_samples:
+            return stats["error_rate"] < self.error_rate_threshold
+
+        # 프로브 결과가 없으면 장애 근거가 없으므로 가용으로 간주
+        return self.last_probe_ok is not False
+
+    async def run_probe(self, probe: Callable[[], Awaitable[Any]]) -> bool:
+        """능동 프로브 1회 실행 후 결과 캐싱"""
+        try:
+            await probe()
+            self.last_probe_ok = True
+            self.last_probe_error = None
+        except Exception as e:
+            logger.warning(f"LLM 헬스 프로브 실패: {str(e)}")
+            self.last_probe_ok = False
+            self.last_probe_error = str(e)
+        self.last_probe_at = self._clock()
+        return self.last_probe_ok
+
+    async def run_probe_loop(
+        self,
+        probe: Callable[[], Awaitable[Any]],
+        interval_seconds: float,
+        initial_delay_seconds: float = 0.0,
+    ) -> None:
+        """백그라운드에서 주기적으로 프로브 실행 (첫 프로브는 initial_delay_seconds 후)"""
+        if initial_delay_seconds > 0:
+            await asyncio.sleep(initial_delay_seconds)
+        while True:
+            await self.run_probe(probe)
+            await asyncio.sleep(interval_seconds)
+
+    def get_status(self) -> Dict[str, Any]:
+        """헬스 상태 요약"""
+        return {
+            "available": self.is_available(),
+            "passive": self.passive_stats(),
+            "probe": {
+                "ok": self.last_probe_ok,
+                "age_seconds": (
+                    self._clock() - self.last_probe_at
+                    if self.last_probe_at is not None
+                    else None
+                ),
+                "error": self.last_probe_error,
+            },
+        }
@@ -0,0 +1,75 @@
+import math
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class LatencyTracker:
+    """모델별 최근 응답 지연 시간 추적기"""
+
+    def __init__(self, window_size: int = 200, min_samples: int = 20):
+        self.window_size = window_size
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+
+    def record(self, model: str, seconds: float) -> None:
+        """응답 지연 시간 기록"""
+        samples = self._samples.get(model)
+        if samples is None:
+            samples = self._samples[model] = deque(maxlen=self.window_size)
+        samples.append(seconds)
+
+    def percentile(self, model: str, percent: float) -> Optional[float]:
+        """지연 시간 백분위수 (표본이 부족하면 None)"""
+        samples = self._samples.get(model)
+        if not samples or len(samples) < self.min_samples:
+            return None
+
+        ordered = sorted(samples)
+        index = min(
+            len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1)
+        )
+        return ordered[index]
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """모델별 표본 수와 p50/p95"""
+        return {
+            model: {
+                "samples": len(samples),
+                "p50_seconds": self.percentile(model, 50),
+                "p95_seconds": self.percentile(model, 95),
+            }
+            for model, samples in self._samples.items()
+        }
+
+
+class HedgeBudget:
+    """전체 호출 대비 헤지 요청 비율을 제한하는 예산"""
+
+    def __init__(self, max_ratio: float):
+        self.max_ratio = max_ratio
+        self.calls = 0
+        self.hedged = 0
+        self.hedge_wins = 0
+        # 승인 대기열이 밀려 헤지를 생략한 횟수
+        self.queue_skips = 0
+
+    def record_call(self) -> None:
+        """헤지 대상 호출 1회 기록"""
+        self.calls += 1
+
+    def try_acquire(self) -> bool:
+        """예산 내이면 헤지 1회 사용"""
+        if self.calls == 0 or (self.hedged + 1) / self.calls > self.max_ratio:
+            return False
+        self.hedged += 1
+        return True
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """헤지 사용 지표"""
+        return {
+            "calls": self.calls,
+            "hedged": self.hedged,
+            "hedge_wins": self.hedge_wins,
+            "queue_skips": self.queue_skips,
+            "hedged_ratio": self.hedged / self.calls if self.calls else 0.0,
+        }
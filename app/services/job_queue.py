@@ -0,0 +1,254 @@
+import asyncio
+import json
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from contextlib import closing, contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+from uuid import uuid4
+
+from app.core.config import settings
+from app.schemas.coaching import CoachingResult, ResumePayload
+from app.services.coaching_service import get_coaching_service
+
+logger = logging.getLogger(__name__)
+
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+
+@dataclass
+class CoachingJob:
+    """비동기 코칭 작업 상태"""
+
+    payload: Dict[str, Any]
+    job_id: str = field(default_factory=lambda: uuid4().hex)
+    status: str = QUEUED
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: float = field(default_factory=time.time)
+    updated_at: float = field(default_factory=time.time)
+
+    @property
+    def finished(self) -> bool:
+        """완료(성공/실패) 여부"""
+        return self.status in (SUCCEEDED, FAILED)
+
+
+class JobStore(ABC):
+    """작업 상태 저장소 인터페이스"""
+
+    @abstractmethod
+    async def save(self, job: CoachingJob) -> None:
+        """작업 상태 저장"""
+
+    @abstractmethod
+    async def get(self, job_id: str) -> Optional[CoachingJob]:
+        """작업 조회"""
+
+    @abstractmethod
+    async def list_unfinished(self) -> List[CoachingJob]:
+        """완료되지 않은 작업 목록 (생성 순)"""
+
+
+class MemoryJobStore(JobStore):
+    """프로세스 메모리 작업 저장소 (재시작 시 유실)"""
+
+    def __init__(self):
+        self._jobs: Dict[str, CoachingJob] = {}
+
+    async def save(self, job: CoachingJob) -> None:
+        self._jobs[job.job_id] = job
+
+    async def get(self, job_id: str) -> Optional[CoachingJob]:
+        return self._jobs.get(job_id)
+
+    async def list_unfinished(self) -> List[CoachingJob]:
+        return sorted(
+            (job for job in self._jobs.values() if not job.finished),
+            key=lambda job: job.created_at,
+        )
+
+
+class SQLiteJobStore(JobStore):
+    """SQLite 기반 영구 작업 저장소 (이벤트 루프 차단 방지를 위해 스레드에서 실행)"""
+
+    def __init__(self, path: str):
+        self.path = path
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS coaching_jobs ("
+                "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+                "created_at REAL NOT NULL, data TEXT NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 하나를 실행하는 연결 (종료 시 커밋 후 닫음)"""
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            yield conn
+
+    def _save(self, job: CoachingJob) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO coaching_jobs (job_id, status, created_at, data) "
+                "VALUES (?, ?, ?, ?)",
+                (job.job_id, job.status, job.created_at, json.dumps(asdict(job))),
+            )
+
+    def _get(self, job_id: str) -> Optional[CoachingJob]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT data FROM coaching_jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        return CoachingJob(**json.loads(row[0])) if row else None
+
+    def _list_unfinished(self) -> List[CoachingJob]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT data FROM coaching_jobs WHERE status IN (?, ?) "
+                "ORDER BY created_at",
+                (QUEUED, RUNNING),
+            ).fetchall()
+        return [CoachingJob(**json.loads(row[0])) for row in rows]
+
+    async def save(self, job: CoachingJob) -> None:
+        await asyncio.to_thread(self._save, job)
+
+    async def get(self, job_id: str) -> Optional[CoachingJob]:
+        return await asyncio.to_thread(self._get, job_id)
+
+    async def list_unfinished(self) -> List[CoachingJob]:
+        return await asyncio.to_thread(self._list_unfinished)
+
+
+class CoachingJobQueue:
+    """프로세스 내 큐와 제한된 수의 워커로 코칭 작업을 처리하는 작업 큐"""
+
+    def __init__(
+        self,
+        runner: Callable[[ResumePayload], Awaitable[CoachingResult]],
+        store: JobStore,
+        workers: int,
+    ):
+        self.runner = runner
+        self.store = store
+        self.worker_count = workers
+        self._queue: "asyncio.Queue[str]" = asyncio.Queue()
+        self._workers: List[asyncio.Task] = []
+        self._start_lock = asyncio.Lock()
+
+    @property
+    def running(self) -> bool:
+        """워커 실행 여부"""
+        return bool(self._workers)
+
+    async def start(self) -> None:
+        """저장소의 미완료 작업을 다시 큐에 넣고 워커 시작"""
+        async with self._start_lock:
+            if not self.running:
+                await self._recover_and_start()
+
+    async def _recover_and_start(self) -> None:
+        # 재시작 전에 실행 중이던 작업은 처음부터 다시 실행
+        recovered = await self.store.list_unfinished()
+        for job in recovered:
+            if job.status == RUNNING:
+                job.status = QUEUED
+                job.updated_at = time.time()
+                await self.store.save(job)
+            self._queue.put_nowait(job.job_id)
+        if recovered:
+            logger.info(f"미완료 코칭 작업 {len(recovered)}개 복구")
+
+        self._workers = [
+            asyncio.ensure_future(self._worker()) for _ in range(self.worker_count)
+        ]
+
+    async def stop(self) -> None:
+        """워커 중지 (진행 중인 작업은 다음 시작 시 다시 실행)"""
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def submit(self, payload: ResumePayload) -> CoachingJob:
+        """작업 등록 후 즉시 반환"""
+        # 저장 전에 워커를 시작해야 시작 시 미완료 작업 복구로 같은 작업이 다시 큐에 들어가지 않음
+        await self.start()
+        job = CoachingJob(payload=payload.model_dump())
+        await self.store.save(job)
+        self._queue.put_nowait(job.job_id)
+        logger.info(f"코칭 작업 등록: {job.job_id}")
+        return job
+
+    async def get(self, job_id: str) -> Optional[CoachingJob]:
+        """작업 상태 조회"""
+        return await self.store.get(job_id)
+
+    async def join(self) -> None:
+        """큐에 등록된 작업이 모두 처리될 때까지 대기"""
+        await self._queue.join()
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        # 대기 중인 작업만 실행 (같은 작업이 큐에 중복으로 들어가도 한 번만 실행)
+        job = await self.store.get(job_id)
+        if job is None or job.status != QUEUED:
+            return
+
+        job.status = RUNNING
+        job.updated_at = time.time()
+        await self.store.save(job)
+
+        try:
+            result = await self.runner(ResumePayload(**job.payload))
+            job.status = SUCCEEDED
+            job.result = result.model_dump(mode="json")
+            logger.info(f"코칭 작업 완료: {job_id}")
+        except Exception as e:
+            logger.error(f"코칭 작업 실패 ({job_id}): {str(e)}")
+            job.status = FAILED
+            job.error = str(e)
+
+        job.updated_at = time.time()
+        await self.store.save(job)
+
+
+async def _run_coaching_session(payload: ResumePayload) -> CoachingResult:
+    """코칭 서비스로 세션 생성 (서비스는 첫 작업 실행 시 생성)"""
+    return await get_coaching_service().create_coaching_session(payload)
+
+
+# 전역 작업 큐 인스턴스
+_job_queue: Optional[CoachingJobQueue] = None
+
+
+def get_job_queue() -> CoachingJobQueue:
+    """작업 큐 싱글톤 인스턴스 반환"""
+    global _job_queue
+
+    if _job_queue is None:
+        store = (
+            SQLiteJobStore(settings.job_store_sqlite_path)
+            if settings.job_store_sqlite_path
+            else MemoryJobStore()
+        )
+        _job_queue = CoachingJobQueue(
+            runner=_run_coaching_session,
+            store=store,
+            workers=settings.job_workers,
+        )
+
+    return _job_queue
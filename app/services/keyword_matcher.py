@@ -0,0 +1,108 @@
+import re
+from typing import Dict, FrozenSet, Iterable, Optional, Set
+
+
+def _trie_pattern(keywords: Iterable[str]) -> str:
+    """공통 접두사를 묶은 정규식 (각 위치에서 가장 긴 키워드가 먼저 매칭되도록 탐욕적 구성)"""
+    trie: Dict[str, dict] = {}
+    for keyword in keywords:
+        node = trie
+        for char in keyword:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(char) + build(child)
+            for char, child in sorted(node.items())
+            if char != ""
+        ]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        return f"(?:{body})?" if "" in node else body
+
+    return build(trie)
+
+
+class KeywordMatcher:
+    """
+    여러 범주의 키워드를 정규식 하나로 컴파일해 텍스트 1회 스캔으로 포함된 키워드를 모두 찾는 매처
+
+    겹치지 않는 가장 긴 매칭으로 한 번 스캔한 뒤, 매칭 구간 안에서 다른 키워드가 시작될 수
+    있는 경우에만 그 구간을 다시 검색합니다. 매칭된 키워드의 접두사인 키워드도 포함된 것으로
+    처리하므로 결과는 키워드마다 `keyword in text`를 검사한 것과 같습니다 (대소문자 구분).
+    """
+
+    def __init__(self, categories: Dict[str, Iterable[str]]):
+        self.categories: Dict[str, FrozenSet[str]] = {
+            name: frozenset(keyword for keyword in keywords if keyword)
+            for name, keywords in categories.items()
+        }
+        keywords = set().union(*self.categories.values())
+
+        # 매칭된 키워드 → 같은 위치에서 함께 매칭되는 더 짧은 키워드(접두사)
+        self._implied: Dict[str, FrozenSet[str]] = {}
+        for keyword in keywords:
+            shorter = frozenset(
+                keyword[:end]
+                for end in range(1, len(keyword))
+                if keyword[:end] in keywords
+            )
+            if shorter:
+                self._implied[keyword] = shorter
+
+        # 매칭 구간 안에서 다른 키워드가 시작될 수 있는 키워드 (겹침 검색 필요)
+        prefixes = {
+            keyword[:end] for keyword in keywords for end in range(1, len(keyword))
+        }
+        self._overlapping = frozenset(
+            keyword
+            for keyword in keywords
+            if any(
+                keyword[start:] in prefixes
+                or any(
+                    keyword[start:end] in keywords
+                    for end in range(start + 1, len(keyword) + 1)
+                )
+                for start in range(1, len(keyword))
+            )
+        )
+        self._pattern: Optional[re.Pattern] = (
+            re.compile(_trie_pattern(keywords)) if keywords else None
+        )
+
+    def find(self, text: str) -> FrozenSet[str]:
+        """텍스트에 포함된 모든 키워드"""
+        if self._pattern is None:
+            return frozenset()
+
+        found: Set[str] = set(self._pattern.findall(text))
+        search = self._pattern.search
+        for keyword in self._overlapping & found:
+            # 다른 키워드가 안에서 시작될 수 있는 키워드는 등장 위치마다 구간 안을 다시 검색
+            start = text.find(keyword)
+            while start != -1:
+                end = start + len(keyword)
+                inner = search(text, start + 1)
+                while inner and inner.start() < end:
+                    found.add(inner.group())
+                    inner = search(text, inner.start() + 1)
+                start = text.find(keyword, start + 1)
+
+        for keyword in self._implied.keys() & found:
+            found |= self._implied[keyword]
+        return frozenset(found)
+
+    def count(self, hits: FrozenSet[str], category: str) -> int:
+        """찾은 키워드 중 범주에 속한 키워드 수"""
+        return len(self.categories[category] & hits)
+
+    def has_any(self, hits: FrozenSet[str], category: str) -> bool:
+        """찾은 키워드 중 범주에 속한 키워드가 있는지 여부"""
+        return not self.categories[category].isdisjoint(hits)
+
+    def scan(self, text: str) -> Dict[str, int]:
+        """텍스트 1회 스캔으로 범주별 포함 키워드 수 계산"""
+        hits = self.find(text)
+        return {name: self.count(hits, name) for name in self.categories}
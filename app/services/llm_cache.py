@@ -0,0 +1,225 @@
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from contextlib import closing, contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+def make_cache_key(
+    model: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: Optional[int],
+    response_format: Optional[Dict[str, Any]],
+) -> str:
+    """요청 파라미터의 해시로 콘텐츠 기반 캐시 키 생성"""
+    payload = json.dumps(
+        {
+            "model": model,
+            "prompt": prompt,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+            "response_format": response_format,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CacheBackend(ABC):
+    """LLM 응답 캐시의 영구 저장 계층 인터페이스"""
+
+    @abstractmethod
+    async def get(self, key: str) -> Optional[str]:
+        """만료되지 않은 값 조회"""
+
+    @abstractmethod
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        """TTL과 함께 값 저장"""
+
+
+class MemoryLRUCache:
+    """바이트 크기로 제한되는 프로세스 내 LRU 캐시"""
+
+    def __init__(self, max_bytes: int, clock=time.monotonic):
+        self.max_bytes = max_bytes
+        self.current_bytes = 0
+        self._clock = clock
+        self._entries: "OrderedDict[str, Tuple[str, float, int]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> Optional[str]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at, _ = entry
+        if expires_at <= self._clock():
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        size = len(key) + len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+
+        if key in self._entries:
+            self._remove(key)
+
+        self._entries[key] = (value, self._clock() + ttl_seconds, size)
+        self.current_bytes += size
+
+        # 가장 오래 사용되지 않은 항목부터 제거
+        while self.current_bytes > self.max_bytes:
+            oldest_key = next(iter(self._entries))
+            self._remove(oldest_key)
+
+    def _remove(self, key: str) -> None:
+        _, _, size = self._entries.pop(key)
+        self.current_bytes -= size
+
+
+class SQLiteCacheBackend(CacheBackend):
+    """
+    SQLite 기반 영구 캐시 계층 (이벤트 루프 차단 방지를 위해 스레드에서 실행)
+
+    만료 항목은 조회 시 제외하고, 테이블 정리는 sweep_interval_seconds마다 한 번만 실행합니다.
+    """
+
+    def __init__(
+        self, path: str, sweep_interval_seconds: float = 300.0, clock=time.monotonic
+    ):
+        self.path = path
+        self.sweep_interval_seconds = sweep_interval_seconds
+        self._clock = clock
+        self._last_sweep_at = clock()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """트랜잭션 하나를 실행하는 연결 (종료 시 커밋 후 닫음)"""
+        with closing(sqlite3.connect(self.path)) as conn, conn:
+            yield conn
+
+    def _get(self, key: str) -> Optional[str]:
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM llm_cache WHERE key = ? AND expires_at > ?",
+                (key, time.time()),
+            ).fetchone()
+        return row[0] if row else None
+
+    def _set(self, key: str, value: str, ttl_seconds: float) -> None:
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, time.time() + ttl_seconds),
+            )
+            if self._clock() - self._last_sweep_at >= self.sweep_interval_seconds:
+                self._last_sweep_at = self._clock()
+                conn.execute(
+                    "DELETE FROM llm_cache WHERE expires_at <= ?", (time.time(),)
+                )
+
+    async def get(self, key: str) -> Optional[str]:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str, ttl_seconds: float) -> None:
+        await asyncio.to_thread(self._set, key, value, ttl_seconds)
+
+
+class LLMResponseCache:
+    """메모리 LRU 계층과 선택적 영구 계층으로 구성된 LLM 응답 캐시"""
+
+    def __init__(
+        self,
+        max_bytes: int,
+        ttl_seconds: float,
+        backend: Optional[CacheBackend] = None,
+    ):
+        self.memory = MemoryLRUCache(max_bytes)
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+        self.memory_hits = 0
+        self.backend_hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> Optional[str]:
+        """메모리 → 영구 계층 순으로 조회"""
+        value = self.memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+
+        if self.backend is not None:
+            try:
+                value = await self.backend.get(key)
+            except Exception as e:
+                logger.warning(f"영구 캐시 조회 실패: {str(e)}")
+                value = None
+
+            if value is not None:
+                self.backend_hits += 1
+                self.memory.set(key, value, self.ttl_seconds)
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        """모든 계층에 저장 (영구 계층 실패는 무시)"""
+        self.memory.set(key, value, self.ttl_seconds)
+
+        if self.backend is not None:
+            try:
+                await self.backend.set(key, value, self.ttl_seconds)
+            except Exception as e:
+                logger.warning(f"영구 캐시 저장 실패: {str(e)}")
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """캐시 적중/미스 지표 반환"""
+        lookups = self.memory_hits + self.backend_hits + self.misses
+        hits = self.memory_hits + self.backend_hits
+        return {
+            "memory_hits": self.memory_hits,
+            "backend_hits": self.backend_hits,
+            "misses": self.misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "memory_entries": len(self.memory),
+            "memory_bytes": self.memory.current_bytes,
+        }
+
+
+def create_llm_response_cache(settings) -> Optional[LLMResponseCache]:
+    """설정에 따라 LLM 응답 캐시 생성 (비활성화 시 None)"""
+    if not settings.llm_cache_enabled:
+        return None
+
+    backend = None
+    if settings.llm_cache_sqlite_path:
+        backend = SQLiteCacheBackend(settings.llm_cache_sqlite_path)
+
+    return LLMResponseCache(
+        max_bytes=settings.llm_cache_max_bytes,
+        ttl_seconds=settings.llm_cache_ttl_seconds,
+        backend=backend,
+    )
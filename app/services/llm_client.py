@@ -1,8 +1,23 @@
 import asyncio
+import json
 import logging
-from typing import Dict, Any, Optional
-from openai import AsyncOpenAI
+import time
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Dict, Any, Optional
 from app.core.config import settings
+from app.core.deadline import Deadline, current_deadline
+from app.services.circuit_breaker import CircuitBreaker, OPEN
+from app.services.health_monitor import LLMHealthMonitor
+from app.services.hedging import HedgeBudget, LatencyTracker
+from app.services.llm_cache import create_llm_response_cache, make_cache_key
+from app.services.llm_providers import CompletionResponse, create_llm_provider
+from app.services.rate_limiter import (
+    AdmissionTimeoutError,
+    LLMAdmissionController,
+    admission_key,
+    estimate_tokens,
+)
+from app.services.stream_parser import parse_llm_json
 
 logger = logging.getLogger(__name__)
 
@@ -13,17 +28,79 @@ class LLMClientError(Exception):
     pass
 
 
+class CircuitOpenError(LLMClientError):
+    """서킷 브레이커가 열려 요청이 즉시 거부된 경우"""
+
+    pass
+
+
+class DeadlineExceededError(LLMClientError):
+    """요청 데드라인 내에 LLM 응답을 받을 수 없는 경우"""
+
+    pass
+
+
+def build_json_prompt(prompt: str) -> str:
+    """JSON 응답을 명시적으로 요청하는 프롬프트 수정"""
+    return f"""{prompt}
+
+중요: 반드시 유효한 JSON 형식으로만 응답해야 합니다. 다른 설명이나 텍스트는 포함하지 마세요."""
+
+
+def is_valid_json_response(content: str) -> bool:
+    """응답을 JSON으로 파싱할 수 있는지 확인"""
+    try:
+        parse_llm_json(content)
+    except json.JSONDecodeError:
+        return False
+    return True
+
+
 class LLMClient:
-    """OpenAI API와의 비동기 통신을 담당하는 클라이언트"""
+    """LLM 공급자와의 비동기 통신을 담당하는 클라이언트"""
 
     def __init__(self):
-        if not settings.openai_api_key:
+        if settings.llm_provider == "openai" and not settings.openai_api_key:
             raise LLMClientError("OpenAI API key가 설정되지 않았습니다.")
 
-        self.client = AsyncOpenAI(api_key=settings.openai_api_key)
+        # 설정에 따라 OpenAI 또는 로컬 모의 공급자 사용
+        self.provider = create_llm_provider(settings)
         self.max_retries = 3
         self.base_delay = 1.0  # 초기 재시도 지연 시간 (초)
 
+        # 동시성·요청률·토큰률 제한 승인 계층
+        self.admission = LLMAdmissionController(
+            max_concurrency=settings.llm_max_concurrency,
+            requests_per_minute=settings.llm_requests_per_minute,
+            tokens_per_minute=settings.llm_tokens_per_minute,
+        )
+
+        # 동일 요청 응답 캐시 (비활성화 시 None)
+        self.response_cache = create_llm_response_cache(settings)
+
+        # 실제 호출 결과 기반 가용성 모니터 (능동 프로브는 백그라운드에서만 실행)
+        self.health_monitor = LLMHealthMonitor(
+            window_seconds=settings.health_window_seconds,
+            error_rate_threshold=settings.health_error_rate_threshold,
+            min_samples=settings.health_min_samples,
+        )
+        self._health_probe_task: Optional[asyncio.Task] = None
+
+        # 장애 시 재시도 대기 없이 즉시 실패시키는 서킷 브레이커
+        self.circuit_breaker = CircuitBreaker(
+            failure_rate_threshold=settings.circuit_breaker_failure_rate,
+            window_size=settings.circuit_breaker_window_size,
+            min_calls=settings.circuit_breaker_min_calls,
+            open_seconds=settings.circuit_breaker_open_seconds,
+            half_open_max_calls=settings.circuit_breaker_half_open_max_calls,
+        )
+
+        # 꼬리 지연 감소를 위한 헤지 요청 (모델별 지연 시간 기준)
+        self.latency_tracker = LatencyTracker(
+            min_samples=settings.llm_hedging_min_samples
+        )
+        self.hedge_budget = HedgeBudget(settings.llm_hedging_max_ratio)
+
     async def _retry_with_exponential_backoff(self, func, *args, **kwargs) -> Any:
         """지수 백오프를 사용한 재시도 메커니즘"""
         last_exception = None
@@ -35,12 +112,27 @@ class LLMClient:
             except Exception as e:
                 last_exception = e
 
-                # 재시도 가능한 오류인지 확인
-                if not self._is_retryable_error(e):
+                # 재시도 가능한 오류인지 확인 (브레이커 열림·데드라인 초과는 즉시 실패)
+                if isinstance(
+                    e, (CircuitOpenError, DeadlineExceededError)
+                ) or not self._is_retryable_error(e):
                     raise e
 
                 if attempt < self.max_retries - 1:
                     delay = self.base_delay * (2**attempt)
+
+                    # 대기 후 재시도해도 데드라인 안에 끝날 수 없으면 재시도 생략
+                    deadline = current_deadline.get()
+                    if (
+                        deadline is not None
+                        and deadline.remaining()
+                        < delay + settings.llm_min_attempt_seconds
+                    ):
+                        logger.warning(
+                            f"데드라인까지 {deadline.remaining():.1f}초 남아 재시도를 생략합니다."
+                        )
+                        raise DeadlineExceededError(f"데드라인 내 재시도 불가: {str(e)}")
+
                     logger.warning(
                         f"LLM API 호출 실패 (시도 {attempt + 1}/{self.max_retries}). "
                         f"{delay}초 후 재시도합니다. 오류: {str(e)}"
@@ -75,6 +167,9 @@ class LLMClient:
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
         response_format: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+        cache_validator: Optional[Callable[[str], bool]] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         프롬프트를 기반으로 텍스트 생성
@@ -85,10 +180,14 @@ class LLMClient:
             temperature: 창의성 수준 (0.0-2.0)
             max_tokens: 최대 토큰 수
             response_format: 응답 형식 (JSON 등)
+            deadline: 요청 데드라인 (없으면 현재 컨텍스트의 데드라인 사용)
+            cache_validator: 응답 캐시 저장 전 검증 함수 (호출자의 파서가 받아들이는 응답만 저장)
+            use_cache: False이면 캐시를 조회하지 않고 새로 생성 (새 응답은 캐시에 저장)
 
         Returns:
             생성된 텍스트
         """
+        deadline_token = current_deadline.set(deadline or current_deadline.get())
         try:
             messages = [{"role": "user", "content": prompt}]
 
@@ -104,27 +203,231 @@ class LLMClient:
             if response_format:
                 kwargs["response_format"] = response_format
 
+            # 동일 요청은 캐시에서 즉시 반환
+            cache_key = None
+            if self.response_cache is not None:
+                cache_key = make_cache_key(
+                    model, prompt, temperature, max_tokens, response_format
+                )
+                cached = await self.response_cache.get(cache_key) if use_cache else None
+                if cached is not None:
+                    logger.info("LLM 응답 캐시 적중")
+                    return cached
+
             response = await self._retry_with_exponential_backoff(
-                self.client.chat.completions.create, **kwargs
+                self._admitted_completion, **kwargs
             )
 
-            content = response.choices[0].message.content
+            content = response.content
             if not content:
                 raise LLMClientError("LLM이 빈 응답을 반환했습니다.")
 
             logger.info(f"LLM 응답 생성 완료. 토큰 사용량: {response.usage}")
-            return content.strip()
+            content = content.strip()
+
+            if cache_key is not None and self._is_cacheable(
+                response, content, response_format, cache_validator
+            ):
+                await self.response_cache.set(cache_key, content)
+
+            return content
+
+        except (CircuitOpenError, DeadlineExceededError):
+            raise
 
         except Exception as e:
             logger.error(f"LLM completion 생성 실패: {str(e)}")
             raise LLMClientError(f"텍스트 생성 중 오류 발생: {str(e)}")
 
+        finally:
+            current_deadline.reset(deadline_token)
+
+    def _is_cacheable(
+        self,
+        response: CompletionResponse,
+        content: str,
+        response_format: Optional[Dict[str, Any]],
+        cache_validator: Optional[Callable[[str], bool]],
+    ) -> bool:
+        """
+        응답 캐시 저장 여부 판단
+
+        잘리거나 파싱할 수 없는 응답을 캐시하면 같은 이력서의 반복 요청이 TTL 동안
+        대체 콘텐츠로 고정되므로, 검증 함수(없으면 JSON 모드의 JSON 파싱)를 통과한 응답만 저장합니다.
+        """
+        if response.finish_reason == "length":
+            logger.warning("max_tokens에서 잘린 LLM 응답은 캐시하지 않습니다.")
+            return False
+
+        if cache_validator is not None:
+            valid = cache_validator(content)
+        elif response_format and response_format.get("type") == "json_object":
+            valid = is_valid_json_response(content)
+        else:
+            valid = True
+
+        if not valid:
+            logger.warning("검증에 실패한 LLM 응답은 캐시하지 않습니다.")
+        return valid
+
+    async def _admitted_completion(self, **kwargs) -> Any:
+        """승인 계층을 통과한 뒤 LLM 공급자 호출 (재시도 시도마다 새로 승인, 설정 시 헤지 요청 사용)"""
+        prompt = kwargs["messages"][-1]["content"]
+        estimated_tokens = estimate_tokens(prompt, kwargs.get("max_tokens"))
+
+        deadline = current_deadline.get()
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededError("요청 데드라인이 지나 LLM 호출을 생략합니다.")
+
+        if settings.llm_hedging_enabled:
+            return await self._hedged_create(estimated_tokens, **kwargs)
+        return await self._admit_and_create(estimated_tokens, **kwargs)
+
+    async def _hedged_create(self, estimated_tokens: int, **kwargs) -> Any:
+        """첫 요청이 지연 백분위수 안에 끝나지 않으면 중복 요청을 보내고 먼저 끝난 결과 사용"""
+        self.hedge_budget.record_call()
+        hedge_delay = self.latency_tracker.percentile(
+            kwargs["model"], settings.llm_hedging_percentile
+        )
+
+        primary = asyncio.ensure_future(
+            self._admit_and_create(estimated_tokens, **kwargs)
+        )
+        tasks = [primary]
+        try:
+            if hedge_delay is None:
+                return await primary
+
+            done, _ = await asyncio.wait(tasks, timeout=hedge_delay)
+            if done:
+                return await primary
+            if self.admission.limiter.waiting > 0:
+                # 승인 대기열이 밀려 있으면 헤지 요청도 대기열 뒤에 서므로 보내지 않음
+                self.hedge_budget.queue_skips += 1
+                return await primary
+            if not self.hedge_budget.try_acquire():
+                return await primary
+
+            logger.info(f"LLM 응답 지연 ({hedge_delay:.2f}초 초과), 헤지 요청 전송")
+            hedge = asyncio.ensure_future(
+                self._admit_and_create(estimated_tokens, **kwargs)
+            )
+            tasks.append(hedge)
+
+            # 먼저 성공한 응답을 사용하고, 둘 다 실패하면 마지막 오류 전달
+            pending = set(tasks)
+            last_error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.hedge_budget.hedge_wins += 1
+                        return task.result()
+                    last_error = task.exception()
+            raise last_error
+        finally:
+            # 남은 요청을 취소하고 승인 슬롯과 브레이커 허가가 반환될 때까지 대기
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _admit_and_create(self, estimated_tokens: int, **kwargs) -> Any:
+        """승인 대기 후 chat completion 호출"""
+        async with self._admit(estimated_tokens, current_deadline.get()):
+            return await self._guarded_complete(**kwargs)
+
+    @asynccontextmanager
+    async def _admit(self, estimated_tokens: int, deadline: Optional[Deadline]):
+        """
+        데드라인까지 남은 시간 안에서만 승인 대기 (데드라인이 없으면 무제한)
+
+        승인 대기는 시도별 타임아웃과 브레이커/헬스 집계에서 제외합니다. 로컬 대기열이 밀린 것은
+        공급자 장애가 아니므로 DeadlineExceededError로만 알립니다.
+        """
+        try:
+            async with self.admission.admit(
+                admission_key.get(),
+                estimated_tokens,
+                timeout=deadline.remaining() if deadline is not None else None,
+            ):
+                yield
+        except AdmissionTimeoutError:
+            raise DeadlineExceededError("요청 데드라인 내에 LLM 요청 승인을 받지 못했습니다.")
+
+    async def _guarded_complete(self, **kwargs) -> Any:
+        """
+        서킷 브레이커 허가를 받아 공급자 호출
+
+        승인 이후에 허가를 받으므로 half-open 프로브 슬롯이 로컬 대기열에서 점유되지 않으며,
+        시도별 타임아웃(데드라인까지 남은 시간으로 축소)과 헬스/브레이커 집계는 공급자 호출에만 적용합니다.
+        """
+        deadline = current_deadline.get()
+        attempt_timeout = settings.llm_request_timeout_seconds
+        if deadline is not None:
+            if deadline.expired:
+                raise DeadlineExceededError("요청 데드라인이 지나 LLM 호출을 생략합니다.")
+            attempt_timeout = deadline.timeout(attempt_timeout)
+
+        permit = self.circuit_breaker.allow_request()
+        if permit is None:
+            raise CircuitOpenError("LLM 서킷 브레이커가 열려 있어 요청을 거부합니다.")
+
+        started_at = time.monotonic()
+        try:
+            response = await asyncio.wait_for(
+                self.provider.complete(**kwargs), attempt_timeout
+            )
+        except asyncio.CancelledError:
+            self.circuit_breaker.release(permit)
+            raise
+        except asyncio.TimeoutError:
+            if deadline is not None and deadline.expired:
+                self.circuit_breaker.release(permit)
+                raise DeadlineExceededError("요청 데드라인 내에 LLM 응답을 받지 못했습니다.")
+            self.health_monitor.record_failure()
+            self.circuit_breaker.record_failure(permit)
+            raise LLMClientError(f"LLM API 응답 timeout ({attempt_timeout:.1f}초)")
+        except Exception as e:
+            if self._is_retryable_error(e):
+                self.health_monitor.record_failure()
+                self.circuit_breaker.record_failure(permit)
+            else:
+                # 요청 오류 등은 공급자 상태를 알려주지 않으므로 헬스에 기록하지 않고 허가만 반환
+                self.circuit_breaker.release(permit)
+            raise
+
+        # 승인 대기를 제외한 공급자 응답 시간만 헤지 기준 지연으로 기록
+        self.latency_tracker.record(kwargs["model"], time.monotonic() - started_at)
+        self.health_monitor.record_success()
+        self.circuit_breaker.record_success(permit)
+        return response
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """LLM 클라이언트 운영 지표 반환"""
+        metrics = {
+            "admission": self.admission.get_metrics(),
+            "health": self.health_monitor.get_status(),
+            "circuit_breaker": self.circuit_breaker.get_status(),
+            "latency": self.latency_tracker.get_metrics(),
+            "hedging": self.hedge_budget.get_metrics(),
+        }
+        if self.response_cache is not None:
+            metrics["response_cache"] = self.response_cache.get_metrics()
+        return metrics
+
     async def generate_json_completion(
         self,
         prompt: str,
         model: str = "gpt-3.5-turbo-1106",  # JSON 모드 지원 모델
         temperature: float = 0.7,
         max_tokens: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+        cache_validator: Optional[Callable[[str], bool]] = None,
+        use_cache: bool = True,
     ) -> str:
         """
         JSON 형식으로 응답을 요청하는 completion 생성
@@ -134,38 +437,147 @@ class LLMClient:
             model: JSON 모드를 지원하는 모델명
             temperature: 창의성 수준
             max_tokens: 최대 토큰 수
+            deadline: 요청 데드라인
+            cache_validator: 응답 캐시 저장 전 검증 함수 (없으면 JSON 파싱 가능 여부)
+            use_cache: False이면 캐시를 조회하지 않고 새로 생성
 
         Returns:
             JSON 형식의 문자열
         """
-        # JSON 응답을 명시적으로 요청하는 프롬프트 수정
-        json_prompt = f"""{prompt}
-
-중요: 반드시 유효한 JSON 형식으로만 응답해야 합니다. 다른 설명이나 텍스트는 포함하지 마세요."""
-
         return await self.generate_completion(
-            prompt=json_prompt,
+            prompt=build_json_prompt(prompt),
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
             response_format={"type": "json_object"},
+            deadline=deadline,
+            cache_validator=cache_validator,
+            use_cache=use_cache,
         )
 
+    async def stream_completion(
+        self,
+        prompt: str,
+        model: str = "gpt-3.5-turbo",
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        response_format: Optional[Dict[str, Any]] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[str]:
+        """
+        프롬프트를 기반으로 생성되는 텍스트를 조각 단위로 스트리밍
+
+        일부 응답이 이미 전달된 뒤에는 다시 시도할 수 없으므로 재시도와 캐시를 사용하지 않고,
+        승인 계층과 서킷 브레이커만 적용합니다. 조각 간 대기 시간은
+        llm_request_timeout_seconds와 데드라인까지 남은 시간으로 제한합니다.
+
+        Yields:
+            생성된 텍스트 조각
+        """
+        deadline = deadline or current_deadline.get()
+        if deadline is not None and deadline.expired:
+            raise DeadlineExceededError("요청 데드라인이 지나 LLM 호출을 생략합니다.")
+
+        kwargs = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "temperature": temperature,
+        }
+        if max_tokens:
+            kwargs["max_tokens"] = max_tokens
+        if response_format:
+            kwargs["response_format"] = response_format
+
+        estimated_tokens = estimate_tokens(prompt, max_tokens)
+        async with self._admit(estimated_tokens, deadline):
+            # 승인 이후에 허가를 받아 half-open 프로브 슬롯을 대기열에서 점유하지 않음
+            permit = self.circuit_breaker.allow_request()
+            if permit is None:
+                raise CircuitOpenError("LLM 서킷 브레이커가 열려 있어 요청을 거부합니다.")
+
+            try:
+                chunks = self.provider.stream(**kwargs).__aiter__()
+                while True:
+                    chunk_timeout = settings.llm_request_timeout_seconds
+                    if deadline is not None:
+                        chunk_timeout = deadline.timeout(chunk_timeout)
+                    try:
+                        chunk = await asyncio.wait_for(
+                            chunks.__anext__(), chunk_timeout
+                        )
+                    except StopAsyncIteration:
+                        break
+                    yield chunk
+            except (asyncio.CancelledError, GeneratorExit):
+                self.circuit_breaker.release(permit)
+                raise
+            except asyncio.TimeoutError:
+                if deadline is not None and deadline.expired:
+                    self.circuit_breaker.release(permit)
+                    raise DeadlineExceededError("요청 데드라인 내에 LLM 응답을 받지 못했습니다.")
+                self.health_monitor.record_failure()
+                self.circuit_breaker.record_failure(permit)
+                raise LLMClientError("LLM 스트리밍 응답 timeout")
+            except Exception as e:
+                logger.error(f"LLM 스트리밍 실패: {str(e)}")
+                if self._is_retryable_error(e):
+                    self.health_monitor.record_failure()
+                    self.circuit_breaker.record_failure(permit)
+                else:
+                    self.circuit_breaker.release(permit)
+                raise LLMClientError(f"스트리밍 생성 중 오류 발생: {str(e)}")
+
+            self.health_monitor.record_success()
+            self.circuit_breaker.record_success(permit)
+
+    async def stream_json_completion(
+        self,
+        prompt: str,
+        model: str = "gpt-3.5-turbo-1106",  # JSON 모드 지원 모델
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        deadline: Optional[Deadline] = None,
+    ) -> AsyncIterator[str]:
+        """JSON 형식으로 응답을 요청하는 스트리밍 completion"""
+        async for delta in self.stream_completion(
+            prompt=build_json_prompt(prompt),
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            response_format={"type": "json_object"},
+            deadline=deadline,
+        ):
+            yield delta
+
     async def health_check(self) -> bool:
-        """LLM 서비스 상태 확인"""
-        try:
-            test_response = await self.generate_completion(
-                prompt="테스트 메시지입니다. '정상'이라고 답해주세요.",
-                model="gpt-3.5-turbo",
-                temperature=0.1,
-                max_tokens=10,
+        """LLM 서비스 상태 확인 (최근 호출 결과와 캐시된 프로브 결과 기준, 과금 없음)"""
+        return self.circuit_breaker.state != OPEN and self.health_monitor.is_available()
+
+    async def probe(self) -> None:
+        """과금되지 않는 요청(모델 목록 조회 등)으로 공급자 연결 확인"""
+        await self.provider.probe()
+
+    def start_health_probe(self, initial_delay_seconds: float = 0.0) -> None:
+        """백그라운드 능동 프로브 시작"""
+        if self._health_probe_task is None or self._health_probe_task.done():
+            self._health_probe_task = asyncio.ensure_future(
+                self.health_monitor.run_probe_loop(
+                    self.probe,
+                    settings.health_probe_interval_seconds,
+                    initial_delay_seconds,
+                )
             )
 
-            return "정상" in test_response
+    async def close(self) -> None:
+        """공급자 HTTP 연결 풀 정리"""
+        await self.provider.close()
 
-        except Exception as e:
-            logger.error(f"LLM 헬스체크 실패: {str(e)}")
-            return False
+    async def stop_health_probe(self) -> None:
+        """백그라운드 능동 프로브 중지"""
+        if self._health_probe_task is not None:
+            self._health_probe_task.cancel()
+            await asyncio.gather(self._health_probe_task, return_exceptions=True)
+            self._health_probe_task = None
 
 
 # 전역 LLM 클라이언트 인스턴스
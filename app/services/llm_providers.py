@@ -0,0 +1,242 @@
+import asyncio
+import json
+import math
+import random
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Any, AsyncIterator, Dict, Optional
+
+from openai import AsyncOpenAI
+
+from app.services.rate_limiter import CHARS_PER_TOKEN
+
+
+@dataclass
+class CompletionResponse:
+    """공급자와 무관한 completion 응답"""
+
+    content: Optional[str]
+    usage: Any = None
+    finish_reason: Optional[str] = None  # length이면 max_tokens에서 잘린 응답
+
+
+class LLMProvider(ABC):
+    """LLM 공급자 인터페이스 (재시도, 승인, 캐시 등은 LLMClient가 담당)"""
+
+    name: str = "base"
+
+    @abstractmethod
+    async def complete(self, **kwargs) -> CompletionResponse:
+        """chat completion 1회 호출 (kwargs는 OpenAI chat completion 파라미터)"""
+
+    @abstractmethod
+    def stream(self, **kwargs) -> AsyncIterator[str]:
+        """chat completion을 텍스트 조각 단위로 스트리밍"""
+
+    @abstractmethod
+    async def probe(self) -> None:
+        """과금 없는 연결 확인 (실패 시 예외)"""
+
+    async def close(self) -> None:
+        """공급자가 연 연결 정리 (연결이 없으면 아무 작업 없음)"""
+
+
+class OpenAIProvider(LLMProvider):
+    """OpenAI API 공급자"""
+
+    name = "openai"
+
+    def __init__(self, api_key: str, timeout: float):
+        # 재시도와 타임아웃은 LLMClient에서 직접 제어 (SDK 내부 재시도 비활성화)
+        self.client = AsyncOpenAI(api_key=api_key, max_retries=0, timeout=timeout)
+
+    async def complete(self, **kwargs) -> CompletionResponse:
+        response = await self.client.chat.completions.create(**kwargs)
+        choice = response.choices[0]
+        return CompletionResponse(
+            content=choice.message.content,
+            usage=response.usage,
+            finish_reason=choice.finish_reason,
+        )
+
+    async def stream(self, **kwargs) -> AsyncIterator[str]:
+        stream = await self.client.chat.completions.create(stream=True, **kwargs)
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            if delta:
+                yield delta
+
+    async def probe(self) -> None:
+        await self.client.models.list()
+
+    async def close(self) -> None:
+        await self.client.close()
+
+
+class MockProviderError(Exception):
+    """모의 공급자가 주입한 오류 (재시도 대상 오류로 분류되는 메시지 사용)"""
+
+    pass
+
+
+class MockLLMProvider(LLMProvider):
+    """
+    부하 테스트와 오버헤드 측정을 위한 로컬 모의 공급자
+
+    프롬프트 종류(면접 질문/학습 경로)에 맞는 스키마 유효 JSON을 반환하며,
+    지연 시간 분포(fixed, uniform, normal, lognormal)와 오류율을 설정할 수 있습니다.
+    seed를 지정하면 지연 시간과 오류 발생 순서가 재현됩니다.
+    """
+
+    name = "mock"
+
+    def __init__(
+        self,
+        latency_seconds: float = 0.0,
+        latency_spread: float = 0.0,
+        latency_distribution: str = "fixed",
+        error_rate: float = 0.0,
+        seed: Optional[int] = None,
+        stream_chunk_size: int = 16,
+    ):
+        if latency_distribution not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"지원하지 않는 지연 시간 분포: {latency_distribution}")
+
+        self.latency_seconds = latency_seconds
+        self.latency_spread = latency_spread
+        self.latency_distribution = latency_distribution
+        self.error_rate = error_rate
+        self.stream_chunk_size = stream_chunk_size
+        self._random = random.Random(seed)
+
+        self.calls = 0
+        self.errors = 0
+
+    def sample_latency(self) -> float:
+        """설정된 분포에서 지연 시간 1회 추출"""
+        if self.latency_distribution == "uniform":
+            latency = self._random.uniform(
+                self.latency_seconds - self.latency_spread,
+                self.latency_seconds + self.latency_spread,
+            )
+        elif self.latency_distribution == "normal":
+            latency = self._random.gauss(self.latency_seconds, self.latency_spread)
+        elif self.latency_distribution == "lognormal":
+            # latency_seconds를 중앙값, latency_spread를 로그 표준편차로 사용
+            latency = self.latency_seconds * self._random.lognormvariate(
+                0.0, self.latency_spread
+            )
+        else:
+            latency = self.latency_seconds
+        return max(0.0, latency)
+
+    def _maybe_fail(self) -> None:
+        if self.error_rate > 0 and self._random.random() < self.error_rate:
+            self.errors += 1
+            raise MockProviderError("503 service unavailable (mock provider)")
+
+    def _usage(self, prompt: str, content: str) -> Dict[str, int]:
+        prompt_tokens = math.ceil(len(prompt) / CHARS_PER_TOKEN)
+        completion_tokens = math.ceil(len(content) / CHARS_PER_TOKEN)
+        return {
+            "prompt_tokens": prompt_tokens,
+            "completion_tokens": completion_tokens,
+            "total_tokens": prompt_tokens + completion_tokens,
+        }
+
+    async def complete(self, **kwargs) -> CompletionResponse:
+        self.calls += 1
+        prompt = kwargs["messages"][-1]["content"]
+        await asyncio.sleep(self.sample_latency())
+        self._maybe_fail()
+
+        content = build_mock_content(prompt)
+        return CompletionResponse(content=content, usage=self._usage(prompt, content))
+
+    async def stream(self, **kwargs) -> AsyncIterator[str]:
+        self.calls += 1
+        prompt = kwargs["messages"][-1]["content"]
+        content = build_mock_content(prompt)
+        chunk_count = max(1, -(-len(content) // self.stream_chunk_size))
+
+        # 전체 지연 시간을 조각 수만큼 나누어 점진적으로 전달
+        latency = self.sample_latency()
+        self._maybe_fail()
+        for start in range(0, len(content), self.stream_chunk_size):
+            await asyncio.sleep(latency / chunk_count)
+            yield content[start : start + self.stream_chunk_size]
+
+    async def probe(self) -> None:
+        return None
+
+
+def build_mock_content(prompt: str) -> str:
+    """프롬프트 종류에 맞는 스키마 유효 JSON 응답 생성"""
+    if '"interview_questions"' in prompt:
+        return json.dumps(
+            {
+                "interview_questions": [
+                    {
+                        "question": f"담당하신 시스템에서 장애가 발생했던 사례 {i + 1}을 들어, 원인 분석과 해결 과정, 그리고 재발 방지를 위해 어떤 구조적 개선을 하셨는지 설명해주세요?",
+                        "intent": "실무 문제 해결 능력과 시스템 설계 역량을 평가합니다",
+                        "category": category,
+                    }
+                    for i, category in enumerate(
+                        [
+                            "Technical Deep-Dive",
+                            "System Design",
+                            "Problem Solving",
+                            "Behavioral",
+                            "Career Vision",
+                        ]
+                    )
+                ]
+            },
+            ensure_ascii=False,
+        )
+
+    if '"learning_path"' in prompt:
+        return json.dumps(
+            {
+                "learning_path": {
+                    "summary": "현재 경험을 바탕으로 분산 시스템 설계와 운영 역량을 단계적으로 강화하는 학습 경로입니다.",
+                    "steps": [
+                        {
+                            "title": title,
+                            "description": f"{title}을 위해 사이드 프로젝트를 구현하고 결과를 문서로 정리합니다",
+                            "resources": ["분산 시스템 설계", "성능 최적화", "장애 대응"],
+                        }
+                        for title in [
+                            "분산 트랜잭션 프로젝트 구축",
+                            "관측 가능성 도입",
+                            "대용량 트래픽 부하 테스트",
+                        ]
+                    ],
+                }
+            },
+            ensure_ascii=False,
+        )
+
+    return json.dumps({"result": "mock response"})
+
+
+def create_llm_provider(settings) -> LLMProvider:
+    """설정에 따라 LLM 공급자 생성"""
+    if settings.llm_provider == "mock":
+        return MockLLMProvider(
+            latency_seconds=settings.llm_mock_latency_seconds,
+            latency_spread=settings.llm_mock_latency_spread,
+            latency_distribution=settings.llm_mock_latency_distribution,
+            error_rate=settings.llm_mock_error_rate,
+            seed=settings.llm_mock_seed,
+        )
+
+    if settings.llm_provider == "openai":
+        return OpenAIProvider(
+            api_key=settings.openai_api_key,
+            timeout=settings.llm_request_timeout_seconds,
+        )
+
+    raise ValueError(f"지원하지 않는 LLM 공급자: {settings.llm_provider}")
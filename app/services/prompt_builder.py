@@ -1,50 +1,100 @@
 import json
-from typing import List
+from string import Formatter
+from typing import Any, Dict, List, Optional, Tuple
 from app.schemas.coaching import ResumePayload
-
-
-class PromptBuilder:
-    """고급 프롬프트 엔지니어링을 위한 빌더 클래스"""
-
-    def __init__(self):
-        self.personas = {
-            "senior_engineer": "15년 이상의 경력을 가진 실리콘밸리 테크 기업의 시니어 백엔드 엔지니어이자 채용 면접관",
-            "tech_lead": "10년 경력의 기술 리더로서 팀 관리와 아키텍처 설계 경험이 풍부한 전문가",
-            "startup_cto": "빠르게 성장하는 스타트업의 CTO로서 기술적 도전과 비즈니스 요구사항의 균형을 맞춘 경험이 있는 리더",
-            "faang_staff": "FAANG 기업의 Staff Engineer로서 대규모 분산 시스템과 고가용성 아키텍처 설계에 전문성을 가진 시니어 엔지니어",
-            "platform_architect": "대기업의 플랫폼 아키텍트로서 마이크로서비스, 클라우드 네이티브, DevOps 전반에 깊은 경험을 가진 전문가",
-        }
-
-        self.question_strategies = {
-            "behavioral_heavy": "행동 중심 질문에 중점을 두어 팀워크와 리더십을 평가",
-            "technical_deep": "기술적 깊이를 중점적으로 파악하는 심화 기술 질문",
-            "system_design": "시스템 설계와 아키텍처 능력을 중점적으로 평가",
-            "problem_solving": "문제 해결 과정과 사고력을 중점적으로 평가",
-            "balanced": "기술, 행동, 시스템 설계를 균형있게 평가",
-        }
-
-    def build_interview_questions_prompt(
-        self, resume_data: ResumePayload, persona_type: str = None, strategy: str = None
-    ) -> str:
-        """면접 질문 생성을 위한 고급 프롬프트 구성"""
-
-        # 적응형 페르소나 선택
-        selected_persona = self._select_optimal_persona(resume_data, persona_type)
-        selected_strategy = strategy or self._determine_strategy(resume_data)
-
-        # PCT 프레임워크 적용
-        persona = self.personas[selected_persona]
-        self._build_context(resume_data)
-        few_shot_examples = self._get_interview_question_examples(selected_strategy)
-
-        prompt = f"""### 페르소나 설정 ###
+from app.services.resume_features import ResumeFeatures, extract_resume_features
+
+PERSONAS = {
+    "senior_engineer": "15년 이상의 경력을 가진 실리콘밸리 테크 기업의 시니어 백엔드 엔지니어이자 채용 면접관",
+    "tech_lead": "10년 경력의 기술 리더로서 팀 관리와 아키텍처 설계 경험이 풍부한 전문가",
+    "startup_cto": "빠르게 성장하는 스타트업의 CTO로서 기술적 도전과 비즈니스 요구사항의 균형을 맞춘 경험이 있는 리더",
+    "faang_staff": "FAANG 기업의 Staff Engineer로서 대규모 분산 시스템과 고가용성 아키텍처 설계에 전문성을 가진 시니어 엔지니어",
+    "platform_architect": "대기업의 플랫폼 아키텍트로서 마이크로서비스, 클라우드 네이티브, DevOps 전반에 깊은 경험을 가진 전문가",
+}
+
+QUESTION_STRATEGIES = {
+    "behavioral_heavy": "행동 중심 질문에 중점을 두어 팀워크와 리더십을 평가",
+    "technical_deep": "기술적 깊이를 중점적으로 파악하는 심화 기술 질문",
+    "system_design": "시스템 설계와 아키텍처 능력을 중점적으로 평가",
+    "problem_solving": "문제 해결 과정과 사고력을 중점적으로 평가",
+    "balanced": "기술, 행동, 시스템 설계를 균형있게 평가",
+}
+
+# 전략별 Few-shot 예시
+STRATEGY_EXAMPLES = {
+    "system_design": [
+        {
+            "question": "현재 운영 중인 시스템에서 일일 트래픽이 100배 증가한다면, 어떤 순서로 아키텍처를 개선하시겠습니까? 각 단계별 예상 비용과 기술적 trade-off도 함께 설명해주세요.",
+            "intent": "대규모 시스템 확장성과 비용 효율성에 대한 전략적 사고를 평가합니다.",
+            "category": "System Design",
+        },
+        {
+            "question": "마이크로서비스 간 통신에서 Circuit Breaker 패턴을 적용했다면, 구체적으로 어떤 상황에서 어떻게 구현했는지 설명해주세요. 실패 임계값과 복구 전략은 어떻게 설정하셨나요?",
+            "intent": "분산 시스템의 안정성 패턴에 대한 실무 경험을 검증합니다.",
+            "category": "System Design",
+        },
+    ],
+    "technical_deep": [
+        {
+            "question": "Java의 G1GC와 ZGC의 차이점을 설명하고, 각각 어떤 상황에서 선택해야 하는지 실제 경험을 바탕으로 말씀해주세요.",
+            "intent": "JVM 최적화에 대한 깊이 있는 기술적 이해도를 평가합니다.",
+            "category": "Technical Deep-Dive",
+        },
+        {
+            "question": "Redis Cluster 운영 중 발생할 수 있는 split-brain 문제를 어떻게 예방하고 해결하셨나요? 실제 장애 상황이 있었다면 그 경험을 공유해주세요.",
+            "intent": "분산 캐시 시스템의 복잡한 문제 해결 능력을 검증합니다.",
+            "category": "Technical Deep-Dive",
+        },
+    ],
+    "behavioral_heavy": [
+        {
+            "question": "기술적 부채가 심각한 레거시 시스템을 개선해야 하는 상황에서, 비즈니스 팀은 새 기능 개발을 원했습니다. 어떻게 우선순위를 설정하고 이해관계자들을 설득하셨나요?",
+            "intent": "기술과 비즈니스 간의 갈등 상황에서의 의사결정 능력과 커뮤니케이션 스킬을 평가합니다.",
+            "category": "Behavioral",
+        },
+        {
+            "question": "주니어 개발자가 작성한 코드가 성능 문제를 야기했을 때, 어떻게 피드백을 주고 개선을 도왔나요? 그 과정에서 겪은 어려움과 해결 방법을 말씀해주세요.",
+            "intent": "멘토링 능력과 팀 내 지식 전파 역량을 평가합니다.",
+            "category": "Behavioral",
+        },
+    ],
+    "problem_solving": [
+        {
+            "question": "프로덕션 환경에서 갑자기 응답 시간이 10배 증가하는 장애가 발생했습니다. 어떤 순서로 문제를 진단하고 해결하시겠습니까? 각 단계에서 사용할 도구와 방법을 구체적으로 설명해주세요.",
+            "intent": "장애 상황에서의 체계적인 문제 해결 능력과 트러블슈팅 스킬을 평가합니다.",
+            "category": "Problem Solving",
+        },
+        {
+            "question": "메모리 누수로 인해 주기적으로 서버가 다운되는 문제를 겪은 적이 있나요? 원인을 찾고 해결한 과정을 단계별로 설명해주세요.",
+            "intent": "복잡한 기술적 문제에 대한 근본 원인 분석 능력을 검증합니다.",
+            "category": "Problem Solving",
+        },
+    ],
+}
+
+# 기본 균형 예시
+BALANCED_EXAMPLES = [
+    {
+        "question": "MSA 전환 프로젝트에서 서비스 간 데이터 정합성을 어떻게 보장했는지 구체적인 사례를 들어 설명해주십시오. 특히 분산 트랜잭션 처리와 관련하여 어떤 패턴을 고려했고, 최종 선택의 이유는 무엇이었나요?",
+        "intent": "분산 시스템에 대한 깊이 있는 지식과 실제 프로젝트 적용 경험을 검증합니다.",
+        "category": "Technical Deep-Dive",
+    },
+    {
+        "question": "팀 내에서 기술적 의견 충돌이 발생했던 경험이 있다면, 어떤 상황이었고 어떻게 해결하셨나요? 특히 본인의 의견이 채택되지 않았던 경우의 대응 방식도 말씀해 주세요.",
+        "intent": "협업 능력, 커뮤니케이션 스킬, 그리고 팀워크를 평가합니다.",
+        "category": "Behavioral",
+    },
+]
+
+# 프롬프트 원본 (str.format 문법, 리터럴 중괄호는 {{ }})
+INTERVIEW_QUESTIONS_TEMPLATE = """### 페르소나 설정 ###
 당신은 {persona}입니다. 당신은 지원자의 기술적 깊이, 시스템 설계 능력, 그리고 협업 및 문제 해결 능력을 날카롭게 파악하는 것으로 유명합니다. 당신의 목표는 지원자의 이력서에 기술된 경험을 바탕으로, 지원자의 진짜 실력을 검증할 수 있는 심층적인 질문을 생성하는 것입니다.
 
 ### 컨텍스트: 지원자 이력서 정보 ###
 <resume_data>
-- 경력 요약: {resume_data.career_summary}
-- 수행 직무: {resume_data.job_duties}
-- 보유 기술 스킬: {', '.join(resume_data.technical_skills)}
+- 경력 요약: {career_summary}
+- 수행 직무: {job_duties}
+- 보유 기술 스킬: {technical_skills}
 </resume_data>
 
 ### 소수샷 예시 (Few-Shot Examples) ###
@@ -65,7 +115,7 @@ class PromptBuilder:
 
 4. **핵심 경험 우선순위화:** 가장 중요하고 검증 가치가 높은 경험 2-3개를 선별합니다.
 
-5. **질문 카테고리 배분:** {self.question_strategies[selected_strategy]} 전략에 따라 5개 질문의 카테고리를 다음과 같이 배분합니다:
+5. **질문 카테고리 배분:** {strategy_description} 전략에 따라 5개 질문의 카테고리를 다음과 같이 배분합니다:
    - Technical Deep-Dive: 기술적 깊이 검증
    - System Design: 아키텍처 설계 능력
    - Behavioral: 협업 및 리더십
@@ -92,25 +142,14 @@ class PromptBuilder:
   ]
 }}"""
 
-        return prompt
-
-    def build_learning_path_prompt(
-        self, resume_data: ResumePayload, persona_type: str = None
-    ) -> str:
-        """학습 경로 추천을 위한 고급 프롬프트 구성"""
-
-        selected_persona = self._select_optimal_persona(resume_data, persona_type)
-        persona = self.personas[selected_persona]
-        self._build_context(resume_data)
-
-        prompt = f"""### 페르소나 설정 ###
+LEARNING_PATH_TEMPLATE = """### 페르소나 설정 ###
 당신은 {persona}입니다. 당신은 주니어에서 시니어까지 다양한 개발자들의 성장을 도왔으며, 개인의 현재 역량을 분석하여 다음 단계로 나아가기 위한 구체적이고 실행 가능한 학습 경로를 제시하는 전문가입니다.
 
 ### 컨텍스트: 지원자 현재 상태 ###
 <resume_data>
-- 경력 요약: {resume_data.career_summary}
-- 수행 직무: {resume_data.job_duties}
-- 보유 기술 스킬: {', '.join(resume_data.technical_skills)}
+- 경력 요약: {career_summary}
+- 수행 직무: {job_duties}
+- 보유 기술 스킬: {technical_skills}
 </resume_data>
 
 ### 격차 분석 프롬프팅 ###
@@ -149,206 +188,153 @@ class PromptBuilder:
   }}
 }}"""
 
-        return prompt
 
-    def _build_context(self, resume_data: ResumePayload) -> str:
-        """이력서 데이터를 컨텍스트 문자열로 변환"""
-        return f"""
-경력 요약: {resume_data.career_summary}
-수행 직무: {resume_data.job_duties}
-기술 스킬: {', '.join(resume_data.technical_skills)}
-"""
+class PromptTemplate:
+    """
+    정적 구간을 미리 결합해 두고 요청별 필드만 끼워 넣는 프롬프트 템플릿
+
+    str.format 문법의 원본에서 static_fields는 컴파일 시 치환하고, 나머지 필드 위치에서
+    원본을 불변 구간으로 나눠 둡니다. 렌더링은 구간과 필드 값을 이어 붙이기만 하므로
+    필드 값에 포함된 중괄호도 f-string과 동일하게 그대로 출력됩니다.
+    """
+
+    def __init__(self, source: str, **static_fields: Any):
+        segments: List[str] = []
+        fields: List[str] = []
+        literal = ""
+        for text, field_name, _, _ in Formatter().parse(source):
+            literal += text
+            if field_name is None:
+                continue
+            if field_name in static_fields:
+                literal += str(static_fields[field_name])
+            else:
+                segments.append(literal)
+                fields.append(field_name)
+                literal = ""
+        segments.append(literal)
+
+        self.segments: Tuple[str, ...] = tuple(segments)
+        self.fields: Tuple[str, ...] = tuple(fields)
+
+    def render(self, values: Dict[str, str]) -> str:
+        """요청별 필드 값을 끼워 넣어 프롬프트 생성"""
+        parts = [self.segments[0]]
+        for name, segment in zip(self.fields, self.segments[1:]):
+            parts.append(values[name])
+            parts.append(segment)
+        return "".join(parts)
+
+
+def _format_examples(examples: List[Dict[str, str]]) -> str:
+    formatted_examples = []
+    for i, example in enumerate(examples, 1):
+        formatted_examples.append(
+            f"""<example{i}>
+{json.dumps(example, ensure_ascii=False, indent=2)}
+</example{i}>"""
+        )
+    return "\n\n".join(formatted_examples)
+
+
+# 모듈 로드 시 한 번만 직렬화/컴파일
+_FORMATTED_EXAMPLES = {
+    strategy: _format_examples(examples)
+    for strategy, examples in STRATEGY_EXAMPLES.items()
+}
+_BALANCED_FORMATTED_EXAMPLES = _format_examples(BALANCED_EXAMPLES)
+
+_INTERVIEW_QUESTIONS_TEMPLATES = {
+    (persona_type, strategy): PromptTemplate(
+        INTERVIEW_QUESTIONS_TEMPLATE,
+        persona=persona,
+        strategy_description=strategy_description,
+        few_shot_examples=_FORMATTED_EXAMPLES.get(
+            strategy, _BALANCED_FORMATTED_EXAMPLES
+        ),
+    )
+    for persona_type, persona in PERSONAS.items()
+    for strategy, strategy_description in QUESTION_STRATEGIES.items()
+}
+_LEARNING_PATH_TEMPLATES = {
+    persona_type: PromptTemplate(LEARNING_PATH_TEMPLATE, persona=persona)
+    for persona_type, persona in PERSONAS.items()
+}
+
+
+class PromptBuilder:
+    """고급 프롬프트 엔지니어링을 위한 빌더 클래스"""
+
+    def __init__(self):
+        self.personas = PERSONAS
+        self.question_strategies = QUESTION_STRATEGIES
+
+    def build_interview_questions_prompt(
+        self,
+        resume_data: ResumePayload,
+        persona_type: str = None,
+        strategy: str = None,
+        features: Optional[ResumeFeatures] = None,
+    ) -> str:
+        """면접 질문 생성을 위한 고급 프롬프트 구성"""
+        features = features or extract_resume_features(resume_data)
+
+        # 적응형 페르소나 선택
+        selected_persona = self._select_optimal_persona(
+            resume_data, persona_type, features
+        )
+        selected_strategy = strategy or self._determine_strategy(resume_data, features)
+
+        # PCT 프레임워크 적용 (페르소나/전략/예시는 컴파일된 템플릿에 포함)
+        template = _INTERVIEW_QUESTIONS_TEMPLATES[(selected_persona, selected_strategy)]
+        return template.render(features.prompt_fields)
+
+    def build_learning_path_prompt(
+        self,
+        resume_data: ResumePayload,
+        persona_type: str = None,
+        features: Optional[ResumeFeatures] = None,
+    ) -> str:
+        """학습 경로 추천을 위한 고급 프롬프트 구성"""
+        features = features or extract_resume_features(resume_data)
+
+        selected_persona = self._select_optimal_persona(
+            resume_data, persona_type, features
+        )
+        return _LEARNING_PATH_TEMPLATES[selected_persona].render(features.prompt_fields)
 
     def _select_optimal_persona(
-        self, resume_data: ResumePayload, persona_type: str = None
+        self,
+        resume_data: ResumePayload,
+        persona_type: str = None,
+        features: Optional[ResumeFeatures] = None,
     ) -> str:
         """이력서 데이터를 기반으로 최적의 페르소나 선택"""
         if persona_type and persona_type in self.personas:
             return persona_type
 
-        # 경력과 기술 스택 기반 페르소나 선택
-        career_summary_lower = resume_data.career_summary.lower()
-        technical_skills_lower = [
-            skill.lower() for skill in resume_data.technical_skills
-        ]
-
-        # FAANG/대기업 경험 키워드
-        if any(
-            keyword in career_summary_lower
-            for keyword in [
-                "faang",
-                "google",
-                "amazon",
-                "meta",
-                "apple",
-                "microsoft",
-                "netflix",
-            ]
-        ):
-            return "faang_staff"
-
-        # 플랫폼/인프라 키워드
-        if any(
-            keyword in " ".join(technical_skills_lower)
-            for keyword in [
-                "kubernetes",
-                "docker",
-                "aws",
-                "gcp",
-                "azure",
-                "devops",
-                "terraform",
-            ]
-        ):
-            return "platform_architect"
-
-        # 스타트업 키워드
-        if any(
-            keyword in career_summary_lower
-            for keyword in ["스타트업", "startup", "빠른", "신속한", "애자일"]
-        ):
-            return "startup_cto"
-
-        # 리드/관리 경험
-        if any(
-            keyword in career_summary_lower
-            for keyword in ["리드", "lead", "팀장", "관리", "매니저"]
-        ):
-            return "tech_lead"
-
-        # 기본값
-        return "senior_engineer"
-
-    def _determine_strategy(self, resume_data: ResumePayload) -> str:
+        return (features or extract_resume_features(resume_data)).persona
+
+    def _determine_strategy(
+        self, resume_data: ResumePayload, features: Optional[ResumeFeatures] = None
+    ) -> str:
         """이력서 데이터를 기반으로 최적의 질문 전략 결정"""
-        job_duties_lower = resume_data.job_duties.lower()
-        technical_skills_lower = [
-            skill.lower() for skill in resume_data.technical_skills
-        ]
-
-        # 시스템 설계 키워드가 많으면 시스템 설계 중심
-        system_keywords = [
-            "msa",
-            "마이크로서비스",
-            "아키텍처",
-            "분산",
-            "확장성",
-            "성능",
-        ]
-        if sum(1 for keyword in system_keywords if keyword in job_duties_lower) >= 2:
-            return "system_design"
-
-        # 고급 기술 스택이 많으면 기술 중심
-        advanced_tech = [
-            "kubernetes",
-            "kafka",
-            "redis",
-            "elasticsearch",
-            "mongodb",
-            "react",
-            "vue",
-            "angular",
-        ]
-        if (
-            len([skill for skill in technical_skills_lower if skill in advanced_tech])
-            >= 3
-        ):
-            return "technical_deep"
-
-        # 관리/리드 경험이 있으면 행동 중심
-        if any(
-            keyword in job_duties_lower
-            for keyword in ["리딩", "관리", "멘토링", "코드리뷰", "프로젝트 관리"]
-        ):
-            return "behavioral_heavy"
-
-        # 기본값은 균형
-        return "balanced"
+        return (features or extract_resume_features(resume_data)).strategy
 
     def _get_interview_question_examples(self, strategy: str = "balanced") -> str:
         """전략별 Few-shot 학습을 위한 고품질 면접 질문 예시"""
+        return _FORMATTED_EXAMPLES.get(strategy, _BALANCED_FORMATTED_EXAMPLES)
 
-        # 전략별 예시 정의
-        strategy_examples = {
-            "system_design": [
-                {
-                    "question": "현재 운영 중인 시스템에서 일일 트래픽이 100배 증가한다면, 어떤 순서로 아키텍처를 개선하시겠습니까? 각 단계별 예상 비용과 기술적 trade-off도 함께 설명해주세요.",
-                    "intent": "대규모 시스템 확장성과 비용 효율성에 대한 전략적 사고를 평가합니다.",
-                    "category": "System Design",
-                },
-                {
-                    "question": "마이크로서비스 간 통신에서 Circuit Breaker 패턴을 적용했다면, 구체적으로 어떤 상황에서 어떻게 구현했는지 설명해주세요. 실패 임계값과 복구 전략은 어떻게 설정하셨나요?",
-                    "intent": "분산 시스템의 안정성 패턴에 대한 실무 경험을 검증합니다.",
-                    "category": "System Design",
-                },
-            ],
-            "technical_deep": [
-                {
-                    "question": "Java의 G1GC와 ZGC의 차이점을 설명하고, 각각 어떤 상황에서 선택해야 하는지 실제 경험을 바탕으로 말씀해주세요.",
-                    "intent": "JVM 최적화에 대한 깊이 있는 기술적 이해도를 평가합니다.",
-                    "category": "Technical Deep-Dive",
-                },
-                {
-                    "question": "Redis Cluster 운영 중 발생할 수 있는 split-brain 문제를 어떻게 예방하고 해결하셨나요? 실제 장애 상황이 있었다면 그 경험을 공유해주세요.",
-                    "intent": "분산 캐시 시스템의 복잡한 문제 해결 능력을 검증합니다.",
-                    "category": "Technical Deep-Dive",
-                },
-            ],
-            "behavioral_heavy": [
-                {
-                    "question": "기술적 부채가 심각한 레거시 시스템을 개선해야 하는 상황에서, 비즈니스 팀은 새 기능 개발을 원했습니다. 어떻게 우선순위를 설정하고 이해관계자들을 설득하셨나요?",
-                    "intent": "기술과 비즈니스 간의 갈등 상황에서의 의사결정 능력과 커뮤니케이션 스킬을 평가합니다.",
-                    "category": "Behavioral",
-                },
-                {
-                    "question": "주니어 개발자가 작성한 코드가 성능 문제를 야기했을 때, 어떻게 피드백을 주고 개선을 도왔나요? 그 과정에서 겪은 어려움과 해결 방법을 말씀해주세요.",
-                    "intent": "멘토링 능력과 팀 내 지식 전파 역량을 평가합니다.",
-                    "category": "Behavioral",
-                },
-            ],
-            "problem_solving": [
-                {
-                    "question": "프로덕션 환경에서 갑자기 응답 시간이 10배 증가하는 장애가 발생했습니다. 어떤 순서로 문제를 진단하고 해결하시겠습니까? 각 단계에서 사용할 도구와 방법을 구체적으로 설명해주세요.",
-                    "intent": "장애 상황에서의 체계적인 문제 해결 능력과 트러블슈팅 스킬을 평가합니다.",
-                    "category": "Problem Solving",
-                },
-                {
-                    "question": "메모리 누수로 인해 주기적으로 서버가 다운되는 문제를 겪은 적이 있나요? 원인을 찾고 해결한 과정을 단계별로 설명해주세요.",
-                    "intent": "복잡한 기술적 문제에 대한 근본 원인 분석 능력을 검증합니다.",
-                    "category": "Problem Solving",
-                },
-            ],
-        }
-
-        # 기본 균형 예시
-        balanced_examples = [
-            {
-                "question": "MSA 전환 프로젝트에서 서비스 간 데이터 정합성을 어떻게 보장했는지 구체적인 사례를 들어 설명해주십시오. 특히 분산 트랜잭션 처리와 관련하여 어떤 패턴을 고려했고, 최종 선택의 이유는 무엇이었나요?",
-                "intent": "분산 시스템에 대한 깊이 있는 지식과 실제 프로젝트 적용 경험을 검증합니다.",
-                "category": "Technical Deep-Dive",
-            },
-            {
-                "question": "팀 내에서 기술적 의견 충돌이 발생했던 경험이 있다면, 어떤 상황이었고 어떻게 해결하셨나요? 특히 본인의 의견이 채택되지 않았던 경우의 대응 방식도 말씀해 주세요.",
-                "intent": "협업 능력, 커뮤니케이션 스킬, 그리고 팀워크를 평가합니다.",
-                "category": "Behavioral",
-            },
-        ]
-
-        # 전략에 따른 예시 선택
-        selected_examples = strategy_examples.get(strategy, balanced_examples)
-
-        formatted_examples = []
-        for i, example in enumerate(selected_examples, 1):
-            formatted_examples.append(
-                f"""<example{i}>
-{json.dumps(example, ensure_ascii=False, indent=2)}
-</example{i}>"""
-            )
 
-        return "\n\n".join(formatted_examples)
+# 전역 프롬프트 빌더 인스턴스
+_prompt_builder: Optional[PromptBuilder] = None
 
 
-# 전역 프롬프트 빌더 인스턴스
 def get_prompt_builder() -> PromptBuilder:
-    """프롬프트 빌더 인스턴스 반환"""
-    return PromptBuilder()
+    """프롬프트 빌더 싱글톤 인스턴스 반환"""
+    global _prompt_builder
+
+    if _prompt_builder is None:
+        _prompt_builder = PromptBuilder()
+
+    return _prompt_builder
@@ -1,6 +1,32 @@
-from typing import List, Dict
+from typing import List, Dict, FrozenSet, Optional, Sequence
 from dataclasses import dataclass
 from app.schemas.coaching import CoachingResult, ResumePayload
+from app.services.keyword_matcher import KeywordMatcher
+from app.services.resume_features import ResumeFeatures, extract_resume_features
+
+try:
+    import numpy as np
+except ImportError:  # numpy가 없으면 후보별 스칼라 평가로 대체
+    np = None
+
+# 관련성 점수 구간 (매칭 비율 하한 → 1점부터 1점씩 가산)
+RELEVANCE_THRESHOLDS = (0.05, 0.1, 0.2, 0.3)
+# 깊이 점수 구간 (깊이 지표 수 하한 → 1점부터 1점씩 가산)
+DEPTH_THRESHOLDS = (2, 3, 4, 5)
+# 이보다 적은 후보는 배열 생성 비용이 더 커서 후보별로 평가
+VECTORIZED_MIN_CANDIDATES = 4
+
+
+def _count_resume_matches(text: str, features: ResumeFeatures) -> int:
+    """
+    텍스트에 포함된 이력서 키워드의 등장 횟수 합
+
+    이력서 키워드는 요청마다 달라 매처 컴파일 비용을 나눌 호출이 적으므로,
+    컴파일 없는 키워드별 포함 검사가 더 빠릅니다.
+    """
+    return sum(
+        count for keyword, count in features.keyword_counts.items() if keyword in text
+    )
 
 
 @dataclass
@@ -23,6 +49,14 @@ class QualityScore:
         }
 
 
+@dataclass
+class CandidateScores:
+    """후보 일괄 평가 결과"""
+
+    scores: List[QualityScore]  # 입력 순서와 같은 후보별 점수
+    best_index: Optional[int]  # 전체 점수가 가장 높은 첫 번째 후보 (후보가 없으면 None)
+
+
 class QualityEvaluator:
     """AI 결과물 품질 평가 시스템"""
 
@@ -69,19 +103,66 @@ class QualityEvaluator:
             "처리",
         ]
 
+        # 범주별 키워드를 한 번만 컴파일해 텍스트마다 1회 스캔으로 모든 범주를 판정
+        self.keyword_matcher = KeywordMatcher(
+            {
+                "technical_depth": self.technical_depth_keywords,
+                "actionable": self.actionable_keywords,
+                # 구체적인 상황/예시 언급
+                "situation": ["예시", "사례", "경험", "상황"],
+                # 너무 추상적인 표현
+                "abstract": ["일반적으로", "보통", "대부분"],
+                # 구체적인 경험 요구
+                "experience": ["경험", "사례", "프로젝트에서", "실제로"],
+                # 단계별/구체적 설명 요구
+                "step_by_step": ["단계별", "구체적으로", "어떻게", "방법"],
+                # 실무 중심
+                "practical": ["실무", "프로덕션", "운영", "실제"],
+                # 명확한 평가 의도
+                "assessment": ["평가", "검증", "확인", "측정"],
+                # 이론 중심
+                "theoretical": ["이론적으로", "개념적으로", "일반론"],
+                # 학습 경로: 구체적인 프로젝트
+                "project": ["프로젝트", "구축", "개발", "구현"],
+                # 학습 경로: 기술적 세부사항
+                "technical_detail": ["아키텍처", "패턴", "최적화", "설계"],
+                # 학습 경로: 현실적인 제안
+                "realistic": ["사이드 프로젝트", "토이 프로젝트", "연습", "실습"],
+                # 학습 경로: 커리어 관련성
+                "career": ["승진", "이직", "성장", "역량", "스킬"],
+                # 학습 경로: 구체적인 기술/도구
+                "tools": ["kubernetes", "docker", "aws", "spring", "python"],
+            }
+        )
+
+        # 일괄 평가용 키워드 → 적중 행렬에서 해당 키워드가 속한 범주 열
+        self._category_index = {
+            name: column for column, name in enumerate(self.keyword_matcher.categories)
+        }
+        self._keyword_columns: Dict[str, List[int]] = {}
+        for name, keywords in self.keyword_matcher.categories.items():
+            for keyword in keywords:
+                self._keyword_columns.setdefault(keyword, []).append(
+                    self._category_index[name]
+                )
+
     def evaluate_coaching_result(
-        self, result: CoachingResult, resume_data: ResumePayload
+        self,
+        result: CoachingResult,
+        resume_data: ResumePayload,
+        features: Optional[ResumeFeatures] = None,
     ) -> QualityScore:
-        """코칭 결과 전체 품질 평가"""
+        """코칭 결과 전체 품질 평가 (features를 넘기면 이력서 특징 추출을 생략)"""
+        features = features or extract_resume_features(resume_data)
 
         # 면접 질문 평가
         questions_score = self._evaluate_interview_questions(
-            result.interview_questions, resume_data
+            result.interview_questions, resume_data, features
         )
 
         # 학습 경로 평가
         learning_path_score = self._evaluate_learning_path(
-            result.learning_path, resume_data
+            result.learning_path, resume_data, features
         )
 
         # 가중 평균 (면접 질문 60%, 학습 경로 40%)
@@ -112,28 +193,242 @@ class QualityEvaluator:
             overall=overall,
         )
 
+    def evaluate_candidates(
+        self,
+        results: Sequence[CoachingResult],
+        resume_data: ResumePayload,
+        features: Optional[ResumeFeatures] = None,
+    ) -> CandidateScores:
+        """
+        같은 이력서에 대한 여러 후보를 한 번에 평가
+
+        numpy가 있고 후보가 VECTORIZED_MIN_CANDIDATES개 이상이면 텍스트별 키워드 적중 수를
+        (텍스트 × 키워드 범주) 행렬로 만들어 모든 후보의 관련성/깊이/실행가능성/실용성/전체
+        점수를 한 번에 계산합니다. 점수는 후보마다 evaluate_coaching_result를 호출한 결과와
+        정확히 같습니다.
+        """
+        features = features or extract_resume_features(resume_data)
+        if np is None or len(results) < VECTORIZED_MIN_CANDIDATES:
+            scores = [
+                self.evaluate_coaching_result(result, resume_data, features)
+                for result in results
+            ]
+        else:
+            scores = self._evaluate_candidates_vectorized(results, features)
+
+        best_index = (
+            max(range(len(scores)), key=lambda i: scores[i].overall) if scores else None
+        )
+        return CandidateScores(scores=scores, best_index=best_index)
+
+    def _evaluate_candidates_vectorized(
+        self, results: Sequence[CoachingResult], features: ResumeFeatures
+    ) -> List[QualityScore]:
+        candidate_count = len(results)
+
+        # 같은 페르소나의 후보는 학습 경로를 공유하므로 같은 텍스트는 한 번만 스캔
+        scanned: Dict[str, FrozenSet[str]] = {}
+
+        def find(text: str) -> FrozenSet[str]:
+            hits = scanned.get(text)
+            if hits is None:
+                hits = scanned[text] = self.keyword_matcher.find(text)
+            return hits
+
+        # 텍스트별 키워드 스캔 (후보 × 질문, 후보 × 학습 단계 순서로 펼침)
+        question_owner, question_hits, intent_hits = [], [], []
+        question_relevance_text, question_long, question_single = [], [], []
+        depth_keyword_counts = []
+        step_owner, step_hits, step_detailed, step_has_resources = [], [], [], []
+        path_relevance_text = []
+        for index, result in enumerate(results):
+            for question in result.interview_questions:
+                question_text = question.question.lower()
+                intent_text = question.intent.lower()
+                hits = find(question_text)
+                intent = find(intent_text)
+                question_owner.append(index)
+                question_hits.append(hits)
+                intent_hits.append(intent)
+                question_relevance_text.append(question_text)
+                question_long.append(len(question_text) > 100)
+                question_single.append(question_text.count("?") == 1)
+                depth_keyword_counts.append(
+                    self.keyword_matcher.count(hits | intent, "technical_depth")
+                )
+
+            learning_path = result.learning_path
+            path_relevance_text.append(
+                learning_path.summary.lower()
+                + " "
+                + " ".join(
+                    [
+                        step.title + " " + step.description
+                        for step in learning_path.steps
+                    ]
+                ).lower()
+            )
+            for step in learning_path.steps:
+                step_hits.append(find((step.title + " " + step.description).lower()))
+                step_owner.append(index)
+                step_detailed.append(len(step.description) > 50)
+                step_has_resources.append(bool(step.resources))
+
+        # 면접 질문 점수 (질문별 계산 후 후보별 평균)
+        question = self._hit_matrix(question_hits)
+        intent = self._hit_matrix(intent_hits)
+        category = self._category_index
+
+        depth_indicators = (
+            np.array(depth_keyword_counts, dtype=np.int64)
+            + np.array(question_long, dtype=np.int64)
+            + np.array(question_single, dtype=np.int64)
+            + 2 * (question[:, category["situation"]] > 0)
+        )
+        question_scores = [
+            self._relevance_scores(question_relevance_text, features),
+            1.0 + np.searchsorted(DEPTH_THRESHOLDS, depth_indicators, side="right"),
+            np.clip(
+                3.0
+                - 1.0 * (question[:, category["abstract"]] > 0)
+                + 1.0 * (question[:, category["experience"]] > 0)
+                + 0.5 * (question[:, category["step_by_step"]] > 0),
+                1.0,
+                5.0,
+            ),
+            np.clip(
+                3.0
+                + 1.0 * (question[:, category["practical"]] > 0)
+                + 0.5 * (intent[:, category["assessment"]] > 0)
+                - 1.0 * (question[:, category["theoretical"]] > 0),
+                1.0,
+                5.0,
+            ),
+        ]
+
+        # 점수가 0.5 단위라 합산 순서와 무관하게 후보별 순차 평균과 같은 값
+        question_owner = np.array(question_owner, dtype=np.intp)
+        question_counts = np.bincount(question_owner, minlength=candidate_count)
+        questions_averages = [
+            np.where(
+                question_counts > 0,
+                np.bincount(question_owner, weights=values, minlength=candidate_count)
+                / np.maximum(question_counts, 1),
+                0.0,
+            )
+            for values in question_scores
+        ]
+
+        # 학습 경로 점수 (단계별 점수를 후보별로 합산 후 정규화)
+        step = self._hit_matrix(step_hits)
+        step_owner = np.array(step_owner, dtype=np.intp)
+        step_counts = np.bincount(step_owner, minlength=candidate_count)
+
+        def normalize(step_values, max_per_step):
+            total = np.bincount(
+                step_owner, weights=step_values, minlength=candidate_count
+            )
+            max_possible = np.maximum(step_counts, 1) * max_per_step
+            return np.where(
+                step_counts > 0, np.clip(total / max_possible * 5, 1.0, 5.0), 1.0
+            )
+
+        path_relevance = self._relevance_scores(path_relevance_text, features)
+        path_depth = normalize(
+            1.0 * (step[:, category["project"]] > 0)
+            + 1.0 * (step[:, category["technical_detail"]] > 0)
+            + 0.5 * np.array(step_detailed, dtype=bool),
+            2.5,
+        )
+        path_actionability = normalize(
+            np.minimum(step[:, category["actionable"]], 3)
+            + 1.0 * np.array(step_has_resources, dtype=bool),
+            4,
+        )
+        path_practicality = normalize(
+            1.0 * (step[:, category["realistic"]] > 0)
+            + 1.0 * (step[:, category["career"]] > 0)
+            + 0.5 * (step[:, category["tools"]] > 0),
+            2.5,
+        )
+
+        # 가중 평균 (면접 질문 60%, 학습 경로 40%)
+        relevance, depth, actionability, practicality = (
+            questions_average * 0.6 + path_average * 0.4
+            for questions_average, path_average in zip(
+                questions_averages,
+                [path_relevance, path_depth, path_actionability, path_practicality],
+            )
+        )
+        overall = (relevance + depth + actionability + practicality) / 4
+
+        return [
+            QualityScore(*map(float, values))
+            for values in zip(relevance, depth, actionability, practicality, overall)
+        ]
+
+    def _hit_matrix(self, hit_sets: List[FrozenSet[str]]):
+        """텍스트별 범주 적중 수 행렬 (텍스트 × 키워드 범주)"""
+        width = len(self._category_index)
+        rows: Dict[FrozenSet[str], List[int]] = {}
+        for hits in hit_sets:
+            if hits not in rows:
+                counts = [0] * width
+                for keyword in hits:
+                    for column in self._keyword_columns[keyword]:
+                        counts[column] += 1
+                rows[hits] = counts
+
+        matrix = np.array([rows[hits] for hits in hit_sets], dtype=np.int64)
+        return matrix.reshape(len(hit_sets), width)
+
+    def _relevance_scores(self, texts: List[str], features: ResumeFeatures):
+        """텍스트별 관련성 점수 배열 (_calculate_relevance와 같은 구간화)"""
+        total_keywords = len(features.tokens)
+        if total_keywords == 0:
+            return np.full(len(texts), 3.0)
+
+        matches: Dict[str, int] = {}
+        for text in texts:
+            if text not in matches:
+                matches[text] = _count_resume_matches(text, features)
+        matches = np.array([matches[text] for text in texts], dtype=np.int64)
+        return 1.0 + np.searchsorted(
+            RELEVANCE_THRESHOLDS, matches / total_keywords, side="right"
+        )
+
     def _evaluate_interview_questions(
-        self, questions: List, resume_data: ResumePayload
+        self,
+        questions: List,
+        resume_data: ResumePayload,
+        features: Optional[ResumeFeatures] = None,
     ) -> QualityScore:
         """면접 질문 품질 평가"""
 
+        features = features or extract_resume_features(resume_data)
         scores = []
         for question in questions:
             question_text = question.question.lower()
             intent_text = question.intent.lower()
+            question_hits = self.keyword_matcher.find(question_text)
+            intent_hits = self.keyword_matcher.find(intent_text)
 
             # 관련성 평가
-            relevance = self._calculate_relevance(question_text, resume_data)
+            relevance = self._calculate_relevance(question_text, resume_data, features)
 
             # 깊이 평가
-            depth = self._calculate_depth(question_text, intent_text)
+            depth = self._calculate_depth(
+                question_text, intent_text, question_hits, intent_hits
+            )
 
             # 실행가능성 평가 (면접 질문의 경우 답변 가능성)
-            actionability = self._calculate_question_answerability(question_text)
+            actionability = self._calculate_question_answerability(
+                question_text, question_hits
+            )
 
             # 실용성 평가
             practicality = self._calculate_question_practicality(
-                question_text, intent_text
+                question_text, intent_text, question_hits, intent_hits
             )
 
             question_score = QualityScore(
@@ -160,7 +455,10 @@ class QualityEvaluator:
         )
 
     def _evaluate_learning_path(
-        self, learning_path, resume_data: ResumePayload
+        self,
+        learning_path,
+        resume_data: ResumePayload,
+        features: Optional[ResumeFeatures] = None,
     ) -> QualityScore:
         """학습 경로 품질 평가"""
 
@@ -171,40 +469,43 @@ class QualityEvaluator:
 
         # 관련성 평가
         relevance = self._calculate_relevance(
-            summary_text + " " + all_steps_text, resume_data
+            summary_text + " " + all_steps_text, resume_data, features
         )
 
+        # 단계별 키워드는 한 번만 스캔
+        step_hits = self._find_step_hits(learning_path.steps)
+
         # 깊이 평가
-        depth = self._calculate_learning_depth(learning_path.steps)
+        depth = self._calculate_learning_depth(learning_path.steps, step_hits)
 
         # 실행가능성 평가
-        actionability = self._calculate_learning_actionability(learning_path.steps)
+        actionability = self._calculate_learning_actionability(
+            learning_path.steps, step_hits
+        )
 
         # 실용성 평가
-        practicality = self._calculate_learning_practicality(learning_path.steps)
+        practicality = self._calculate_learning_practicality(
+            learning_path.steps, step_hits
+        )
 
         overall = (relevance + depth + actionability + practicality) / 4
 
         return QualityScore(relevance, depth, actionability, practicality, overall)
 
-    def _calculate_relevance(self, text: str, resume_data: ResumePayload) -> float:
+    def _calculate_relevance(
+        self,
+        text: str,
+        resume_data: ResumePayload,
+        features: Optional[ResumeFeatures] = None,
+    ) -> float:
         """관련성 점수 계산 (1-5점)"""
 
-        # 이력서 키워드 추출
-        resume_keywords = []
-        resume_keywords.extend(resume_data.career_summary.lower().split())
-        resume_keywords.extend(resume_data.job_duties.lower().split())
-        resume_keywords.extend(
-            [skill.lower() for skill in resume_data.technical_skills]
-        )
-
-        # 키워드 매칭 점수
-        matches = 0
-        total_keywords = len(resume_keywords)
+        # 이력서 키워드 (요청당 한 번 추출한 특징 사용)
+        features = features or extract_resume_features(resume_data)
+        total_keywords = len(features.tokens)
 
-        for keyword in resume_keywords:
-            if len(keyword) > 2 and keyword in text:  # 2글자 이상의 키워드만 체크
-                matches += 1
+        # 키워드 매칭 점수 (중복 키워드는 등장 횟수만큼 반영)
+        matches = _count_resume_matches(text, features)
 
         if total_keywords == 0:
             return 3.0
@@ -223,15 +524,34 @@ class QualityEvaluator:
         else:
             return 1.0
 
-    def _calculate_depth(self, question_text: str, intent_text: str) -> float:
+    def _find_hits(
+        self, text: str, hits: Optional[FrozenSet[str]] = None
+    ) -> FrozenSet[str]:
+        return self.keyword_matcher.find(text) if hits is None else hits
+
+    def _find_step_hits(self, steps: List) -> List[FrozenSet[str]]:
+        return [
+            self.keyword_matcher.find((step.title + " " + step.description).lower())
+            for step in steps
+        ]
+
+    def _calculate_depth(
+        self,
+        question_text: str,
+        intent_text: str,
+        question_hits: Optional[FrozenSet[str]] = None,
+        intent_hits: Optional[FrozenSet[str]] = None,
+    ) -> float:
         """깊이 점수 계산 (1-5점)"""
 
+        question_hits = self._find_hits(question_text, question_hits)
+        intent_hits = self._find_hits(intent_text, intent_hits)
         depth_indicators = 0
 
         # 기술적 깊이 키워드 체크
-        for keyword in self.technical_depth_keywords:
-            if keyword in question_text or keyword in intent_text:
-                depth_indicators += 1
+        depth_indicators += self.keyword_matcher.count(
+            question_hits | intent_hits, "technical_depth"
+        )
 
         # 질문의 복잡도 체크
         if len(question_text) > 100:  # 긴 질문은 보통 더 복합적
@@ -241,9 +561,7 @@ class QualityEvaluator:
             depth_indicators += 1
 
         # 구체적인 상황/예시 언급
-        if any(
-            keyword in question_text for keyword in ["예시", "사례", "경험", "상황"]
-        ):
+        if self.keyword_matcher.has_any(question_hits, "situation"):
             depth_indicators += 2
 
         # 점수 변환
@@ -258,71 +576,74 @@ class QualityEvaluator:
         else:
             return 1.0
 
-    def _calculate_question_answerability(self, question_text: str) -> float:
+    def _calculate_question_answerability(
+        self, question_text: str, question_hits: Optional[FrozenSet[str]] = None
+    ) -> float:
         """질문의 답변 가능성 평가 (1-5점)"""
 
+        question_hits = self._find_hits(question_text, question_hits)
         answerability_score = 3.0  # 기본 점수
 
         # 너무 추상적인 질문은 감점
-        if any(word in question_text for word in ["일반적으로", "보통", "대부분"]):
+        if self.keyword_matcher.has_any(question_hits, "abstract"):
             answerability_score -= 1.0
 
         # 구체적인 경험을 묻는 질문은 가점
-        if any(
-            word in question_text for word in ["경험", "사례", "프로젝트에서", "실제로"]
-        ):
+        if self.keyword_matcher.has_any(question_hits, "experience"):
             answerability_score += 1.0
 
         # 단계별/구체적 설명을 요구하는 질문은 가점
-        if any(
-            word in question_text for word in ["단계별", "구체적으로", "어떻게", "방법"]
-        ):
+        if self.keyword_matcher.has_any(question_hits, "step_by_step"):
             answerability_score += 0.5
 
         return max(1.0, min(5.0, answerability_score))
 
     def _calculate_question_practicality(
-        self, question_text: str, intent_text: str
+        self,
+        question_text: str,
+        intent_text: str,
+        question_hits: Optional[FrozenSet[str]] = None,
+        intent_hits: Optional[FrozenSet[str]] = None,
     ) -> float:
         """질문의 실용성 평가 (1-5점)"""
 
+        question_hits = self._find_hits(question_text, question_hits)
+        intent_hits = self._find_hits(intent_text, intent_hits)
         practicality_score = 3.0  # 기본 점수
 
         # 실무 중심 질문은 가점
-        if any(word in question_text for word in ["실무", "프로덕션", "운영", "실제"]):
+        if self.keyword_matcher.has_any(question_hits, "practical"):
             practicality_score += 1.0
 
         # 평가 의도가 명확한 경우 가점
-        if any(word in intent_text for word in ["평가", "검증", "확인", "측정"]):
+        if self.keyword_matcher.has_any(intent_hits, "assessment"):
             practicality_score += 0.5
 
         # 너무 이론적인 질문은 감점
-        if any(
-            word in question_text for word in ["이론적으로", "개념적으로", "일반론"]
-        ):
+        if self.keyword_matcher.has_any(question_hits, "theoretical"):
             practicality_score -= 1.0
 
         return max(1.0, min(5.0, practicality_score))
 
-    def _calculate_learning_depth(self, steps: List) -> float:
+    def _calculate_learning_depth(
+        self, steps: List, step_hits: Optional[List[FrozenSet[str]]] = None
+    ) -> float:
         """학습 경로 깊이 평가 (1-5점)"""
 
         if not steps:
             return 1.0
 
+        if step_hits is None:
+            step_hits = self._find_step_hits(steps)
         depth_score = 0
 
-        for step in steps:
-            step_text = (step.title + " " + step.description).lower()
-
+        for step, hits in zip(steps, step_hits):
             # 구체적인 프로젝트 언급
-            if any(word in step_text for word in ["프로젝트", "구축", "개발", "구현"]):
+            if self.keyword_matcher.has_any(hits, "project"):
                 depth_score += 1
 
             # 기술적 세부사항 언급
-            if any(
-                word in step_text for word in ["아키텍처", "패턴", "최적화", "설계"]
-            ):
+            if self.keyword_matcher.has_any(hits, "technical_detail"):
                 depth_score += 1
 
             # 단계별 구체성
@@ -335,21 +656,21 @@ class QualityEvaluator:
 
         return max(1.0, min(5.0, normalized_score))
 
-    def _calculate_learning_actionability(self, steps: List) -> float:
+    def _calculate_learning_actionability(
+        self, steps: List, step_hits: Optional[List[FrozenSet[str]]] = None
+    ) -> float:
         """학습 경로 실행가능성 평가 (1-5점)"""
 
         if not steps:
             return 1.0
 
+        if step_hits is None:
+            step_hits = self._find_step_hits(steps)
         actionability_score = 0
 
-        for step in steps:
-            step_text = (step.title + " " + step.description).lower()
-
+        for step, hits in zip(steps, step_hits):
             # 실행 가능한 동작 언급
-            actionable_count = sum(
-                1 for word in self.actionable_keywords if word in step_text
-            )
+            actionable_count = self.keyword_matcher.count(hits, "actionable")
             actionability_score += min(actionable_count, 3)  # 최대 3점
 
             # 구체적인 자료/리소스 제공
@@ -364,35 +685,29 @@ class QualityEvaluator:
 
         return max(1.0, min(5.0, normalized_score))
 
-    def _calculate_learning_practicality(self, steps: List) -> float:
+    def _calculate_learning_practicality(
+        self, steps: List, step_hits: Optional[List[FrozenSet[str]]] = None
+    ) -> float:
         """학습 경로 실용성 평가 (1-5점)"""
 
         if not steps:
             return 1.0
 
+        if step_hits is None:
+            step_hits = self._find_step_hits(steps)
         practicality_score = 0
 
-        for step in steps:
-            step_text = (step.title + " " + step.description).lower()
-
+        for hits in step_hits:
             # 현실적인 제안
-            if any(
-                word in step_text
-                for word in ["사이드 프로젝트", "토이 프로젝트", "연습", "실습"]
-            ):
+            if self.keyword_matcher.has_any(hits, "realistic"):
                 practicality_score += 1
 
             # 커리어 관련성
-            if any(
-                word in step_text for word in ["승진", "이직", "성장", "역량", "스킬"]
-            ):
+            if self.keyword_matcher.has_any(hits, "career"):
                 practicality_score += 1
 
             # 구체적인 기술/도구 언급
-            if any(
-                word in step_text
-                for word in ["kubernetes", "docker", "aws", "spring", "python"]
-            ):
+            if self.keyword_matcher.has_any(hits, "tools"):
                 practicality_score += 0.5
 
         # 정규화
@@ -428,6 +743,15 @@ class QualityEvaluator:
         return suggestions
 
 
+# 전역 품질 평가자 인스턴스
+_quality_evaluator: Optional[QualityEvaluator] = None
+
+
 def get_quality_evaluator() -> QualityEvaluator:
-    """품질 평가자 인스턴스 반환"""
-    return QualityEvaluator()
+    """품질 평가자 싱글톤 인스턴스 반환"""
+    global _quality_evaluator
+
+    if _quality_evaluator is None:
+        _quality_evaluator = QualityEvaluator()
+
+    return _quality_evaluator
@@ -0,0 +1,219 @@
+import asyncio
+import math
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, Deque, Dict, Optional
+
+# 공정 큐잉 단위 (코칭 세션별로 설정하여 한 세션이 다른 세션을 굶기지 않도록 함)
+admission_key: ContextVar[str] = ContextVar("llm_admission_key", default="default")
+
+# 토큰 추정 시 사용하는 문자/토큰 비율 (한글·영문 혼합 기준의 보수적 값)
+CHARS_PER_TOKEN = 2
+DEFAULT_COMPLETION_TOKENS = 256
+
+
+class AdmissionTimeoutError(Exception):
+    """제한 시간 안에 LLM 요청 승인을 받지 못한 경우 (로컬 대기열 포화)"""
+
+    pass
+
+
+def estimate_tokens(prompt: str, max_tokens: Optional[int] = None) -> int:
+    """프롬프트 길이와 max_tokens로 요청의 토큰 사용량 추정"""
+    prompt_tokens = math.ceil(len(prompt) / CHARS_PER_TOKEN)
+    return prompt_tokens + (max_tokens or DEFAULT_COMPLETION_TOKENS)
+
+
+class TokenBucket:
+    """분당 허용량 기반 토큰 버킷"""
+
+    def __init__(self, rate_per_minute: float, clock=time.monotonic):
+        self.capacity = float(rate_per_minute)
+        self.refill_per_second = rate_per_minute / 60.0
+        self._tokens = self.capacity
+        self._clock = clock
+        self._updated_at = clock()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = self._clock()
+        elapsed = now - self._updated_at
+        self._updated_at = now
+        self._tokens = min(
+            self.capacity, self._tokens + elapsed * self.refill_per_second
+        )
+
+    async def acquire(self, amount: float = 1.0) -> None:
+        """버킷에서 amount 만큼 차감 (부족하면 충전될 때까지 대기)"""
+        # 버킷 용량보다 큰 요청은 용량만큼만 차감하여 영구 대기 방지
+        amount = min(float(amount), self.capacity)
+
+        # 락으로 대기 순서(FIFO)를 보장
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return
+                deficit = amount - self._tokens
+                await asyncio.sleep(deficit / self.refill_per_second)
+
+    @property
+    def available(self) -> float:
+        """현재 사용 가능한 토큰 수"""
+        self._refill()
+        return self._tokens
+
+
+class FairConcurrencyLimiter:
+    """키별 라운드로빈 공정 큐잉을 지원하는 동시성 제한기 (max_concurrency 0 이하이면 제한 없음)"""
+
+    def __init__(self, max_concurrency: int):
+        self.max_concurrency = max_concurrency
+        self.active = 0
+        self._queues: "OrderedDict[str, Deque[asyncio.Future]]" = OrderedDict()
+
+    @property
+    def waiting(self) -> int:
+        """대기 중인 요청 수"""
+        return sum(len(queue) for queue in self._queues.values())
+
+    @property
+    def has_capacity(self) -> bool:
+        """슬롯을 바로 배정할 수 있는지 여부"""
+        return self.max_concurrency <= 0 or self.active < self.max_concurrency
+
+    async def acquire(self, key: str) -> None:
+        """슬롯 획득 (대기 중인 요청이 있으면 키별 순서대로 배정)"""
+        if self.has_capacity and not self._queues:
+            self.active += 1
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        self._queues.setdefault(key, deque()).append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # 슬롯이 배정된 직후 취소된 경우 슬롯 반환
+                self.release()
+            else:
+                self._discard(key, future)
+            raise
+
+    def release(self) -> None:
+        """슬롯 반환 후 다음 대기자에게 배정"""
+        self.active -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self.has_capacity and self._queues:
+            # 가장 오래 기다린 키부터 하나씩 배정하고 해당 키는 맨 뒤로 이동
+            key, queue = next(iter(self._queues.items()))
+            future = queue.popleft()
+            if queue:
+                self._queues.move_to_end(key)
+            else:
+                del self._queues[key]
+
+            if future.done():
+                continue
+            self.active += 1
+            future.set_result(None)
+
+    def _discard(self, key: str, future: asyncio.Future) -> None:
+        queue = self._queues.get(key)
+        if queue is None:
+            return
+        try:
+            queue.remove(future)
+        except ValueError:
+            return
+        if not queue:
+            del self._queues[key]
+
+
+class LLMAdmissionController:
+    """LLM 요청의 동시성·요청률·토큰률을 제어하는 승인 계층"""
+
+    def __init__(
+        self,
+        max_concurrency: int,
+        requests_per_minute: int = 0,
+        tokens_per_minute: int = 0,
+        metrics_window: int = 1000,
+    ):
+        # 0 이하이면 해당 제한 비활성화
+        self.limiter = FairConcurrencyLimiter(max_concurrency)
+        self.request_bucket = (
+            TokenBucket(requests_per_minute) if requests_per_minute > 0 else None
+        )
+        self.token_bucket = (
+            TokenBucket(tokens_per_minute) if tokens_per_minute > 0 else None
+        )
+
+        self.admitted = 0
+        self.timed_out = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+        self._recent_waits: Deque[float] = deque(maxlen=metrics_window)
+
+    @asynccontextmanager
+    async def admit(
+        self, key: str, estimated_tokens: int, timeout: Optional[float] = None
+    ):
+        """
+        요청 승인 후 실행 구간 동안 슬롯 점유
+
+        Raises:
+            AdmissionTimeoutError: timeout 초 안에 승인되지 않은 경우 (슬롯은 점유하지 않음)
+        """
+        started_at = time.monotonic()
+        try:
+            await asyncio.wait_for(self._acquire(key, estimated_tokens), timeout)
+        except asyncio.TimeoutError:
+            self.timed_out += 1
+            raise AdmissionTimeoutError(f"{timeout:.1f}초 안에 LLM 요청 승인을 받지 못했습니다.")
+
+        self._record_wait(time.monotonic() - started_at)
+        try:
+            yield
+        finally:
+            self.limiter.release()
+
+    async def _acquire(self, key: str, estimated_tokens: int) -> None:
+        await self.limiter.acquire(key)
+        try:
+            if self.request_bucket is not None:
+                await self.request_bucket.acquire(1)
+            if self.token_bucket is not None:
+                await self.token_bucket.acquire(estimated_tokens)
+        except BaseException:
+            self.limiter.release()
+            raise
+
+    def _record_wait(self, wait_seconds: float) -> None:
+        self.admitted += 1
+        self.total_wait_seconds += wait_seconds
+        self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+        self._recent_waits.append(wait_seconds)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """대기 시간 등 승인 계층 지표 반환"""
+        recent = sorted(self._recent_waits)
+        p95 = recent[min(len(recent) - 1, int(len(recent) * 0.95))] if recent else 0.0
+
+        return {
+            "active": self.limiter.active,
+            "waiting": self.limiter.waiting,
+            "max_concurrency": self.limiter.max_concurrency,
+            "admitted": self.admitted,
+            "timed_out": self.timed_out,
+            "queue_wait_avg_seconds": (
+                self.total_wait_seconds / self.admitted if self.admitted else 0.0
+            ),
+            "queue_wait_p95_seconds": p95,
+            "queue_wait_max_seconds": self.max_wait_seconds,
+        }
@@ -0,0 +1,205 @@
+import json
+import logging
+from typing import List, Optional, Sequence, Tuple
+from uuid import uuid4
+
+from app.schemas.coaching import (
+    ResumePayload,
+    CoachingResult,
+    InterviewQuestion,
+    LearningPath,
+    LearningStep,
+)
+from app.services.stream_parser import parse_llm_json
+
+logger = logging.getLogger(__name__)
+
+
+def _load_interview_questions(response: str) -> List[InterviewQuestion]:
+    """LLM 응답을 면접 질문 목록으로 변환 (형식 오류 시 예외)"""
+    parsed_response = parse_llm_json(response)
+    questions_data = parsed_response.get("interview_questions", [])
+
+    if len(questions_data) != 5:
+        raise ValueError(f"예상된 5개 질문이 아닌 {len(questions_data)}개 질문이 생성됨")
+
+    # Pydantic 모델로 변환
+    questions = []
+    for q_data in questions_data:
+        question = InterviewQuestion(
+            question=q_data["question"],
+            intent=q_data["intent"],
+            category=q_data["category"],
+        )
+        questions.append(question)
+    return questions
+
+
+def _load_learning_path(response: str) -> LearningPath:
+    """LLM 응답을 학습 경로로 변환 (형식 오류 시 예외)"""
+    parsed_response = parse_llm_json(response)
+    path_data = parsed_response.get("learning_path", {})
+
+    # 학습 단계 변환
+    steps = []
+    for step_data in path_data.get("steps", []):
+        step = LearningStep(
+            title=step_data["title"],
+            description=step_data["description"],
+            resources=step_data["resources"],
+        )
+        steps.append(step)
+
+    return LearningPath(summary=path_data["summary"], steps=steps)
+
+
+def parse_interview_questions(
+    response: str, resume_data: ResumePayload
+) -> List[InterviewQuestion]:
+    """LLM 응답을 면접 질문 목록으로 변환 (실패 시 대체 질문)"""
+    try:
+        questions = _load_interview_questions(response)
+        logger.info(f"면접 질문 {len(questions)}개 생성 완료")
+        return questions
+
+    except (json.JSONDecodeError, KeyError, ValueError) as e:
+        logger.warning(f"LLM 응답 파싱 실패, 대체 로직 사용: {str(e)}")
+        return fallback_interview_questions(resume_data)
+
+
+def parse_learning_path(response: str, resume_data: ResumePayload) -> LearningPath:
+    """LLM 응답을 학습 경로로 변환 (실패 시 대체 학습 경로)"""
+    try:
+        learning_path = _load_learning_path(response)
+        logger.info(f"학습 경로 생성 완료: {len(learning_path.steps)}개 단계")
+        return learning_path
+
+    except (json.JSONDecodeError, KeyError) as e:
+        logger.warning(f"LLM 응답 파싱 실패, 대체 로직 사용: {str(e)}")
+        return fallback_learning_path(resume_data)
+
+
+def is_valid_interview_questions_response(response: str) -> bool:
+    """대체 질문 없이 면접 질문으로 변환되는 응답인지 확인 (LLM 응답 캐시 저장 조건)"""
+    try:
+        _load_interview_questions(response)
+    except Exception:
+        return False
+    return True
+
+
+def is_valid_learning_path_response(response: str) -> bool:
+    """대체 학습 경로 없이 학습 경로로 변환되는 응답인지 확인 (LLM 응답 캐시 저장 조건)"""
+    try:
+        _load_learning_path(response)
+    except Exception:
+        return False
+    return True
+
+
+def fallback_interview_questions(resume_data: ResumePayload) -> List[InterviewQuestion]:
+    """LLM 실패 시 대체 면접 질문 생성"""
+    logger.info("대체 면접 질문 생성 중...")
+
+    # 기술 스킬 기반 질문 생성
+    primary_skills = resume_data.technical_skills[:3]
+
+    questions = [
+        InterviewQuestion(
+            question=f"{resume_data.career_summary}을 바탕으로, 가장 도전적이었던 기술적 문제는 무엇이었고 어떻게 해결하셨나요?",
+            intent="문제 해결 능력과 기술적 깊이를 평가합니다.",
+            category="Technical Deep-Dive",
+        ),
+        InterviewQuestion(
+            question=f"{', '.join(primary_skills)} 기술을 사용한 프로젝트에서 성능 최적화를 어떻게 진행하셨나요?",
+            intent="성능 최적화 경험과 기술적 접근 방식을 검증합니다.",
+            category="System Design",
+        ),
+        InterviewQuestion(
+            question="팀원과 기술적 의견 차이가 있을 때 어떻게 해결하시나요?",
+            intent="협업 능력과 커뮤니케이션 스킬을 평가합니다.",
+            category="Behavioral",
+        ),
+        InterviewQuestion(
+            question="현재 시스템에서 장애가 발생했을 때의 대응 절차를 설명해주세요.",
+            intent="장애 대응 능력과 시스템 운영 경험을 평가합니다.",
+            category="Problem Solving",
+        ),
+        InterviewQuestion(
+            question="향후 3-5년간 기술적 성장 목표는 무엇인가요?",
+            intent="자기계발 의지와 장기적 비전을 평가합니다.",
+            category="Career Vision",
+        ),
+    ]
+
+    return questions
+
+
+def fallback_learning_path(resume_data: ResumePayload) -> LearningPath:
+    """LLM 실패 시 대체 학습 경로 생성"""
+    logger.info("대체 학습 경로 생성 중...")
+
+    primary_skills = resume_data.technical_skills[:3]
+
+    steps = [
+        LearningStep(
+            title="기술적 깊이 강화",
+            description=f"현재 보유한 {', '.join(primary_skills)} 기술의 고급 개념과 최적화 기법을 학습하고 실제 프로젝트에 적용",
+            resources=[f"{skill} 고급 가이드" for skill in primary_skills[:2]]
+            + ["성능 최적화 패턴"],
+        ),
+        LearningStep(
+            title="시스템 설계 역량 개발",
+            description="대규모 시스템 아키텍처 설계 경험을 쌓기 위한 사이드 프로젝트 진행",
+            resources=[
+                "System Design Interview",
+                "마이크로서비스 아키텍처",
+                "분산 시스템 설계",
+            ],
+        ),
+        LearningStep(
+            title="기술 리더십 함양",
+            description="코드 리뷰 문화 구축, 기술 문서 작성, 팀 내 지식 공유 활동 참여",
+            resources=[
+                "Effective Code Review",
+                "기술 블로깅",
+                "컨퍼런스 발표 준비",
+            ],
+        ),
+    ]
+
+    return LearningPath(
+        summary=f"현재 {', '.join(primary_skills)} 경험을 바탕으로 시니어 개발자로 성장하기 위한 체계적인 학습 경로를 제안합니다.",
+        steps=steps,
+    )
+
+
+def build_coaching_result(
+    questions_response: Optional[str],
+    learning_path_response: Optional[str],
+    resume_data: ResumePayload,
+) -> CoachingResult:
+    """면접 질문/학습 경로 응답을 코칭 결과로 변환 (응답이 None이면 대체 콘텐츠)"""
+    return CoachingResult(
+        session_id=uuid4(),
+        interview_questions=(
+            parse_interview_questions(questions_response, resume_data)
+            if questions_response is not None
+            else fallback_interview_questions(resume_data)
+        ),
+        learning_path=(
+            parse_learning_path(learning_path_response, resume_data)
+            if learning_path_response is not None
+            else fallback_learning_path(resume_data)
+        ),
+    )
+
+
+def build_coaching_results(
+    items: Sequence[Tuple[Optional[str], Optional[str], ResumePayload]]
+) -> List[CoachingResult]:
+    """(면접 질문 응답, 학습 경로 응답, 이력서) 목록을 한 번에 코칭 결과로 변환"""
+    return [
+        build_coaching_result(questions_response, learning_path_response, resume)
+        for questions_response, learning_path_response, resume in items
+    ]
@@ -0,0 +1,136 @@
+from collections import Counter
+from dataclasses import dataclass
+from functools import cached_property
+from typing import Dict, Tuple
+
+from app.schemas.coaching import ResumePayload
+
+# 페르소나 선택 키워드
+FAANG_KEYWORDS = ("faang", "google", "amazon", "meta", "apple", "microsoft", "netflix")
+PLATFORM_KEYWORDS = (
+    "kubernetes",
+    "docker",
+    "aws",
+    "gcp",
+    "azure",
+    "devops",
+    "terraform",
+)
+STARTUP_KEYWORDS = ("스타트업", "startup", "빠른", "신속한", "애자일")
+LEAD_KEYWORDS = ("리드", "lead", "팀장", "관리", "매니저")
+
+# 질문 전략 결정 키워드
+SYSTEM_DESIGN_KEYWORDS = ("msa", "마이크로서비스", "아키텍처", "분산", "확장성", "성능")
+ADVANCED_TECH_SKILLS = (
+    "kubernetes",
+    "kafka",
+    "redis",
+    "elasticsearch",
+    "mongodb",
+    "react",
+    "vue",
+    "angular",
+)
+LEADERSHIP_KEYWORDS = ("리딩", "관리", "멘토링", "코드리뷰", "프로젝트 관리")
+
+
+@dataclass(frozen=True)
+class ResumeFeatures:
+    """
+    요청당 한 번 계산해 프롬프트 구성과 품질 평가에서 공유하는 이력서 특징
+
+    두 프롬프트가 모두 쓰는 특징만 바로 계산하고, 면접 질문 전략과 품질 평가용 키워드는
+    처음 쓸 때 한 번 계산합니다. 프롬프트만 구성하는 경로(표준 모드, 스트리밍, 배치)는
+    키워드 집계 비용을 치르지 않습니다.
+    """
+
+    resume: ResumePayload  # 원본 이력서
+    career_summary: str  # 소문자 정규화
+    technical_skills: Tuple[str, ...]  # 소문자 정규화
+    persona: str  # 자동 선택된 페르소나
+    prompt_fields: Dict[str, str]  # 프롬프트 템플릿에 끼워 넣을 원문 필드
+
+    @cached_property
+    def job_duties(self) -> str:
+        """소문자 정규화된 수행 직무"""
+        return self.resume.job_duties.lower()
+
+    @cached_property
+    def strategy(self) -> str:
+        """자동 결정된 질문 전략"""
+        return _determine_strategy(self.job_duties, self.technical_skills)
+
+    @cached_property
+    def tokens(self) -> Tuple[str, ...]:
+        """관련성 평가용 이력서 키워드 (공백 분리 + 기술 스킬)"""
+        return (
+            tuple(self.career_summary.split() + self.job_duties.split())
+            + self.technical_skills
+        )
+
+    @cached_property
+    def keyword_counts(self) -> Dict[str, int]:
+        """2글자 초과 키워드별 등장 횟수"""
+        counts = Counter(self.tokens)
+        for keyword in [keyword for keyword in counts if len(keyword) <= 2]:
+            del counts[keyword]
+        return counts
+
+
+def _select_persona(career_summary: str, technical_skills: Tuple[str, ...]) -> str:
+    """경력과 기술 스택 기반 페르소나 선택"""
+    # FAANG/대기업 경험 키워드
+    if any(keyword in career_summary for keyword in FAANG_KEYWORDS):
+        return "faang_staff"
+
+    # 플랫폼/인프라 키워드
+    skills_text = " ".join(technical_skills)
+    if any(keyword in skills_text for keyword in PLATFORM_KEYWORDS):
+        return "platform_architect"
+
+    # 스타트업 키워드
+    if any(keyword in career_summary for keyword in STARTUP_KEYWORDS):
+        return "startup_cto"
+
+    # 리드/관리 경험
+    if any(keyword in career_summary for keyword in LEAD_KEYWORDS):
+        return "tech_lead"
+
+    # 기본값
+    return "senior_engineer"
+
+
+def _determine_strategy(job_duties: str, technical_skills: Tuple[str, ...]) -> str:
+    """직무와 기술 스택 기반 질문 전략 결정"""
+    # 시스템 설계 키워드가 많으면 시스템 설계 중심
+    if sum(1 for keyword in SYSTEM_DESIGN_KEYWORDS if keyword in job_duties) >= 2:
+        return "system_design"
+
+    # 고급 기술 스택이 많으면 기술 중심
+    if len([skill for skill in technical_skills if skill in ADVANCED_TECH_SKILLS]) >= 3:
+        return "technical_deep"
+
+    # 관리/리드 경험이 있으면 행동 중심
+    if any(keyword in job_duties for keyword in LEADERSHIP_KEYWORDS):
+        return "behavioral_heavy"
+
+    # 기본값은 균형
+    return "balanced"
+
+
+def extract_resume_features(resume_data: ResumePayload) -> ResumeFeatures:
+    """이력서 특징 추출 (정규화, 페르소나 결정; 전략과 키워드는 처음 쓸 때 계산)"""
+    career_summary = resume_data.career_summary.lower()
+    technical_skills = tuple(skill.lower() for skill in resume_data.technical_skills)
+
+    return ResumeFeatures(
+        resume=resume_data,
+        career_summary=career_summary,
+        technical_skills=technical_skills,
+        persona=_select_persona(career_summary, technical_skills),
+        prompt_fields={
+            "career_summary": resume_data.career_summary,
+            "job_duties": resume_data.job_duties,
+            "technical_skills": ", ".join(resume_data.technical_skills),
+        },
+    )
@@ -0,0 +1,77 @@
+import hashlib
+import json
+import logging
+from typing import Any, Dict, Optional
+from uuid import uuid4
+
+from app.schemas.coaching import CoachingResult, ResumePayload
+from app.services.llm_cache import MemoryLRUCache
+
+logger = logging.getLogger(__name__)
+
+
+def _normalize_text(text: str) -> str:
+    """공백과 대소문자 차이를 제거한 텍스트"""
+    return " ".join(text.split()).lower()
+
+
+def normalize_resume_payload(resume_data: ResumePayload) -> Dict[str, Any]:
+    """동일한 이력서를 같은 형태로 만드는 정규화"""
+    return {
+        "career_summary": _normalize_text(resume_data.career_summary),
+        "job_duties": _normalize_text(resume_data.job_duties),
+        "technical_skills": sorted(
+            {_normalize_text(skill) for skill in resume_data.technical_skills}
+        ),
+    }
+
+
+def make_session_cache_key(
+    resume_data: ResumePayload, enable_quality_optimization: bool
+) -> str:
+    """정규화된 이력서와 최적화 모드로 세션 캐시 키 생성"""
+    payload = json.dumps(
+        {
+            "resume": normalize_resume_payload(resume_data),
+            "quality_optimization": enable_quality_optimization,
+        },
+        ensure_ascii=False,
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SessionResultCache:
+    """코칭 세션 결과 캐시 (결과는 직렬화하여 저장하고 조회 시 새 세션 ID 발급)"""
+
+    def __init__(self, max_bytes: int, ttl_seconds: float):
+        self.memory = MemoryLRUCache(max_bytes)
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: str) -> Optional[CoachingResult]:
+        """캐시된 결과를 새 세션 ID로 반환"""
+        value = self.memory.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        result = CoachingResult.model_validate_json(value)
+        return result.model_copy(update={"session_id": uuid4()})
+
+    def set(self, key: str, result: CoachingResult) -> None:
+        """세션 결과 저장"""
+        self.memory.set(key, result.model_dump_json(), self.ttl_seconds)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """캐시 적중/미스 지표 반환"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+            "entries": len(self.memory),
+            "bytes": self.memory.current_bytes,
+        }
@@ -0,0 +1,92 @@
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from app.core.deadline import Deadline
+
+
+@dataclass
+class _InFlightCall:
+    """진행 중인 공유 호출과 대기자 수"""
+
+    task: asyncio.Task
+    deadline: Optional[Deadline] = None
+    waiters: int = 0
+
+    def covers(self, deadline: Optional[Deadline]) -> bool:
+        """이 호출의 데드라인이 합류하려는 요청의 데드라인보다 먼저 끝나지 않는지 여부"""
+        if self.deadline is None:
+            return True
+        return deadline is not None and deadline.expires_at <= self.deadline.expires_at
+
+
+class SingleFlight:
+    """
+    같은 키의 동시 요청을 하나의 실행으로 합치는 요청 병합기
+
+    합류한 요청은 먼저 시작한 호출의 데드라인을 따르므로, 진행 중인 호출보다 데드라인이 긴
+    요청은 합류하지 않고 새로 실행합니다 (이후 요청은 새 호출에 합류).
+    """
+
+    def __init__(self):
+        self._calls: Dict[str, _InFlightCall] = {}
+        self.executed = 0
+        self.collapsed = 0
+
+    @property
+    def in_flight(self) -> int:
+        """진행 중인 공유 호출 수"""
+        return len(self._calls)
+
+    async def do(
+        self,
+        key: str,
+        func: Callable[[], Awaitable[Any]],
+        deadline: Optional[Deadline] = None,
+    ) -> Tuple[Any, bool]:
+        """
+        키에 해당하는 호출을 실행하거나 진행 중인 호출 결과를 기다림
+
+        Args:
+            key: 병합 키
+            func: 공유 호출을 시작하는 함수
+            deadline: 요청 데드라인 (func가 따르는 데드라인, 없으면 무제한)
+
+        Returns:
+            (결과, 기존 호출에 합류했는지 여부)
+        """
+        call = self._calls.get(key)
+        if call is not None and not call.covers(deadline):
+            call = None
+        joined = call is not None
+
+        if call is None:
+            call = _InFlightCall(task=asyncio.ensure_future(func()), deadline=deadline)
+            self._calls[key] = call
+            call.task.add_done_callback(lambda _: self._forget(key, call))
+            self.executed += 1
+        else:
+            self.collapsed += 1
+
+        call.waiters += 1
+        try:
+            # 한 대기자의 취소가 공유 호출을 취소하지 않도록 보호
+            return await asyncio.shield(call.task), joined
+        finally:
+            call.waiters -= 1
+            if call.waiters == 0 and not call.task.done():
+                # 모든 대기자가 떠나면 공유 호출도 중단
+                call.task.cancel()
+                self._forget(key, call)
+
+    def _forget(self, key: str, call: _InFlightCall) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+
+    def get_metrics(self) -> Dict[str, int]:
+        """병합 지표 반환"""
+        return {
+            "executed": self.executed,
+            "collapsed": self.collapsed,
+            "in_flight": self.in_flight,
+        }
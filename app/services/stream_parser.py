@@ -0,0 +1,158 @@
+import json
+from typing import Any, List, Optional
+
+
+def strip_trailing_commas(text: str) -> str:
+    """문자열 밖의 닫는 괄호 앞 쉼표 제거 ({"a": 1,} → {"a": 1})"""
+    result: List[str] = []
+    in_string = False
+    escaped = False
+    length = len(text)
+    index = 0
+
+    while index < length:
+        char = text[index]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char == ",":
+            lookahead = index + 1
+            while lookahead < length and text[lookahead] in " \t\r\n":
+                lookahead += 1
+            if lookahead < length and text[lookahead] in "}]":
+                index += 1
+                continue
+        result.append(char)
+        index += 1
+
+    return "".join(result)
+
+
+def strip_code_fence(text: str) -> str:
+    """```json ... ``` 형태의 코드 블록 표시 제거"""
+    text = text.strip()
+    if text.startswith("```"):
+        newline_at = text.find("\n")
+        text = text[newline_at + 1 :] if newline_at >= 0 else text[3:]
+    if text.endswith("```"):
+        text = text[:-3]
+    return text.strip()
+
+
+def parse_llm_json(text: str) -> Any:
+    """
+    LLM 응답 JSON을 관대하게 파싱
+
+    코드 블록 표시, JSON 앞뒤의 설명 문장, 닫는 괄호 앞 쉼표를 허용합니다.
+
+    Raises:
+        json.JSONDecodeError: 복구할 수 없는 형식
+    """
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        pass
+
+    cleaned = strip_code_fence(text)
+    start = cleaned.find("{")
+    end = cleaned.rfind("}")
+    if start >= 0 and end > start:
+        cleaned = cleaned[start : end + 1]
+
+    return json.loads(strip_trailing_commas(cleaned))
+
+
+class JSONArrayStreamParser:
+    """
+    스트리밍되는 JSON 문서에서 지정한 키의 배열 요소를 완성되는 즉시 추출하는 파서
+
+    각 문자를 한 번만 검사하고 완성된 요소만 한 번 파싱하므로 전체 처리량은
+    응답 길이에 비례합니다 (O(n)). 코드 블록 표시와 닫는 괄호 앞 쉼표를 허용하며,
+    객체/배열 형태의 요소만 추출합니다.
+    """
+
+    def __init__(self, array_key: str):
+        self.array_key = array_key
+        self.malformed = 0
+
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+        self._string_chars: Optional[List[str]] = None
+        self._last_string: Optional[str] = None
+        self._pending_key: Optional[str] = None
+        self._array_depth: Optional[int] = None
+        self._element: Optional[List[str]] = None
+        self._closed = False
+
+    @property
+    def closed(self) -> bool:
+        """대상 배열이 닫혔는지 여부"""
+        return self._closed
+
+    def feed(self, chunk: str) -> List[Any]:
+        """조각을 추가하고 새로 완성된 배열 요소 반환"""
+        items: List[Any] = []
+
+        for char in chunk:
+            if self._closed:
+                break
+
+            if self._element is not None:
+                self._element.append(char)
+
+            if self._in_string:
+                if self._escaped:
+                    self._escaped = False
+                elif char == "\\":
+                    self._escaped = True
+                elif char == '"':
+                    self._in_string = False
+                    if self._string_chars is not None:
+                        self._last_string = "".join(self._string_chars)
+                        self._string_chars = None
+                elif self._string_chars is not None:
+                    self._string_chars.append(char)
+                continue
+
+            if char == '"':
+                self._in_string = True
+                # 대상 배열을 찾기 전에만 키 이름을 기록
+                if self._array_depth is None:
+                    self._string_chars = []
+            elif char == ":":
+                self._pending_key = self._last_string
+            elif char == "{" or char == "[":
+                if (
+                    char == "["
+                    and self._array_depth is None
+                    and self._pending_key == self.array_key
+                ):
+                    self._array_depth = self._depth + 1
+                elif self._element is None and self._depth == self._array_depth:
+                    self._element = [char]
+                self._depth += 1
+                self._pending_key = None
+            elif char == "}" or char == "]":
+                self._depth -= 1
+                if self._element is not None and self._depth == self._array_depth:
+                    self._emit("".join(self._element), items)
+                    self._element = None
+                elif self._array_depth is not None and self._depth < self._array_depth:
+                    self._closed = True
+            elif char == ",":
+                self._pending_key = None
+
+        return items
+
+    def _emit(self, text: str, items: List[Any]) -> None:
+        try:
+            items.append(json.loads(strip_trailing_commas(text)))
+        except json.JSONDecodeError:
+            self.malformed += 1
@@ -0,0 +1,355 @@
+"""
+코칭 API 부하 테스트
+
+모의 LLM 공급자(지연 시간/오류율 설정 가능)로 app.main:app에 동시 요청을 보내고
+품질 최적화 모드와 표준 모드 각각의 처리량, p50/p95/p99 지연 시간, 이벤트 루프 지연,
+메모리 증가량, 세션당 LLM 호출 수를 측정하여 JSON으로 저장합니다.
+
+사용법:
+    python -m benchmarks.load_test --requests 200 --concurrency 20 --latency 0.3
+    python -m benchmarks.load_test -o after.json --baseline before.json --max-regression 0.1
+    python -m benchmarks.load_test --cpu-executor none -o inline.json
+"""
+import argparse
+import asyncio
+import gc
+import json
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterator, List, Optional
+
+import httpx
+
+from app.core.config import settings
+from app.core.loop_monitor import EventLoopLagMonitor
+
+MODES = {"optimized": True, "standard": False}
+
+SKILL_POOL = [
+    "Spring Boot",
+    "MSA",
+    "Python",
+    "AWS EC2",
+    "MySQL",
+    "Kafka",
+    "Redis",
+    "Kubernetes",
+    "React",
+    "TypeScript",
+    "Go",
+    "PostgreSQL",
+]
+
+
+def percentile(values: List[float], percent: float) -> float:
+    """정렬 후 nearest-rank 백분위수"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(percent / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+def make_resume(index: int) -> Dict[str, Any]:
+    """캐시 적중이 없도록 요청마다 다른 이력서 생성"""
+    skills = [SKILL_POOL[(index + offset) % len(SKILL_POOL)] for offset in range(5)]
+    return {
+        "career_summary": f"{index % 10 + 1}년차 백엔드 개발자, {skills[0]}/{skills[1]} 기반 커머스 서비스 개발 (지원자 {index})",
+        "job_duties": f"주문 및 결제 시스템 {skills[2]} 전환 프로젝트 리딩, {skills[3]} 기반 데이터 배치 처리 시스템 구축",
+        "technical_skills": skills,
+    }
+
+
+def _rss_bytes() -> int:
+    """현재 프로세스 RSS (Linux는 /proc, 그 외에는 최대 RSS)"""
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _reset_singletons() -> None:
+    import app.core.executor as executor_module
+    import app.services.coaching_service as coaching_service_module
+    import app.services.llm_client as llm_client_module
+
+    if executor_module._cpu_executor is not None:
+        executor_module._cpu_executor.shutdown()
+    executor_module._cpu_executor = None
+    llm_client_module._llm_client = None
+    coaching_service_module._coaching_service = None
+
+
+@contextmanager
+def mock_backend(config: Dict[str, Any]) -> Iterator[None]:
+    """모의 LLM 공급자와 측정용 설정을 적용하고 종료 시 원래 설정으로 복원"""
+    overrides = {
+        "llm_provider": "mock",
+        "llm_mock_latency_seconds": config["latency"],
+        "llm_mock_latency_spread": config["latency_spread"],
+        "llm_mock_latency_distribution": config["latency_distribution"],
+        "llm_mock_error_rate": config["error_rate"],
+        "llm_mock_seed": config["seed"],
+    }
+    if config.get("cpu_executor"):
+        overrides["cpu_executor"] = config["cpu_executor"]
+    if not config["with_cache"]:
+        overrides.update(llm_cache_enabled=False, session_cache_enabled=False)
+    if not config["with_rate_limits"]:
+        # 요청률/토큰률 버킷은 0이면 비활성화, 동시성은 사실상 무제한으로 설정
+        overrides.update(
+            llm_max_concurrency=1_000_000,
+            llm_requests_per_minute=0,
+            llm_tokens_per_minute=0,
+        )
+
+    original = {name: getattr(settings, name) for name in overrides}
+    for name, value in overrides.items():
+        setattr(settings, name, value)
+    _reset_singletons()
+    try:
+        yield
+    finally:
+        for name, value in original.items():
+            setattr(settings, name, value)
+        _reset_singletons()
+
+
+async def run_mode(
+    client: httpx.AsyncClient,
+    enable_quality_optimization: bool,
+    requests: int,
+    concurrency: int,
+    monitor: EventLoopLagMonitor,
+) -> Dict[str, Any]:
+    """한 모드의 동시 요청을 실행하고 지표 반환"""
+    from app.services.llm_client import get_llm_client
+
+    provider = get_llm_client().provider
+    calls_before = provider.calls
+    latencies: List[float] = []
+    failures: Dict[str, int] = {}
+    next_index = iter(range(requests))
+
+    async def worker() -> None:
+        for index in next_index:
+            started_at = time.perf_counter()
+            try:
+                response = await client.post(
+                    "/api/v1/coaching-sessions",
+                    params={
+                        "enable_quality_optimization": str(
+                            enable_quality_optimization
+                        ).lower()
+                    },
+                    json=make_resume(index),
+                )
+                outcome = str(response.status_code)
+            except httpx.HTTPError as e:
+                outcome = type(e).__name__
+            latencies.append(time.perf_counter() - started_at)
+            if outcome != "201":
+                failures[outcome] = failures.get(outcome, 0) + 1
+
+    gc.collect()
+    rss_before = _rss_bytes()
+    monitor.reset()
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - started_at
+    gc.collect()
+
+    succeeded = requests - sum(failures.values())
+    return {
+        "requests": requests,
+        "concurrency": concurrency,
+        "succeeded": succeeded,
+        "failures": failures,
+        "duration_seconds": duration,
+        "throughput_rps": requests / duration if duration else 0.0,
+        "latency_p50_seconds": percentile(latencies, 50),
+        "latency_p95_seconds": percentile(latencies, 95),
+        "latency_p99_seconds": percentile(latencies, 99),
+        "latency_max_seconds": max(latencies) if latencies else 0.0,
+        "event_loop": monitor.get_metrics(),
+        "rss_growth_bytes": _rss_bytes() - rss_before,
+        "llm_calls_per_session": (
+            (provider.calls - calls_before) / requests if requests else 0.0
+        ),
+    }
+
+
+async def run_benchmark(config: Dict[str, Any]) -> Dict[str, Any]:
+    """설정된 모드들의 부하 테스트 실행"""
+    from app.main import app
+
+    results: Dict[str, Any] = {}
+    with mock_backend(config):
+        monitor = EventLoopLagMonitor(interval_seconds=0.01)
+        monitor.start()
+        try:
+            transport = httpx.ASGITransport(app=app)
+            async with httpx.AsyncClient(
+                transport=transport, base_url="http://benchmark", timeout=None
+            ) as client:
+                for mode in config["modes"]:
+                    results[mode] = await run_mode(
+                        client,
+                        MODES[mode],
+                        config["requests"],
+                        config["concurrency"],
+                        monitor,
+                    )
+        finally:
+            await monitor.stop()
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": config,
+        },
+        "results": results,
+    }
+
+
+def compare_with_baseline(
+    current: Dict[str, Any], baseline: Dict[str, Any], max_regression: float
+) -> List[str]:
+    """기준 결과 대비 처리량 감소/p95 지연 증가가 허용 비율을 넘는 항목 반환"""
+    regressions = []
+    for mode, result in current["results"].items():
+        base = baseline.get("results", {}).get(mode)
+        if base is None:
+            continue
+
+        if base["throughput_rps"] and (
+            result["throughput_rps"] < base["throughput_rps"] * (1 - max_regression)
+        ):
+            regressions.append(
+                f"{mode}: 처리량 {base['throughput_rps']:.2f} → {result['throughput_rps']:.2f} rps"
+            )
+        if base["latency_p95_seconds"] and (
+            result["latency_p95_seconds"]
+            > base["latency_p95_seconds"] * (1 + max_regression)
+        ):
+            regressions.append(
+                f"{mode}: p95 지연 {base['latency_p95_seconds']:.3f} → {result['latency_p95_seconds']:.3f}초"
+            )
+    return regressions
+
+
+def _print_summary(report: Dict[str, Any]) -> None:
+    for mode, result in report["results"].items():
+        print(
+            f"[{mode}] {result['throughput_rps']:.2f} rps, "
+            f"p50 {result['latency_p50_seconds'] * 1000:.1f}ms, "
+            f"p95 {result['latency_p95_seconds'] * 1000:.1f}ms, "
+            f"p99 {result['latency_p99_seconds'] * 1000:.1f}ms, "
+            f"loop lag max {result['event_loop']['lag_max_seconds'] * 1000:.1f}ms, "
+            f"RSS +{result['rss_growth_bytes'] / 1024 / 1024:.1f}MiB, "
+            f"LLM 호출/세션 {result['llm_calls_per_session']:.1f}, "
+            f"실패 {result['failures'] or 0}",
+            file=sys.stderr,
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """부하 테스트 진입점"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.load_test", description="코칭 API 부하 테스트"
+    )
+    parser.add_argument("-n", "--requests", type=int, default=100, help="모드별 요청 수")
+    parser.add_argument("-c", "--concurrency", type=int, default=10, help="동시 요청 수")
+    parser.add_argument(
+        "--modes",
+        nargs="+",
+        choices=sorted(MODES),
+        default=["optimized", "standard"],
+        help="측정할 모드",
+    )
+    parser.add_argument("--latency", type=float, default=0.2, help="모의 LLM 지연 시간 (초)")
+    parser.add_argument("--latency-spread", type=float, default=0.0, help="지연 시간 분산")
+    parser.add_argument(
+        "--latency-distribution",
+        choices=["fixed", "uniform", "normal", "lognormal"],
+        default="fixed",
+    )
+    parser.add_argument("--error-rate", type=float, default=0.0, help="모의 LLM 오류율")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--with-cache", action="store_true", help="LLM/세션 캐시 사용")
+    parser.add_argument(
+        "--with-rate-limits", action="store_true", help="LLM 요청률/토큰률 제한 사용"
+    )
+    parser.add_argument(
+        "--cpu-executor",
+        choices=["thread", "process", "none"],
+        default=settings.cpu_executor,
+        help="파싱/품질 평가 실행기",
+    )
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 경로")
+    parser.add_argument("--baseline", help="비교할 기준 결과 JSON 파일")
+    parser.add_argument(
+        "--max-regression", type=float, default=0.1, help="허용 회귀 비율 (기본 10%%)"
+    )
+    args = parser.parse_args(argv)
+
+    config = {
+        "requests": args.requests,
+        "concurrency": args.concurrency,
+        "modes": args.modes,
+        "latency": args.latency,
+        "latency_spread": args.latency_spread,
+        "latency_distribution": args.latency_distribution,
+        "error_rate": args.error_rate,
+        "seed": args.seed,
+        "with_cache": args.with_cache,
+        "with_rate_limits": args.with_rate_limits,
+        "cpu_executor": args.cpu_executor,
+    }
+    report = asyncio.run(run_benchmark(config))
+    _print_summary(report)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare_with_baseline(
+                report, json.load(f), args.max_regression
+            )
+        for regression in regressions:
+            print(f"회귀 감지: {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,339 @@
+"""
+PromptBuilder / QualityEvaluator 핫패스 마이크로 벤치마크
+
+최적화 모드 세션 1회는 프롬프트 18개 생성과 후보 9개의 품질 평가를 수행합니다.
+ResumePayload 길이 제한까지의 이력서 크기(small/medium/max)별로 각 함수의 호출당 시간을
+timeit으로 측정하고(pytest-benchmark와 같은 min/median/mean 통계), 저장된 기준 결과와 비교합니다.
+
+사용법:
+    python -m benchmarks.micro
+    python -m benchmarks.micro --save-baseline
+    python -m benchmarks.micro --baseline --threshold 0.25
+    python -m benchmarks.micro -k relevance --baseline other.json
+"""
+import argparse
+import gc
+import json
+import platform
+import statistics
+import sys
+import timeit
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from app.schemas.coaching import (
+    CoachingResult,
+    InterviewQuestion,
+    LearningPath,
+    LearningStep,
+    ResumePayload,
+)
+from app.services.prompt_builder import PromptBuilder, get_prompt_builder
+from app.services.quality_evaluator import QualityEvaluator, get_quality_evaluator
+from app.services.resume_features import extract_resume_features
+from benchmarks.load_test import SKILL_POOL, _git_commit
+
+DEFAULT_BASELINE_PATH = Path(__file__).parent / "baselines" / "micro.json"
+
+# ResumePayload 제한: career_summary ≤ 500자, job_duties ≤ 1000자, technical_skills ≤ 20개
+RESUME_SIZES = {
+    "small": (60, 60, 3),
+    "medium": (250, 500, 10),
+    "max": (500, 1000, 20),
+}
+
+CAREER_PHRASES = [
+    "7년차 백엔드 개발자",
+    "Spring Boot/MSA 기반 커머스 서비스 개발",
+    "스타트업에서 결제 플랫폼 리드",
+    "대용량 트래픽 주문 시스템 운영",
+    "Kubernetes 기반 인프라 전환 경험",
+]
+
+DUTY_PHRASES = [
+    "주문 및 결제 시스템 MSA 전환 프로젝트 리딩",
+    "Python 기반 데이터 배치 처리 시스템 구축",
+    "분산 트랜잭션과 확장성 개선을 위한 아키텍처 설계",
+    "신규 입사자 멘토링 및 코드리뷰 프로세스 관리",
+    "Redis 캐시 도입으로 API 성능 최적화",
+]
+
+
+def _fill(phrases: List[str], length: int) -> str:
+    """문구를 반복해 정확히 length 글자의 텍스트 생성"""
+    text = ""
+    index = 0
+    while len(text) < length:
+        text += phrases[index % len(phrases)] + ", "
+        index += 1
+    return text[:length]
+
+
+def make_resume(size: str) -> ResumePayload:
+    """크기별 벤치마크용 이력서 생성"""
+    career_length, duties_length, skill_count = RESUME_SIZES[size]
+    skills = [
+        SKILL_POOL[i % len(SKILL_POOL)] + ("" if i < len(SKILL_POOL) else f" {i}")
+        for i in range(skill_count)
+    ]
+    return ResumePayload(
+        career_summary=_fill(CAREER_PHRASES, career_length),
+        job_duties=_fill(DUTY_PHRASES, duties_length),
+        technical_skills=skills,
+    )
+
+
+def make_result(resume: ResumePayload) -> CoachingResult:
+    """이력서 기술을 언급하는 평가용 코칭 결과 (질문 5개, 학습 단계 3개)"""
+    skills = resume.technical_skills
+    questions = [
+        InterviewQuestion(
+            question=f"{skills[i % len(skills)]}를 사용한 프로젝트에서 실제로 겪은 장애 사례를 들어, 원인 분석과 해결 과정을 단계별로 구체적으로 설명해주세요?",
+            intent="실무 문제 해결 능력과 아키텍처 설계 경험을 평가합니다",
+            category=category,
+        )
+        for i, category in enumerate(
+            [
+                "Technical Deep-Dive",
+                "System Design",
+                "Problem Solving",
+                "Behavioral",
+                "Career Vision",
+            ]
+        )
+    ]
+    steps = [
+        LearningStep(
+            title=f"{skills[i % len(skills)]} 심화 프로젝트 구축",
+            description="사이드 프로젝트로 분산 아키텍처를 구현하고 성능 최적화 결과를 정리하여 실무 역량을 성장시킵니다",
+            resources=["분산 시스템 설계", "성능 최적화", skills[i % len(skills)]],
+        )
+        for i in range(3)
+    ]
+    return CoachingResult(
+        interview_questions=questions,
+        learning_path=LearningPath(
+            summary="현재 경험을 바탕으로 분산 시스템 설계 역량을 강화하는 학습 경로입니다.",
+            steps=steps,
+        ),
+    )
+
+
+def make_candidates(resume: ResumePayload, count: int = 9) -> List[CoachingResult]:
+    """후보별로 면접 질문이 다르고 학습 경로는 3개씩 공유하는 최적화 모드 후보 목록"""
+    base = make_result(resume)
+    candidates = []
+    for index in range(count):
+        questions = [
+            question.model_copy(
+                update={"question": f"{question.question} (후보 {index + 1})"}
+            )
+            for question in base.interview_questions
+        ]
+        learning_path = base.learning_path.model_copy(
+            update={"summary": f"{base.learning_path.summary} ({index // 3 + 1})"}
+        )
+        candidates.append(
+            base.model_copy(
+                update={
+                    "interview_questions": questions,
+                    "learning_path": learning_path,
+                }
+            )
+        )
+    return candidates
+
+
+def build_cases() -> Dict[str, Callable[[], Any]]:
+    """
+    벤치마크 이름별 측정 대상 함수 (이름: <대상>[<이력서 크기>])
+
+    모든 함수는 이력서 특징 추출을 포함해 ResumePayload에서부터 측정합니다.
+    """
+    builder = PromptBuilder()
+    evaluator = QualityEvaluator()
+    cases: Dict[str, Callable[[], Any]] = {
+        "get_prompt_builder": get_prompt_builder,
+        "get_quality_evaluator": get_quality_evaluator,
+    }
+
+    for strategy in builder.question_strategies:
+        cases[f"_get_interview_question_examples[{strategy}]"] = partial(
+            builder._get_interview_question_examples, strategy
+        )
+
+    for size in RESUME_SIZES:
+        resume = make_resume(size)
+        result = make_result(resume)
+        candidates = make_candidates(resume)
+        question_text = " ".join(
+            q.question + " " + q.intent for q in result.interview_questions
+        ).lower()
+
+        cases[f"extract_resume_features[{size}]"] = partial(
+            extract_resume_features, resume
+        )
+        cases[f"build_interview_questions_prompt[{size}]"] = partial(
+            builder.build_interview_questions_prompt, resume
+        )
+        cases[f"build_learning_path_prompt[{size}]"] = partial(
+            builder.build_learning_path_prompt, resume
+        )
+        cases[f"_calculate_relevance[{size}]"] = partial(
+            evaluator._calculate_relevance, question_text, resume
+        )
+        cases[f"evaluate_coaching_result[{size}]"] = partial(
+            evaluator.evaluate_coaching_result, result, resume
+        )
+        cases[f"evaluate_candidates[{size}]"] = partial(
+            evaluator.evaluate_candidates, candidates, resume
+        )
+
+    return cases
+
+
+def measure(
+    func: Callable[[], Any], repeat: int = 5, min_time: float = 0.2
+) -> Dict[str, Any]:
+    """
+    호출당 실행 시간 측정
+
+    한 라운드가 min_time 이상 걸리도록 반복 횟수를 정한 뒤 repeat 라운드를 실행하고,
+    라운드별 호출당 시간의 min/median/mean을 초 단위로 반환합니다.
+    """
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        if timer.timeit(number) >= min_time:
+            break
+        number *= 2
+
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        rounds = [timer.timeit(number) / number for _ in range(repeat)]
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return {
+        "min_seconds": min(rounds),
+        "median_seconds": statistics.median(rounds),
+        "mean_seconds": statistics.fmean(rounds),
+        "rounds": repeat,
+        "iterations": number,
+    }
+
+
+def run_micro_benchmarks(
+    keyword: Optional[str] = None, repeat: int = 5, min_time: float = 0.2
+) -> Dict[str, Any]:
+    """이름에 keyword가 포함된 벤치마크를 실행하고 결과 보고서 반환"""
+    results: Dict[str, Any] = {}
+    for name, func in build_cases().items():
+        if keyword and keyword not in name:
+            continue
+        results[name] = measure(func, repeat=repeat, min_time=min_time)
+
+    return {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "config": {"repeat": repeat, "min_time": min_time},
+        },
+        "results": results,
+    }
+
+
+def compare_with_baseline(
+    current: Dict[str, Any], baseline: Dict[str, Any], threshold: float
+) -> List[Tuple[str, float, float]]:
+    """기준 결과 대비 최소 시간이 threshold 비율을 넘어 증가한 (이름, 기준, 현재) 목록"""
+    regressions = []
+    for name, result in current["results"].items():
+        base = baseline.get("results", {}).get(name)
+        if base is None or not base["min_seconds"]:
+            continue
+        if result["min_seconds"] > base["min_seconds"] * (1 + threshold):
+            regressions.append((name, base["min_seconds"], result["min_seconds"]))
+    return regressions
+
+
+def _print_table(
+    report: Dict[str, Any], baseline: Optional[Dict[str, Any]] = None
+) -> None:
+    width = max((len(name) for name in report["results"]), default=0)
+    for name, result in report["results"].items():
+        line = (
+            f"{name:<{width}}  min {result['min_seconds'] * 1e6:10.2f}us  "
+            f"median {result['median_seconds'] * 1e6:10.2f}us"
+        )
+        base = (baseline or {}).get("results", {}).get(name)
+        if base and base["min_seconds"]:
+            line += f"  ({result['min_seconds'] / base['min_seconds']:.2f}x 기준)"
+        print(line, file=sys.stderr)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """마이크로 벤치마크 진입점"""
+    parser = argparse.ArgumentParser(
+        prog="python -m benchmarks.micro",
+        description="PromptBuilder/QualityEvaluator 마이크로 벤치마크",
+    )
+    parser.add_argument("-k", "--keyword", help="이름에 포함된 벤치마크만 실행")
+    parser.add_argument("--repeat", type=int, default=5, help="측정 라운드 수")
+    parser.add_argument("--min-time", type=float, default=0.2, help="라운드당 최소 측정 시간 (초)")
+    parser.add_argument("-o", "--output", help="결과 JSON 파일 경로")
+    parser.add_argument(
+        "--save-baseline",
+        nargs="?",
+        const=str(DEFAULT_BASELINE_PATH),
+        help="결과를 기준 파일로 저장 (기본: benchmarks/baselines/micro.json)",
+    )
+    parser.add_argument(
+        "--baseline",
+        nargs="?",
+        const=str(DEFAULT_BASELINE_PATH),
+        help="비교할 기준 결과 JSON 파일 (기본: benchmarks/baselines/micro.json)",
+    )
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="허용 회귀 비율 (기본 20%%)"
+    )
+    args = parser.parse_args(argv)
+
+    report = run_micro_benchmarks(args.keyword, args.repeat, args.min_time)
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    _print_table(report, baseline)
+
+    output = json.dumps(report, ensure_ascii=False, indent=2)
+    for path in (args.output, args.save_baseline):
+        if path:
+            Path(path).parent.mkdir(parents=True, exist_ok=True)
+            with open(path, "w", encoding="utf-8") as f:
+                f.write(output + "\n")
+    if not args.output and not args.save_baseline:
+        print(output)
+
+    if baseline is not None:
+        regressions = compare_with_baseline(report, baseline, args.threshold)
+        for name, base, current in regressions:
+            print(
+                f"회귀 감지: {name} {base * 1e6:.2f}us → {current * 1e6:.2f}us",
+                file=sys.stderr,
+            )
+        if regressions:
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -286,3 +286,178 @@ class TestAPIDocumentation:
 
         assert response.status_code == 200
         assert "text/html" in response.headers["content-type"]
+
+
+class TestHealthProbes:
+    """라이브니스/레디니스 엔드포인트 테스트"""
+
+    def test_liveness_has_no_dependencies(self, client):
+        """라이브니스는 외부 의존성 없이 항상 응답"""
+        response = client.get("/api/v1/health/live")
+
+        assert response.status_code == 200
+        assert response.json()["status"] == "alive"
+
+    def test_readiness_reflects_cached_llm_status(self, client):
+        """레디니스는 캐시된 LLM 상태에 따라 200/503 반환"""
+        from app.services.coaching_service import get_coaching_service
+
+        class StubService:
+            ready = True
+
+            def get_readiness(self):
+                return {"ready": self.ready, "llm": {"available": self.ready}}
+
+        stub = StubService()
+        app.dependency_overrides[get_coaching_service] = lambda: stub
+        try:
+            assert client.get("/api/v1/health/ready").status_code == 200
+
+            stub.ready = False
+            assert client.get("/api/v1/health/ready").status_code == 503
+        finally:
+            app.dependency_overrides.clear()
+
+
+class TestStreamingEndpoint:
+    """스트리밍 엔드포인트 테스트"""
+
+    def test_stream_returns_server_sent_events(self, client, sample_request):
+        """이벤트를 text/event-stream 형식으로 전달"""
+        from app.services.coaching_service import get_coaching_service
+
+        class StubService:
+            async def stream_coaching_session(
+                self, resume_data, use_cache=True, deadline=None
+            ):
+                yield "session", {"session_id": "abc"}
+                yield "interview_question", {"question": "질문"}
+                yield "complete", {"session_id": "abc"}
+
+        app.dependency_overrides[get_coaching_service] = lambda: StubService()
+        try:
+            response = client.post(
+                "/api/v1/coaching-sessions/stream", json=sample_request
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        assert response.text.split("\n\n")[:3] == [
+            'event: session\ndata: {"session_id": "abc"}',
+            'event: interview_question\ndata: {"question": "질문"}',
+            'event: complete\ndata: {"session_id": "abc"}',
+        ]
+
+
+class TestCoachingJobEndpoints:
+    """비동기 코칭 작업 엔드포인트 테스트"""
+
+    def test_submit_and_poll_job(self, client, sample_request):
+        """작업 등록 시 202와 작업 ID를 반환하고 상태 조회 가능"""
+        from app.services.job_queue import CoachingJob, get_job_queue
+
+        class StubQueue:
+            def __init__(self):
+                self.jobs = {}
+
+            async def submit(self, payload):
+                job = CoachingJob(payload=payload.model_dump())
+                self.jobs[job.job_id] = job
+                return job
+
+            async def get(self, job_id):
+                return self.jobs.get(job_id)
+
+        stub = StubQueue()
+        app.dependency_overrides[get_job_queue] = lambda: stub
+        try:
+            response = client.post("/api/v1/coaching-jobs", json=sample_request)
+            assert response.status_code == 202
+            job_id = response.json()["job_id"]
+            assert response.json()["status"] == "queued"
+
+            response = client.get(f"/api/v1/coaching-jobs/{job_id}")
+            assert response.status_code == 200
+            assert response.json()["result"] is None
+
+            assert client.get("/api/v1/coaching-jobs/unknown").status_code == 404
+        finally:
+            app.dependency_overrides.clear()
+
+
+class TestBatchEndpoint:
+    """일괄 처리 엔드포인트 테스트"""
+
+    def test_batch_streams_jsonl_results(self, client, sample_request):
+        """JSONL 본문을 처리하고 항목별 결과를 JSONL로 반환"""
+        import json
+        from app.services.coaching_service import get_coaching_service
+
+        class StubService:
+            async def create_coaching_session(self, payload, **kwargs):
+                return CoachingResult(
+                    interview_questions=[
+                        InterviewQuestion(
+                            question=f"질문 {i}", intent="의도", category="Behavioral"
+                        )
+                        for i in range(5)
+                    ],
+                    learning_path=LearningPath(summary="요약", steps=[]),
+                )
+
+        body = "\n".join([json.dumps({**sample_request, "id": "a"}), "{bad"])
+        app.dependency_overrides[get_coaching_service] = lambda: StubService()
+        try:
+            response = client.post(
+                "/api/v1/coaching-sessions:batch?concurrency=2",
+                content=body.encode("utf-8"),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        records = {r["index"]: r for r in map(json.loads, response.text.splitlines())}
+        assert records[0]["id"] == "a" and records[0]["status"] == "succeeded"
+        assert records[1]["status"] == "failed"
+
+    def test_batch_items_get_request_deadline(self, client, sample_request):
+        """일괄 처리 항목마다 단일 세션 요청과 같은 데드라인을 전달"""
+        import json
+        from app.core.config import settings
+        from app.services.coaching_service import get_coaching_service
+
+        deadlines = []
+
+        class StubService:
+            async def create_coaching_session(self, payload, deadline=None, **kwargs):
+                deadlines.append(deadline)
+                return CoachingResult(
+                    interview_questions=[
+                        InterviewQuestion(
+                            question=f"질문 {i}", intent="의도", category="Behavioral"
+                        )
+                        for i in range(5)
+                    ],
+                    learning_path=LearningPath(summary="요약", steps=[]),
+                )
+
+        body = "\n".join([json.dumps(sample_request)] * 2)
+        app.dependency_overrides[get_coaching_service] = lambda: StubService()
+        try:
+            response = client.post(
+                "/api/v1/coaching-sessions:batch",
+                content=body.encode("utf-8"),
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+        finally:
+            app.dependency_overrides.clear()
+
+        assert response.status_code == 200
+        assert len(deadlines) == 2
+        assert deadlines[0] is not deadlines[1]
+        for deadline in deadlines:
+            assert 0 < deadline.remaining() <= settings.request_timeout_seconds
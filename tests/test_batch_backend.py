@@ -0,0 +1,146 @@
+import json
+import httpx
+import pytest
+from app.services.batch_backend import (
+    BatchBackendError,
+    LocalBatchService,
+    OpenAIBatchService,
+    build_batch_request,
+    parse_batch_output,
+)
+
+
+def output_line(custom_id, content=None, error=None):
+    """Batch API 출력 줄 생성"""
+    response = (
+        {"status_code": 200, "body": {"choices": [{"message": {"content": content}}]}}
+        if error is None
+        else None
+    )
+    return json.dumps({"custom_id": custom_id, "response": response, "error": error})
+
+
+class TestBatchFormat:
+    """Batch API 입력/출력 형식 테스트"""
+
+    def test_request_matches_json_completion_body(self):
+        """입력 줄은 JSON 모드 chat completion 요청"""
+        request = build_batch_request("0:learning_path", "프롬프트", max_tokens=100)
+
+        assert request["url"] == "/v1/chat/completions"
+        assert request["body"]["response_format"] == {"type": "json_object"}
+        assert request["body"]["max_tokens"] == 100
+        assert request["body"]["messages"][0]["content"].startswith("프롬프트")
+
+    def test_failed_requests_map_to_none(self):
+        """실패한 요청은 None으로 변환"""
+        output = "\n".join(
+            [output_line("a", content="{}"), output_line("b", error={"message": "x"})]
+        )
+
+        assert parse_batch_output(output) == {"a": "{}", "b": None}
+
+
+class TestLocalBatchService:
+    """파일 기반 배치 대역 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_responder_produces_output(self, tmp_path):
+        """responder로 출력 파일을 만들고 custom_id별 응답 반환"""
+        service = LocalBatchService(
+            str(tmp_path), responder=lambda body: body["messages"][0]["content"][:4]
+        )
+
+        contents = await service.run(
+            [build_batch_request("a", "첫번째 프롬프트")],
+            poll_interval_seconds=0,
+            timeout_seconds=1,
+        )
+
+        assert contents == {"a": "첫번째 "}
+
+    @pytest.mark.asyncio
+    async def test_times_out_without_output(self, tmp_path):
+        """출력 파일이 생기지 않으면 시간 초과"""
+        service = LocalBatchService(str(tmp_path))
+
+        with pytest.raises(BatchBackendError):
+            await service.run(
+                [build_batch_request("a", "프롬프트")],
+                poll_interval_seconds=0.01,
+                timeout_seconds=0.03,
+            )
+
+
+class TestOpenAIBatchService:
+    """OpenAI Batch API 클라이언트 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_upload_create_poll_and_download(self):
+        """파일 업로드 → 배치 생성 → 폴링 → 출력 파일 다운로드"""
+        calls = []
+        polls = iter(["in_progress", "completed"])
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append((request.method, request.url.path))
+            if request.url.path == "/v1/files":
+                assert b'name="purpose"' in request.content
+                return httpx.Response(200, json={"id": "file-in"})
+            if request.url.path == "/v1/batches":
+                body = json.loads(request.content)
+                assert body["input_file_id"] == "file-in"
+                return httpx.Response(200, json={"id": "batch-1"})
+            if request.url.path == "/v1/batches/batch-1":
+                status = next(polls)
+                data = {"id": "batch-1", "status": status}
+                if status == "completed":
+                    data["output_file_id"] = "file-out"
+                return httpx.Response(200, json=data)
+            if request.url.path == "/v1/files/file-out/content":
+                return httpx.Response(200, text=output_line("a", content="응답"))
+            return httpx.Response(404)
+
+        http_client = httpx.AsyncClient(
+            base_url="https://api.test/v1", transport=httpx.MockTransport(handler)
+        )
+        service = OpenAIBatchService(api_key="test-key", http_client=http_client)
+
+        contents = await service.run(
+            [build_batch_request("a", "프롬프트")],
+            poll_interval_seconds=0,
+            timeout_seconds=1,
+        )
+
+        assert contents == {"a": "응답"}
+        assert calls[0] == ("POST", "/v1/files")
+        assert calls[-1] == ("GET", "/v1/files/file-out/content")
+
+    @pytest.mark.asyncio
+    async def test_failed_batch_raises(self):
+        """배치가 실패 상태로 끝나면 오류"""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            if request.method == "POST":
+                return httpx.Response(200, json={"id": "x"})
+            return httpx.Response(200, json={"id": "x", "status": "expired"})
+
+        http_client = httpx.AsyncClient(
+            base_url="https://api.test/v1", transport=httpx.MockTransport(handler)
+        )
+        service = OpenAIBatchService(api_key="test-key", http_client=http_client)
+
+        with pytest.raises(BatchBackendError):
+            await service.run([], poll_interval_seconds=0, timeout_seconds=1)
+
+    @pytest.mark.asyncio
+    async def test_aclose_closes_only_owned_client(self):
+        """직접 만든 HTTP 클라이언트만 닫고 주입받은 클라이언트는 유지"""
+        async with OpenAIBatchService(api_key="test-key") as service:
+            owned = service.http_client
+        assert owned.is_closed
+
+        injected = httpx.AsyncClient(base_url="https://api.test/v1")
+        async with OpenAIBatchService(api_key="test-key", http_client=injected):
+            pass
+        assert not injected.is_closed
+        await injected.aclose()
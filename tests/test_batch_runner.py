@@ -0,0 +1,184 @@
+import asyncio
+import io
+import json
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+from app.cli import run_batch_file, run_offline_batch_file
+from app.schemas.coaching import CoachingResult, InterviewQuestion, LearningPath
+from app.services.batch_backend import (
+    BatchBackendError,
+    BatchService,
+    LocalBatchService,
+)
+from app.services.batch_runner import parse_jsonl, run_batch
+
+
+RESUME = {
+    "career_summary": "3년차 백엔드 개발자, Spring Boot/MSA/Python 기반 커머스 서비스 개발",
+    "job_duties": "주문 및 결제 시스템 MSA 전환 프로젝트 리딩, Python 기반 데이터 배치 처리 시스템 구축",
+    "technical_skills": ["Spring Boot", "MSA", "Python"],
+}
+
+
+def make_result() -> CoachingResult:
+    """테스트용 코칭 결과"""
+    return CoachingResult(
+        session_id=uuid4(),
+        interview_questions=[
+            InterviewQuestion(question=f"질문 {i}", intent="의도", category="Behavioral")
+            for i in range(5)
+        ],
+        learning_path=LearningPath(summary="요약", steps=[]),
+    )
+
+
+def jsonl(*records) -> str:
+    """레코드를 JSONL 문자열로 변환"""
+    return "\n".join(
+        r if isinstance(r, str) else json.dumps(r, ensure_ascii=False) for r in records
+    )
+
+
+class TestParseJsonl:
+    """JSONL 입력 파싱 테스트"""
+
+    def test_valid_invalid_and_blank_lines(self):
+        """정상 줄은 페이로드로, 오류 줄은 항목별 오류로 변환하고 빈 줄은 무시"""
+        text = jsonl(
+            {**RESUME, "id": "a"},
+            "",
+            "{not json",
+            {"career_summary": "짧음"},
+        )
+
+        items = list(parse_jsonl(text.splitlines()))
+
+        assert [item.index for item in items] == [0, 1, 2]
+        assert items[0].item_id == "a" and items[0].payload is not None
+        assert items[1].error.startswith("JSON 형식 오류")
+        assert items[2].error.startswith("유효성 검사 실패")
+
+
+class TestRunBatch:
+    """배치 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrency_window_and_completion_order(self):
+        """동시 실행 수를 제한하고 완료 순서대로 결과 전달"""
+        active = 0
+        peak = 0
+
+        async def runner(payload):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            # 먼저 등록된 항목이 더 늦게 끝나도록 지연
+            await asyncio.sleep(0.01 * (5 - len(payload.technical_skills)))
+            active -= 1
+            return make_result()
+
+        lines = [
+            json.dumps({**RESUME, "technical_skills": ["s"] * (i + 1)})
+            for i in range(4)
+        ]
+        records = [
+            r async for r in run_batch(parse_jsonl(lines), runner, concurrency=2)
+        ]
+
+        assert peak == 2
+        assert sorted(r["index"] for r in records) == [0, 1, 2, 3]
+        assert records[0]["index"] == 1
+        assert all(r["status"] == "succeeded" for r in records)
+
+    @pytest.mark.asyncio
+    async def test_item_failure_does_not_stop_batch(self):
+        """항목별 실패는 해당 레코드에만 기록"""
+
+        async def runner(payload):
+            if "Python" in payload.technical_skills:
+                raise RuntimeError("생성 실패")
+            return make_result()
+
+        lines = [json.dumps(RESUME), json.dumps({**RESUME, "technical_skills": ["Go"]})]
+        records = [
+            r async for r in run_batch(parse_jsonl(lines), runner, concurrency=4)
+        ]
+
+        by_index = {r["index"]: r for r in records}
+        assert by_index[0]["status"] == "failed"
+        assert by_index[0]["error"] == "생성 실패"
+        assert by_index[1]["status"] == "succeeded"
+
+
+class TestBatchCli:
+    """CLI 일괄 처리 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_run_batch_file_writes_jsonl(self):
+        """입력 파일을 처리하고 결과를 JSONL로 기록"""
+
+        class StubService:
+            async def create_coaching_session(self, payload, **kwargs):
+                return make_result()
+
+        source = io.StringIO(jsonl(RESUME, "{bad"))
+        output = io.StringIO()
+        with patch("app.cli.get_coaching_service", return_value=StubService()):
+            summary = await run_batch_file(source, output, concurrency=2)
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert summary == {"succeeded": 1, "failed": 1}
+        assert len(records) == 2
+
+    @pytest.mark.asyncio
+    async def test_offline_batch_file_closes_batch_service(self):
+        """오프라인 일괄 처리가 끝나면 배치 서비스를 닫음"""
+
+        class StubBatchService(BatchService):
+            closed = False
+
+            async def submit(self, requests):
+                return "batch"
+
+            async def get_status(self, batch_id):
+                return "completed"
+
+            async def get_output(self, batch_id):
+                return ""
+
+            async def aclose(self):
+                self.closed = True
+
+        async def create_offline(payloads, batch_service):
+            return [make_result() for _ in payloads]
+
+        batch_service = StubBatchService()
+        output = io.StringIO()
+        with patch("app.cli.create_coaching_sessions_offline", create_offline):
+            summary = await run_offline_batch_file(
+                io.StringIO(jsonl(RESUME)), output, batch_service
+            )
+
+        assert summary == {"succeeded": 1, "failed": 0}
+        assert batch_service.closed
+
+    @pytest.mark.asyncio
+    async def test_offline_batch_failure_is_recorded_per_item(self, tmp_path):
+        """배치 작업이 실패하면 항목별 실패 레코드를 기록"""
+
+        class FailingBatchService(LocalBatchService):
+            async def submit(self, requests):
+                raise BatchBackendError("배치 제출 실패")
+
+        source = io.StringIO(jsonl(RESUME, RESUME, "{bad"))
+        output = io.StringIO()
+        summary = await run_offline_batch_file(
+            source, output, FailingBatchService(str(tmp_path))
+        )
+
+        records = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert summary == {"succeeded": 0, "failed": 3}
+        assert [r["status"] for r in records] == ["failed"] * 3
+        assert records[0]["error"] == "배치 제출 실패"
+        assert records[1]["error"] == "배치 제출 실패"
@@ -0,0 +1,149 @@
+from app.services.circuit_breaker import CircuitBreaker, CLOSED, HALF_OPEN, OPEN
+
+
+class FakeClock:
+    """수동으로 시간을 진행시키는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock=None):
+    """테스트용 서킷 브레이커"""
+    return CircuitBreaker(
+        failure_rate_threshold=0.5,
+        window_size=10,
+        min_calls=4,
+        open_seconds=30,
+        half_open_max_calls=2,
+        clock=clock or FakeClock(),
+    )
+
+
+def trip(breaker):
+    """최소 호출 수만큼 실패시켜 브레이커를 열기"""
+    for _ in range(4):
+        breaker.record_failure(breaker.allow_request())
+
+
+class TestCircuitBreaker:
+    """서킷 브레이커 상태 전이 테스트"""
+
+    def test_stays_closed_below_min_calls(self):
+        """최소 호출 수 미만이면 실패해도 닫힌 상태 유지"""
+        breaker = make_breaker()
+        for _ in range(3):
+            permit = breaker.allow_request()
+            assert permit is not None
+            breaker.record_failure(permit)
+
+        assert breaker.state == CLOSED
+
+    def test_opens_at_failure_rate_and_rejects(self):
+        """실패율이 임계값에 도달하면 열리고 요청을 즉시 거부"""
+        breaker = make_breaker()
+        for ok in [True, False, True, False]:
+            permit = breaker.allow_request()
+            breaker.record_success(permit) if ok else breaker.record_failure(permit)
+
+        assert breaker.state == OPEN
+        assert breaker.allow_request() is None
+        assert breaker.get_status()["rejected"] == 1
+
+    def test_half_open_limits_probe_traffic_and_closes(self):
+        """대기 시간 후 제한된 요청만 허용하고 모두 성공하면 닫힘"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        trip(breaker)
+
+        clock.now = 31
+        first = breaker.allow_request()
+        assert first is not None and first.probe
+        assert breaker.state == HALF_OPEN
+        second = breaker.allow_request()
+        assert second is not None
+        assert breaker.allow_request() is None
+
+        breaker.record_success(first)
+        breaker.record_success(second)
+        assert breaker.state == CLOSED
+        assert breaker.failure_rate == 0.0
+
+    def test_half_open_failure_reopens(self):
+        """half-open 상태에서 실패하면 다시 열림"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        trip(breaker)
+
+        clock.now = 31
+        breaker.record_failure(breaker.allow_request())
+
+        assert breaker.state == OPEN
+        assert breaker.allow_request() is None
+
+    def test_release_frees_half_open_slot(self):
+        """취소된 요청은 half-open 슬롯을 반환"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        trip(breaker)
+
+        clock.now = 31
+        breaker.allow_request()
+        permit = breaker.allow_request()
+        breaker.release(permit)
+
+        assert breaker.allow_request() is not None
+
+    def test_stale_success_does_not_close_half_open(self):
+        """closed 상태에서 허가된 요청의 늦은 성공은 프로브 없이 브레이커를 닫지 않음"""
+        clock = FakeClock()
+        breaker = CircuitBreaker(
+            failure_rate_threshold=0.5,
+            window_size=10,
+            min_calls=2,
+            open_seconds=30,
+            half_open_max_calls=1,
+            clock=clock,
+        )
+        permits = [breaker.allow_request() for _ in range(3)]
+        breaker.record_failure(permits[0])
+        breaker.record_failure(permits[1])
+        assert breaker.state == OPEN
+
+        clock.now = 31
+        probe = breaker.allow_request()
+        breaker.record_success(permits[2])
+
+        assert breaker.state == HALF_OPEN
+        assert breaker.get_status()["stale_outcomes"] == 1
+
+        breaker.record_success(probe)
+        assert breaker.state == CLOSED
+
+    def test_stale_failures_do_not_reopen_or_extend_open_window(self):
+        """이전 세대의 늦은 실패는 half-open 슬롯과 open 대기 시간을 바꾸지 않음"""
+        clock = FakeClock()
+        breaker = make_breaker(clock)
+        in_flight = [breaker.allow_request() for _ in range(6)]
+        for permit in in_flight[:4]:
+            breaker.record_failure(permit)
+        assert breaker.state == OPEN
+
+        # open 중 늦게 끝난 실패가 대기 시간을 다시 시작하지 않음
+        clock.now = 20
+        breaker.record_failure(in_flight[4])
+        clock.now = 31
+        probe = breaker.allow_request()
+        assert breaker.state == HALF_OPEN
+
+        # half-open 중 늦게 끝난 실패가 다시 열거나 슬롯 수를 음수로 만들지 않음
+        breaker.record_failure(in_flight[5])
+        assert breaker.state == HALF_OPEN
+        assert breaker.allow_request() is not None
+        assert breaker.allow_request() is None
+
+        breaker.record_failure(probe)
+        assert breaker.state == OPEN
@@ -0,0 +1,531 @@
+import asyncio
+import json
+import pytest
+from contextlib import ExitStack
+from unittest.mock import patch
+from app.core.config import settings
+from app.core.executor import CPUExecutor
+from app.core.deadline import Deadline
+from app.schemas.coaching import ResumePayload
+from app.services.candidate_planner import CandidatePlanner
+from app.services.coaching_service import (
+    CoachingService,
+    _gather_or_cancel,
+    create_coaching_sessions_offline,
+)
+from app.services.llm_client import CircuitOpenError
+from app.services.prompt_builder import PromptBuilder
+from app.services.resume_features import extract_resume_features
+from app.services.result_parser import parse_interview_questions
+
+
+INTERVIEW_RESPONSE = json.dumps(
+    {
+        "interview_questions": [
+            {
+                "question": f"MSA 전환 프로젝트에서 경험한 구체적인 사례 {i + 1}을 설명해주세요?",
+                "intent": "실무 경험과 문제 해결 능력을 평가합니다",
+                "category": "Technical Deep-Dive",
+            }
+            for i in range(5)
+        ]
+    },
+    ensure_ascii=False,
+)
+
+LEARNING_PATH_RESPONSE = json.dumps(
+    {
+        "learning_path": {
+            "summary": "MSA 경험을 바탕으로 분산 시스템 역량 강화",
+            "steps": [
+                {
+                    "title": "분산 트랜잭션 프로젝트 구축",
+                    "description": "Saga 패턴을 적용한 주문 처리 사이드 프로젝트를 구현",
+                    "resources": ["Saga 패턴", "Spring Boot"],
+                }
+            ],
+        }
+    },
+    ensure_ascii=False,
+)
+
+
+class FakeLLMClient:
+    """프롬프트 종류에 따라 고정 응답을 반환하는 테스트용 LLM 클라이언트"""
+
+    def __init__(self):
+        self.prompts = []
+
+    async def generate_json_completion(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        if '"interview_questions"' in prompt:
+            return INTERVIEW_RESPONSE
+        return LEARNING_PATH_RESPONSE
+
+    async def stream_json_completion(self, prompt, **kwargs):
+        response = await self.generate_json_completion(prompt, **kwargs)
+        for start in range(0, len(response), 7):
+            await asyncio.sleep(0)
+            yield response[start : start + 7]
+
+    def get_metrics(self):
+        return {}
+
+
+@pytest.fixture
+def sample_resume():
+    """샘플 이력서"""
+    return ResumePayload(
+        career_summary="3년차 백엔드 개발자, Spring Boot/MSA/Python 기반 커머스 서비스 개발",
+        job_duties="주문 및 결제 시스템 MSA 전환 프로젝트 리딩, Python 기반 데이터 배치 처리 시스템 구축",
+        technical_skills=["Spring Boot", "MSA", "Python", "AWS EC2", "MySQL"],
+    )
+
+
+@pytest.fixture
+def fake_llm_client():
+    """테스트용 LLM 클라이언트"""
+    return FakeLLMClient()
+
+
+@pytest.fixture
+def coaching_service(fake_llm_client):
+    """테스트용 LLM 클라이언트를 사용하는 코칭 서비스"""
+    with patch(
+        "app.services.coaching_service.get_llm_client", return_value=fake_llm_client
+    ):
+        yield CoachingService()
+
+
+class TestCandidatePlanner:
+    """후보 계획 수립 테스트"""
+
+    def test_plan_deduplicates_learning_path_prompts(self, sample_resume):
+        """학습 경로 프롬프트는 페르소나별로 한 번만 포함"""
+        planner = CandidatePlanner(PromptBuilder())
+        plan = planner.plan(
+            sample_resume,
+            ["balanced", "technical_deep", "system_design"],
+            ["senior_engineer", "tech_lead", "platform_architect"],
+        )
+
+        assert len(plan.specs) == 9
+        assert plan.total_requests == 18
+        assert plan.unique_requests == 12
+
+    def test_plan_shares_prompt_objects_per_persona(self, sample_resume):
+        """같은 페르소나의 후보는 동일한 학습 경로 프롬프트를 공유"""
+        planner = CandidatePlanner(PromptBuilder())
+        plan = planner.plan(
+            sample_resume, ["balanced", "technical_deep"], ["tech_lead"]
+        )
+
+        assert plan.specs[0].learning_path_prompt == plan.specs[1].learning_path_prompt
+        assert plan.specs[0].interview_prompt != plan.specs[1].interview_prompt
+
+
+class TestOptimizedSession:
+    """품질 최적화 세션 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_optimized_session_issues_unique_requests_only(
+        self, coaching_service, fake_llm_client, sample_resume
+    ):
+        """최적화 세션은 고유 프롬프트 수만큼만 LLM을 호출"""
+        result = await coaching_service._create_optimized_session(sample_resume)
+
+        assert len(result.interview_questions) == 5
+        assert len(fake_llm_client.prompts) == 12
+        assert len(set(fake_llm_client.prompts)) == 12
+
+    @pytest.mark.asyncio
+    async def test_resume_features_are_extracted_once_per_session(
+        self, coaching_service, sample_resume
+    ):
+        """이력서 특징은 세션당 한 번만 추출되어 프롬프트 구성과 품질 평가에 공유"""
+        modules = [
+            "app.services.coaching_service",
+            "app.services.prompt_builder",
+            "app.services.quality_evaluator",
+        ]
+        with ExitStack() as stack:
+            extractors = [
+                stack.enter_context(
+                    patch(
+                        f"{module}.extract_resume_features",
+                        wraps=extract_resume_features,
+                    )
+                )
+                for module in modules
+            ]
+            await coaching_service._create_session(sample_resume, True, "features-once")
+
+        assert [extractor.call_count for extractor in extractors] == [1, 0, 0]
+
+    @pytest.mark.asyncio
+    async def test_candidates_are_parsed_and_scored_in_executor_batches(
+        self, coaching_service, sample_resume
+    ):
+        """함께 완료된 후보는 실행기 작업 하나로 묶어 파싱/평가"""
+        coaching_service.cpu_executor = CPUExecutor("thread", max_workers=1)
+        try:
+            with patch.object(settings, "optimization_early_exit", False):
+                result = await coaching_service._create_optimized_session(sample_resume)
+        finally:
+            coaching_service.cpu_executor.shutdown()
+
+        metrics = coaching_service.get_metrics()["cpu_executor"]
+        assert len(result.interview_questions) == 5
+        assert metrics["items"] == 9
+        assert metrics["tasks"] < 9
+
+
+class TestGatherOrCancel:
+    """후보 내부 동시 실행 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_returns_results_in_order(self):
+        """모든 작업이 성공하면 입력 순서대로 결과 반환"""
+
+        async def delayed(value, delay):
+            await asyncio.sleep(delay)
+            return value
+
+        results = await _gather_or_cancel(delayed("a", 0.02), delayed("b", 0.0))
+
+        assert results == ["a", "b"]
+
+    @pytest.mark.asyncio
+    async def test_failure_cancels_sibling(self):
+        """한 작업이 실패하면 나머지 작업은 취소"""
+        sibling_cancelled = asyncio.Event()
+
+        async def failing():
+            raise ValueError("실패")
+
+        async def slow():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                sibling_cancelled.set()
+                raise
+
+        with pytest.raises(ValueError):
+            await _gather_or_cancel(slow(), failing())
+
+        assert sibling_cancelled.is_set()
+
+    @pytest.mark.asyncio
+    async def test_caller_cancellation_waits_for_children(self):
+        """호출자가 취소되면 하위 작업의 정리가 끝난 뒤 취소를 전파"""
+        cleaned_up = []
+
+        async def child():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                await asyncio.sleep(0)
+                cleaned_up.append(True)
+                raise
+
+        task = asyncio.ensure_future(_gather_or_cancel(child(), child()))
+        await asyncio.sleep(0)
+        task.cancel()
+
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert cleaned_up == [True, True]
+
+
+class SlowLLMClient(FakeLLMClient):
+    """특정 프롬프트에 대해 응답을 지연시키는 테스트용 LLM 클라이언트"""
+
+    def __init__(self, slow_marker, delay=10.0):
+        super().__init__()
+        self.slow_marker = slow_marker
+        self.delay = delay
+        self.cancelled = 0
+
+    async def generate_json_completion(self, prompt, **kwargs):
+        if self.slow_marker in prompt:
+            try:
+                await asyncio.sleep(self.delay)
+            except asyncio.CancelledError:
+                self.cancelled += 1
+                raise
+        return await super().generate_json_completion(prompt, **kwargs)
+
+
+class TestCandidateRacing:
+    """후보 경쟁 (조기 종료) 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_early_exit_cancels_outstanding_requests(self, sample_resume):
+        """임계값을 넘는 후보가 나오면 남은 요청을 취소하고 즉시 반환"""
+        slow_client = SlowLLMClient("대규모 시스템 확장성")  # system_design 예시
+        with patch(
+            "app.services.coaching_service.get_llm_client", return_value=slow_client
+        ):
+            service = CoachingService()
+
+        with patch.object(settings, "optimization_quality_threshold", 0.0):
+            result = await asyncio.wait_for(
+                service._create_optimized_session(sample_resume), timeout=2.0
+            )
+
+        assert len(result.interview_questions) == 5
+        assert slow_client.cancelled == 3
+
+    @pytest.mark.asyncio
+    async def test_deadline_returns_fallback_when_no_candidate(self, sample_resume):
+        """마감 시간까지 유효한 후보가 없으면 대체 콘텐츠 반환"""
+        slow_client = SlowLLMClient("")
+        with patch(
+            "app.services.coaching_service.get_llm_client", return_value=slow_client
+        ):
+            service = CoachingService()
+
+        with patch.object(settings, "optimization_deadline_seconds", 0.05):
+            result = await asyncio.wait_for(
+                service._create_optimized_session(sample_resume), timeout=2.0
+            )
+
+        fallback = service._generate_fallback_questions(sample_resume)
+        assert [q.question for q in result.interview_questions] == [
+            q.question for q in fallback
+        ]
+        assert slow_client.cancelled == 12
+
+    @pytest.mark.asyncio
+    async def test_min_candidates_waits_for_more_results(
+        self, coaching_service, fake_llm_client, sample_resume
+    ):
+        """최소 후보 수를 채울 때까지 조기 종료하지 않음"""
+        with patch.object(
+            settings, "optimization_quality_threshold", 0.0
+        ), patch.object(settings, "optimization_min_candidates", 9):
+            result = await coaching_service._create_optimized_session(sample_resume)
+
+        assert len(result.interview_questions) == 5
+        assert len(fake_llm_client.prompts) == 12
+
+
+class TestSessionResultCache:
+    """세션 결과 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_llm_and_issues_new_session_id(
+        self, coaching_service, fake_llm_client, sample_resume
+    ):
+        """캐시 적중 시 LLM 호출 없이 새 세션 ID로 반환"""
+        first = await coaching_service.create_coaching_session(
+            sample_resume, enable_quality_optimization=False
+        )
+        calls = len(fake_llm_client.prompts)
+
+        variant = sample_resume.model_copy(
+            update={"career_summary": sample_resume.career_summary.upper() + "  "}
+        )
+        second = await coaching_service.create_coaching_session(
+            variant, enable_quality_optimization=False
+        )
+
+        assert len(fake_llm_client.prompts) == calls
+        assert second.session_id != first.session_id
+        assert second.interview_questions == first.interview_questions
+
+    @pytest.mark.asyncio
+    async def test_bypass_flag_regenerates(
+        self, coaching_service, fake_llm_client, sample_resume
+    ):
+        """use_cache=False이면 캐시를 사용하지 않음"""
+        await coaching_service.create_coaching_session(
+            sample_resume, enable_quality_optimization=False
+        )
+        calls = len(fake_llm_client.prompts)
+
+        await coaching_service.create_coaching_session(
+            sample_resume, enable_quality_optimization=False, use_cache=False
+        )
+
+        assert len(fake_llm_client.prompts) == calls * 2
+
+
+class TestRequestCoalescing:
+    """동일 요청 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_requests_share_pipeline(
+        self, coaching_service, fake_llm_client, sample_resume
+    ):
+        """동시에 들어온 동일 요청은 한 번만 생성하고 세션 ID는 각각 발급"""
+        results = await asyncio.gather(
+            *(
+                coaching_service.create_coaching_session(
+                    sample_resume, enable_quality_optimization=False
+                )
+                for _ in range(3)
+            )
+        )
+
+        assert len(fake_llm_client.prompts) == 2
+        assert len({result.session_id for result in results}) == 3
+        assert coaching_service.get_metrics()["single_flight"]["collapsed"] == 2
+
+    @pytest.mark.asyncio
+    async def test_bypass_request_does_not_join_in_flight_session(
+        self, coaching_service, fake_llm_client, sample_resume
+    ):
+        """use_cache=False 요청은 진행 중인 동일 요청에 합류하지 않고 새로 생성"""
+        await asyncio.gather(
+            coaching_service.create_coaching_session(
+                sample_resume, enable_quality_optimization=False
+            ),
+            coaching_service.create_coaching_session(
+                sample_resume, enable_quality_optimization=False, use_cache=False
+            ),
+        )
+
+        assert len(fake_llm_client.prompts) == 4
+        assert coaching_service.get_metrics()["single_flight"]["collapsed"] == 0
+
+
+class OpenCircuitLLMClient(FakeLLMClient):
+    """서킷 브레이커가 열린 상태를 흉내내는 테스트용 LLM 클라이언트"""
+
+    async def generate_json_completion(self, prompt, **kwargs):
+        self.prompts.append(prompt)
+        raise CircuitOpenError("LLM 서킷 브레이커가 열려 있어 요청을 거부합니다.")
+
+
+class TestCircuitOpenFallback:
+    """서킷 브레이커 열림 시 대체 콘텐츠 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_serves_fallback_without_caching(self, sample_resume):
+        """브레이커가 열리면 대체 콘텐츠를 반환하고 캐시하지 않음"""
+        with patch(
+            "app.services.coaching_service.get_llm_client",
+            return_value=OpenCircuitLLMClient(),
+        ):
+            service = CoachingService()
+
+        result = await service.create_coaching_session(
+            sample_resume, enable_quality_optimization=False
+        )
+
+        assert result.interview_questions == service._generate_fallback_questions(
+            sample_resume
+        )
+        assert service.session_cache.get_metrics()["entries"] == 0
+
+
+class TestRequestDeadline:
+    """요청 데드라인 전파 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_request_deadline_bounds_optimized_session(self, sample_resume):
+        """요청 데드라인이 최적화 마감보다 짧으면 요청 데드라인을 따름"""
+        slow_client = SlowLLMClient("")
+        with patch(
+            "app.services.coaching_service.get_llm_client", return_value=slow_client
+        ):
+            service = CoachingService()
+
+        result = await asyncio.wait_for(
+            service.create_coaching_session(
+                sample_resume, deadline=Deadline.after(0.05)
+            ),
+            timeout=2.0,
+        )
+
+        assert result.interview_questions == service._generate_fallback_questions(
+            sample_resume
+        )
+
+
+class TestStreamingSession:
+    """스트리밍 코칭 세션 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_emits_items_before_complete(
+        self, coaching_service, sample_resume
+    ):
+        """면접 질문과 학습 단계를 생성되는 대로 전달하고 마지막에 최종 결과 전달"""
+        events = [
+            event
+            async for event in coaching_service.stream_coaching_session(sample_resume)
+        ]
+        names = [name for name, _ in events]
+
+        assert names[0] == "session"
+        assert names[-1] == "complete"
+        assert names.count("interview_question") == 5
+        assert names.count("learning_step") == 1
+
+        complete = events[-1][1]
+        assert complete["session_id"] == events[0][1]["session_id"]
+        assert len(complete["interview_questions"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_stream_result_is_cached(
+        self, coaching_service, fake_llm_client, sample_resume
+    ):
+        """스트리밍 결과는 세션 캐시에 저장되어 재요청 시 LLM을 호출하지 않음"""
+        _ = [e async for e in coaching_service.stream_coaching_session(sample_resume)]
+        calls = len(fake_llm_client.prompts)
+
+        events = [
+            e async for e in coaching_service.stream_coaching_session(sample_resume)
+        ]
+
+        assert len(fake_llm_client.prompts) == calls
+        assert events[-1][0] == "complete"
+
+
+class TestLenientParsing:
+    """LLM 응답 형식 오류 복구 테스트"""
+
+    def test_code_fenced_response_is_not_replaced_by_fallback(
+        self, coaching_service, sample_resume
+    ):
+        """코드 블록과 닫는 괄호 앞 쉼표가 있어도 생성된 질문 사용"""
+        response = "```json\n" + INTERVIEW_RESPONSE[:-2] + ",]}\n```"
+
+        questions = parse_interview_questions(response, sample_resume)
+
+        assert questions != coaching_service._generate_fallback_questions(sample_resume)
+        assert len(questions) == 5
+
+
+class TestOfflineBatchSessions:
+    """Batch API 기반 일괄 세션 생성 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_batch_results_map_back_through_parsers(
+        self, coaching_service, fake_llm_client, sample_resume, tmp_path
+    ):
+        """배치 응답을 기존 파서로 변환하고, 실패한 요청은 대체 콘텐츠 사용"""
+        from app.services.batch_backend import LocalBatchService
+
+        def responder(body):
+            prompt = body["messages"][0]["content"]
+            if '"interview_questions"' in prompt:
+                return INTERVIEW_RESPONSE
+            raise RuntimeError("요청 실패")
+
+        service = LocalBatchService(str(tmp_path), responder=responder)
+        with patch.object(settings, "batch_api_poll_interval_seconds", 0):
+            results = await create_coaching_sessions_offline(
+                [sample_resume, sample_resume], service
+            )
+
+        assert len(results) == 2
+        assert results[0].interview_questions != (
+            coaching_service._generate_fallback_questions(sample_resume)
+        )
+        assert results[0].learning_path == (
+            coaching_service._generate_fallback_learning_path(sample_resume)
+        )
+        assert fake_llm_client.prompts == []
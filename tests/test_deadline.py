@@ -0,0 +1,37 @@
+from app.core.deadline import Deadline
+
+
+class FakeClock:
+    """수동으로 시간을 진행시키는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDeadline:
+    """데드라인 테스트"""
+
+    def test_remaining_and_expired(self):
+        """남은 시간은 0 아래로 내려가지 않음"""
+        clock = FakeClock()
+        deadline = Deadline.after(10, clock=clock)
+
+        clock.now = 4
+        assert deadline.remaining() == 6
+        assert not deadline.expired
+
+        clock.now = 12
+        assert deadline.remaining() == 0
+        assert deadline.expired
+
+    def test_timeout_is_capped(self):
+        """시도별 타임아웃은 cap과 남은 시간 중 작은 값"""
+        clock = FakeClock()
+        deadline = Deadline.after(10, clock=clock)
+
+        assert deadline.timeout(30) == 10
+        assert deadline.timeout(5) == 5
+        assert deadline.timeout() == 10
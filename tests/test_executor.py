@@ -0,0 +1,93 @@
+import asyncio
+import threading
+import time
+import pytest
+from app.core.executor import CPUExecutor
+from app.core.loop_monitor import EventLoopLagMonitor
+
+
+def busy_wait(seconds):
+    """GIL을 주기적으로 놓는 CPU 작업 흉내"""
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+    return threading.current_thread().name
+
+
+def add(a, b):
+    return a + b
+
+
+class TestCPUExecutor:
+    """CPU 실행기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_thread_executor_runs_off_event_loop(self):
+        """스레드 실행기는 작업자 스레드에서 실행하고 지표를 기록"""
+        executor = CPUExecutor("thread", max_workers=1)
+        try:
+            thread_name = await executor.run(busy_wait, 0.01, items=3)
+        finally:
+            executor.shutdown()
+
+        assert thread_name.startswith("cpu-executor")
+        metrics = executor.get_metrics()
+        assert metrics["tasks"] == 1
+        assert metrics["items"] == 3
+        assert metrics["run_max_seconds"] >= 0.01
+
+    @pytest.mark.asyncio
+    async def test_none_executor_runs_inline(self):
+        """none 실행기는 이벤트 루프 스레드에서 직접 실행"""
+        executor = CPUExecutor("none")
+
+        thread_name = await executor.run(busy_wait, 0.0)
+
+        assert thread_name == threading.current_thread().name
+        assert executor.get_metrics()["tasks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_process_executor_runs_module_level_function(self):
+        """프로세스 실행기는 모듈 수준 함수를 작업자 프로세스에서 실행"""
+        executor = CPUExecutor("process", max_workers=1)
+        try:
+            assert await executor.run(add, 2, 3) == 5
+        finally:
+            executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_failure_is_counted_and_raised(self):
+        """작업 예외는 호출자에게 전달되고 실패로 집계"""
+        executor = CPUExecutor("none")
+
+        with pytest.raises(TypeError):
+            await executor.run(add, 1, "a")
+
+        assert executor.get_metrics()["failures"] == 1
+
+    @pytest.mark.asyncio
+    async def test_offloading_reduces_event_loop_lag(self):
+        """CPU 작업을 스레드로 넘기면 같은 작업을 루프에서 실행할 때보다 루프 지연이 작음"""
+
+        async def measure(executor):
+            monitor = EventLoopLagMonitor(interval_seconds=0.005)
+            monitor.start()
+            await asyncio.sleep(0.01)
+            try:
+                await executor.run(busy_wait, 0.1)
+                await asyncio.sleep(0.01)
+            finally:
+                await monitor.stop()
+                executor.shutdown()
+            return monitor.get_metrics()["lag_max_seconds"]
+
+        inline_lag = await measure(CPUExecutor("none"))
+        offloaded_lag = await measure(CPUExecutor("thread", max_workers=1))
+
+        assert inline_lag >= 0.09
+        assert offloaded_lag < inline_lag / 2
+
+    def test_unknown_kind_is_rejected(self):
+        """지원하지 않는 실행기 종류는 거부"""
+        with pytest.raises(ValueError):
+            CPUExecutor("gpu")
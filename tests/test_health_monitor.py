@@ -0,0 +1,96 @@
+import asyncio
+import pytest
+from app.services.health_monitor import LLMHealthMonitor
+
+
+class FakeClock:
+    """수동으로 시간을 진행시키는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_monitor(clock=None):
+    """테스트용 헬스 모니터"""
+    return LLMHealthMonitor(
+        window_seconds=60,
+        error_rate_threshold=0.5,
+        min_samples=4,
+        clock=clock or FakeClock(),
+    )
+
+
+class TestLLMHealthMonitor:
+    """LLM 헬스 모니터 테스트"""
+
+    def test_available_without_any_signal(self):
+        """표본과 프로브 결과가 없으면 가용으로 간주"""
+        assert make_monitor().is_available() is True
+
+    def test_passive_error_rate_marks_unavailable(self):
+        """실제 호출 오류율이 임계값 이상이면 불가"""
+        monitor = make_monitor()
+        monitor.record_success()
+        for _ in range(3):
+            monitor.record_failure()
+
+        assert monitor.passive_stats()["error_rate"] == 0.75
+        assert monitor.is_available() is False
+
+    def test_old_outcomes_expire(self):
+        """윈도우를 벗어난 결과는 제외"""
+        clock = FakeClock()
+        monitor = make_monitor(clock)
+        for _ in range(4):
+            monitor.record_failure()
+
+        clock.now = 61
+        assert monitor.passive_stats()["samples"] == 0
+        assert monitor.is_available() is True
+
+    @pytest.mark.asyncio
+    async def test_probe_result_used_when_samples_insufficient(self):
+        """표본이 부족하면 캐시된 프로브 결과 사용"""
+        monitor = make_monitor()
+
+        async def failing_probe():
+            raise ConnectionError("connection refused")
+
+        assert await monitor.run_probe(failing_probe) is False
+        assert monitor.is_available() is False
+        assert "connection refused" in monitor.get_status()["probe"]["error"]
+
+    @pytest.mark.asyncio
+    async def test_passive_signal_overrides_probe(self):
+        """표본이 충분하면 실제 호출 결과가 프로브보다 우선"""
+        monitor = make_monitor()
+
+        async def failing_probe():
+            raise ConnectionError("connection refused")
+
+        await monitor.run_probe(failing_probe)
+        for _ in range(4):
+            monitor.record_success()
+
+        assert monitor.is_available() is True
+
+    @pytest.mark.asyncio
+    async def test_probe_loop_waits_initial_delay(self):
+        """시작 직후 이미 프로브했다면 첫 프로브를 지연"""
+        monitor = make_monitor()
+        calls = []
+
+        async def probe():
+            calls.append(True)
+
+        task = asyncio.ensure_future(
+            monitor.run_probe_loop(probe, interval_seconds=60, initial_delay_seconds=60)
+        )
+        await asyncio.sleep(0.01)
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+        assert calls == []
@@ -0,0 +1,53 @@
+import pytest
+from app.services.hedging import HedgeBudget, LatencyTracker
+
+
+class TestLatencyTracker:
+    """모델별 지연 시간 추적 테스트"""
+
+    def test_percentile_requires_min_samples(self):
+        """표본이 부족하면 백분위수를 계산하지 않음"""
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record("gpt", 1.0)
+        tracker.record("gpt", 2.0)
+
+        assert tracker.percentile("gpt", 95) is None
+
+    def test_percentile_per_model(self):
+        """모델별로 분리된 백분위수"""
+        tracker = LatencyTracker(min_samples=1)
+        for i in range(1, 101):
+            tracker.record("slow", float(i))
+        tracker.record("fast", 0.1)
+
+        assert tracker.percentile("slow", 95) == 95.0
+        assert tracker.percentile("slow", 50) == 50.0
+        assert tracker.percentile("fast", 95) == 0.1
+
+    def test_window_keeps_recent_samples(self):
+        """윈도우 크기를 넘는 오래된 표본은 제외"""
+        tracker = LatencyTracker(window_size=2, min_samples=1)
+        for seconds in (10.0, 1.0, 1.0):
+            tracker.record("gpt", seconds)
+
+        assert tracker.percentile("gpt", 100) == 1.0
+
+
+class TestHedgeBudget:
+    """헤지 예산 테스트"""
+
+    def test_budget_caps_hedged_ratio(self):
+        """헤지 비율이 상한을 넘지 않음"""
+        budget = HedgeBudget(max_ratio=0.1)
+        granted = 0
+        for _ in range(100):
+            budget.record_call()
+            if budget.try_acquire():
+                granted += 1
+
+        assert granted == 10
+        assert budget.get_metrics()["hedged_ratio"] == pytest.approx(0.1)
+
+    def test_no_calls_no_hedge(self):
+        """호출 기록이 없으면 헤지 불가"""
+        assert HedgeBudget(max_ratio=1.0).try_acquire() is False
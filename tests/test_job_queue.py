@@ -0,0 +1,193 @@
+import asyncio
+import sqlite3
+import pytest
+from unittest.mock import patch
+from uuid import uuid4
+from app.schemas.coaching import (
+    CoachingResult,
+    InterviewQuestion,
+    LearningPath,
+    ResumePayload,
+)
+from app.services.job_queue import (
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    CoachingJob,
+    CoachingJobQueue,
+    MemoryJobStore,
+    SQLiteJobStore,
+)
+
+
+@pytest.fixture
+def sample_resume():
+    """샘플 이력서"""
+    return ResumePayload(
+        career_summary="3년차 백엔드 개발자, Spring Boot/MSA/Python 기반 커머스 서비스 개발",
+        job_duties="주문 및 결제 시스템 MSA 전환 프로젝트 리딩, Python 기반 데이터 배치 처리 시스템 구축",
+        technical_skills=["Spring Boot", "MSA", "Python", "AWS EC2", "MySQL"],
+    )
+
+
+def make_result() -> CoachingResult:
+    """테스트용 코칭 결과"""
+    return CoachingResult(
+        session_id=uuid4(),
+        interview_questions=[
+            InterviewQuestion(question=f"질문 {i}", intent="의도", category="Behavioral")
+            for i in range(5)
+        ],
+        learning_path=LearningPath(summary="요약", steps=[]),
+    )
+
+
+class TestCoachingJobQueue:
+    """코칭 작업 큐 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_submit_returns_immediately_and_worker_completes(self, sample_resume):
+        """등록은 즉시 반환되고 워커가 결과를 저장"""
+        release = asyncio.Event()
+
+        async def runner(payload):
+            await release.wait()
+            return make_result()
+
+        queue = CoachingJobQueue(runner, MemoryJobStore(), workers=2)
+        job = await queue.submit(sample_resume)
+        assert job.status == QUEUED
+
+        release.set()
+        await queue.join()
+        await queue.stop()
+
+        stored = await queue.get(job.job_id)
+        assert stored.status == SUCCEEDED
+        assert len(stored.result["interview_questions"]) == 5
+
+    @pytest.mark.asyncio
+    async def test_worker_count_bounds_concurrency(self, sample_resume):
+        """동시에 실행되는 작업 수는 워커 수로 제한"""
+        active = 0
+        peak = 0
+
+        async def runner(payload):
+            nonlocal active, peak
+            active += 1
+            peak = max(peak, active)
+            await asyncio.sleep(0.01)
+            active -= 1
+            return make_result()
+
+        queue = CoachingJobQueue(runner, MemoryJobStore(), workers=2)
+        for _ in range(6):
+            await queue.submit(sample_resume)
+        await queue.join()
+        await queue.stop()
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_failure_is_recorded(self, sample_resume):
+        """실행 실패 시 오류 메시지와 함께 failed 상태 저장"""
+
+        async def runner(payload):
+            raise RuntimeError("LLM 장애")
+
+        queue = CoachingJobQueue(runner, MemoryJobStore(), workers=1)
+        job = await queue.submit(sample_resume)
+        await queue.join()
+        await queue.stop()
+
+        stored = await queue.get(job.job_id)
+        assert stored.status == FAILED
+        assert "LLM 장애" in stored.error
+
+    @pytest.mark.asyncio
+    async def test_first_submit_runs_job_once(self, sample_resume):
+        """워커가 시작되지 않은 상태의 첫 등록도 작업을 한 번만 실행"""
+        runs = []
+
+        async def runner(payload):
+            runs.append(payload)
+            await asyncio.sleep(0.01)
+            return make_result()
+
+        queue = CoachingJobQueue(runner, MemoryJobStore(), workers=2)
+        await queue.submit(sample_resume)
+        await queue.join()
+        await queue.stop()
+
+        assert len(runs) == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_queue_entry_runs_once(self, sample_resume):
+        """같은 작업이 큐에 두 번 들어가도 대기 상태인 첫 항목만 실행"""
+        runs = []
+
+        async def runner(payload):
+            runs.append(payload)
+            await asyncio.sleep(0.01)
+            return make_result()
+
+        queue = CoachingJobQueue(runner, MemoryJobStore(), workers=2)
+        job = await queue.submit(sample_resume)
+        queue._queue.put_nowait(job.job_id)
+        await queue.join()
+        await queue.stop()
+
+        assert len(runs) == 1
+
+
+class TestSQLiteJobStore:
+    """영구 작업 저장소 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_unfinished_jobs_survive_restart(self, tmp_path, sample_resume):
+        """재시작 후 미완료 작업을 다시 실행"""
+        path = str(tmp_path / "jobs.db")
+        interrupted = CoachingJob(payload=sample_resume.model_dump(), status=RUNNING)
+        done = CoachingJob(payload=sample_resume.model_dump(), status=SUCCEEDED)
+        await SQLiteJobStore(path).save(interrupted)
+        await SQLiteJobStore(path).save(done)
+
+        runs = []
+
+        async def runner(payload):
+            runs.append(payload)
+            return make_result()
+
+        queue = CoachingJobQueue(runner, SQLiteJobStore(path), workers=1)
+        await queue.start()
+        await queue.join()
+        await queue.stop()
+
+        assert len(runs) == 1
+        stored = await SQLiteJobStore(path).get(interrupted.job_id)
+        assert stored.status == SUCCEEDED
+        assert await SQLiteJobStore(path).get("missing") is None
+
+    @pytest.mark.asyncio
+    async def test_connections_are_closed(self, tmp_path, sample_resume):
+        """저장/조회마다 연 SQLite 연결을 닫음"""
+        opened = []
+        connect = sqlite3.connect
+
+        def tracking_connect(*args, **kwargs):
+            conn = connect(*args, **kwargs)
+            opened.append(conn)
+            return conn
+
+        with patch("sqlite3.connect", tracking_connect):
+            store = SQLiteJobStore(str(tmp_path / "jobs.db"))
+            job = CoachingJob(payload=sample_resume.model_dump())
+            await store.save(job)
+            assert (await store.get(job.job_id)).job_id == job.job_id
+            assert len(await store.list_unfinished()) == 1
+
+        assert len(opened) == 4
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
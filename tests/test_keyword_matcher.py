@@ -0,0 +1,89 @@
+import random
+
+from app.services.keyword_matcher import KeywordMatcher
+
+
+KEYWORDS = [
+    "프로젝트",
+    "프로젝트에서",
+    "사이드 프로젝트",
+    "실제",
+    "실제로",
+    "ab",
+    "bcd",
+    "abc",
+    "a.b",
+    "c++",
+    "(x)",
+    "trade-off",
+]
+
+
+class TestKeywordMatcher:
+    """키워드 매처 테스트"""
+
+    def test_find_matches_naive_substring_checks(self):
+        """겹치거나 접두사/부분 문자열 관계인 키워드도 `in` 검사와 같은 결과"""
+        matcher = KeywordMatcher({"all": KEYWORDS})
+        rng = random.Random(7)
+        fragments = KEYWORDS + ["a", "b", "c", "d", "로", " ", ".", "+", "x"]
+
+        for _ in range(2000):
+            text = "".join(rng.choice(fragments) for _ in range(rng.randint(0, 12)))
+            expected = {keyword for keyword in KEYWORDS if keyword in text}
+            assert matcher.find(text) == expected, text
+
+    def test_find_matches_naive_checks_for_random_keyword_sets(self):
+        """작은 알파벳의 무작위 키워드 집합(겹침이 많은 경우)에서도 `in` 검사와 같은 결과"""
+        rng = random.Random(11)
+
+        for _ in range(100):
+            keywords = {
+                "".join(rng.choice("abcd") for _ in range(rng.randint(1, 5)))
+                for _ in range(rng.randint(1, 12))
+            }
+            matcher = KeywordMatcher({"all": keywords})
+            for _ in range(50):
+                text = "".join(rng.choice("abcdx") for _ in range(rng.randint(0, 30)))
+                expected = {keyword for keyword in keywords if keyword in text}
+                assert matcher.find(text) == expected, (keywords, text)
+
+    def test_overlapping_keywords(self):
+        """앞 키워드와 겹쳐 시작하는 키워드도 찾음"""
+        matcher = KeywordMatcher({"all": KEYWORDS})
+
+        assert matcher.find("abcd") == {"ab", "abc", "bcd"}
+        assert matcher.find("사이드 프로젝트에서 실제로") == {
+            "사이드 프로젝트",
+            "프로젝트",
+            "프로젝트에서",
+            "실제",
+            "실제로",
+        }
+
+    def test_category_counts(self):
+        """한 번의 스캔 결과로 범주별 개수와 포함 여부 계산"""
+        matcher = KeywordMatcher(
+            {"practical": ["실무", "운영", "실제"], "theoretical": ["이론적으로"]}
+        )
+
+        hits = matcher.find("실제 운영 환경의 실무 경험")
+
+        assert matcher.count(hits, "practical") == 3
+        assert matcher.has_any(hits, "practical")
+        assert not matcher.has_any(hits, "theoretical")
+        assert matcher.scan("이론적으로 실무") == {"practical": 1, "theoretical": 1}
+
+    def test_case_sensitive(self):
+        """대소문자를 구분"""
+        matcher = KeywordMatcher({"all": ["MSA"]})
+
+        assert matcher.find("msa 전환") == set()
+        assert matcher.find("MSA 전환") == {"MSA"}
+
+    def test_empty_matcher(self):
+        """키워드가 없으면 항상 빈 결과"""
+        matcher = KeywordMatcher({"empty": []})
+
+        assert matcher.find("아무 텍스트") == set()
+        assert matcher.scan("아무 텍스트") == {"empty": 0}
@@ -0,0 +1,142 @@
+import sqlite3
+import pytest
+from contextlib import closing
+from unittest.mock import patch
+from app.services.llm_cache import (
+    LLMResponseCache,
+    MemoryLRUCache,
+    SQLiteCacheBackend,
+    make_cache_key,
+)
+
+
+class FakeClock:
+    """수동으로 시간을 진행시키는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestMakeCacheKey:
+    """캐시 키 생성 테스트"""
+
+    def test_same_parameters_same_key(self):
+        """동일 파라미터는 동일 키"""
+        key1 = make_cache_key("gpt", "프롬프트", 0.7, 100, {"type": "json_object"})
+        key2 = make_cache_key("gpt", "프롬프트", 0.7, 100, {"type": "json_object"})
+        assert key1 == key2
+
+    def test_any_parameter_changes_key(self):
+        """파라미터가 하나라도 다르면 다른 키"""
+        base = make_cache_key("gpt", "프롬프트", 0.7, 100, None)
+        assert make_cache_key("gpt-4", "프롬프트", 0.7, 100, None) != base
+        assert make_cache_key("gpt", "다른 프롬프트", 0.7, 100, None) != base
+        assert make_cache_key("gpt", "프롬프트", 0.2, 100, None) != base
+        assert make_cache_key("gpt", "프롬프트", 0.7, 200, None) != base
+        assert make_cache_key("gpt", "프롬프트", 0.7, 100, {"type": "json_object"}) != base
+
+
+class TestMemoryLRUCache:
+    """메모리 LRU 계층 테스트"""
+
+    def test_evicts_least_recently_used_by_bytes(self):
+        """바이트 한도를 넘으면 가장 오래 사용되지 않은 항목 제거"""
+        cache = MemoryLRUCache(max_bytes=30)
+        cache.set("a", "x" * 9, ttl_seconds=60)
+        cache.set("b", "x" * 9, ttl_seconds=60)
+        cache.get("a")
+        cache.set("c", "x" * 9, ttl_seconds=60)
+        cache.set("d", "x" * 9, ttl_seconds=60)
+
+        assert cache.get("a") is not None
+        assert cache.get("b") is None
+        assert cache.current_bytes <= 30
+
+    def test_expired_entries_are_not_returned(self):
+        """TTL이 지난 항목은 반환하지 않음"""
+        clock = FakeClock()
+        cache = MemoryLRUCache(max_bytes=1000, clock=clock)
+        cache.set("a", "value", ttl_seconds=10)
+
+        clock.now = 11
+        assert cache.get("a") is None
+        assert len(cache) == 0
+
+
+class TestLLMResponseCache:
+    """계층형 응답 캐시 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_survives_new_cache_instance(self, tmp_path):
+        """영구 계층에 저장된 값은 새 인스턴스에서도 조회되고 메모리로 승격"""
+        path = str(tmp_path / "cache.db")
+        cache = LLMResponseCache(1000, 60, SQLiteCacheBackend(path))
+        await cache.set("key", "응답")
+
+        restarted = LLMResponseCache(1000, 60, SQLiteCacheBackend(path))
+        assert await restarted.get("key") == "응답"
+        assert await restarted.get("key") == "응답"
+
+        metrics = restarted.get_metrics()
+        assert metrics["backend_hits"] == 1
+        assert metrics["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_respects_ttl(self, tmp_path):
+        """영구 계층도 TTL이 지난 값은 반환하지 않음"""
+        backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+        await backend.set("key", "응답", ttl_seconds=-1)
+
+        assert await backend.get("key") is None
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_closes_connections(self, tmp_path):
+        """조회/저장마다 연 연결은 작업 후 닫힘"""
+        opened = []
+        connect = sqlite3.connect
+
+        def tracking_connect(*args, **kwargs):
+            conn = connect(*args, **kwargs)
+            opened.append(conn)
+            return conn
+
+        with patch("sqlite3.connect", tracking_connect):
+            backend = SQLiteCacheBackend(str(tmp_path / "cache.db"))
+            await backend.set("key", "응답", ttl_seconds=60)
+            assert await backend.get("key") == "응답"
+
+        assert len(opened) == 3
+        for conn in opened:
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.execute("SELECT 1")
+
+    @pytest.mark.asyncio
+    async def test_sqlite_backend_sweeps_expired_rows_periodically(self, tmp_path):
+        """만료 항목 정리는 저장마다가 아니라 정리 주기마다 실행"""
+        clock = FakeClock()
+        path = str(tmp_path / "cache.db")
+        backend = SQLiteCacheBackend(path, sweep_interval_seconds=60, clock=clock)
+
+        def row_count():
+            with closing(sqlite3.connect(path)) as conn:
+                return conn.execute("SELECT COUNT(*) FROM llm_cache").fetchone()[0]
+
+        await backend.set("expired", "응답", ttl_seconds=-1)
+        await backend.set("fresh", "응답", ttl_seconds=60)
+        assert row_count() == 2
+
+        clock.now = 61
+        await backend.set("other", "응답", ttl_seconds=60)
+        assert row_count() == 2
+        assert await backend.get("expired") is None
+
+    @pytest.mark.asyncio
+    async def test_miss_counter(self):
+        """없는 키는 미스로 집계"""
+        cache = LLMResponseCache(1000, 60)
+
+        assert await cache.get("missing") is None
+        assert cache.get_metrics()["misses"] == 1
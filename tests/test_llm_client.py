@@ -0,0 +1,447 @@
+import asyncio
+import pytest
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, patch
+from app.core.config import settings
+from app.core.deadline import Deadline
+from app.services.llm_client import (
+    CircuitOpenError,
+    DeadlineExceededError,
+    LLMClient,
+    LLMClientError,
+)
+from app.services.result_parser import is_valid_interview_questions_response
+
+
+def make_response(content, finish_reason="stop"):
+    """OpenAI chat completion 응답 형태의 객체 생성"""
+    return SimpleNamespace(
+        choices=[
+            SimpleNamespace(
+                message=SimpleNamespace(content=content), finish_reason=finish_reason
+            )
+        ],
+        usage={"total_tokens": 10},
+    )
+
+
+@pytest.fixture
+def llm_client():
+    """API 호출을 모킹한 LLM 클라이언트"""
+    with patch.object(settings, "openai_api_key", "test-key"):
+        client = LLMClient()
+    client.provider.client = SimpleNamespace(
+        chat=SimpleNamespace(
+            completions=SimpleNamespace(
+                create=AsyncMock(return_value=make_response("응답"))
+            )
+        )
+    )
+    return client
+
+
+class TestLLMClientCache:
+    """LLM 응답 캐시 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_hit_cache(self, llm_client):
+        """동일 요청은 API를 한 번만 호출"""
+        first = await llm_client.generate_completion("프롬프트", max_tokens=10)
+        second = await llm_client.generate_completion("프롬프트", max_tokens=10)
+
+        assert first == second == "응답"
+        assert llm_client.provider.client.chat.completions.create.await_count == 1
+        assert llm_client.get_metrics()["response_cache"]["memory_hits"] == 1
+
+    @pytest.mark.asyncio
+    async def test_different_parameters_miss_cache(self, llm_client):
+        """파라미터가 다르면 다시 호출"""
+        await llm_client.generate_completion("프롬프트", temperature=0.1)
+        await llm_client.generate_completion("프롬프트", temperature=0.9)
+
+        assert llm_client.provider.client.chat.completions.create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_truncated_response_is_not_cached(self, llm_client):
+        """max_tokens에서 잘린 응답은 캐시하지 않음"""
+        create = llm_client.provider.client.chat.completions.create
+        create.return_value = make_response('{"a": ', finish_reason="length")
+
+        await llm_client.generate_completion("프롬프트", max_tokens=10)
+        await llm_client.generate_completion("프롬프트", max_tokens=10)
+
+        assert create.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_json_mode_caches_only_parseable_response(self, llm_client):
+        """JSON 모드에서는 JSON으로 파싱되는 응답만 캐시"""
+        create = llm_client.provider.client.chat.completions.create
+        create.return_value = make_response("JSON이 아닌 응답")
+
+        await llm_client.generate_json_completion("프롬프트")
+        await llm_client.generate_json_completion("프롬프트")
+        assert create.await_count == 2
+
+        create.return_value = make_response('{"ok": true}')
+        await llm_client.generate_json_completion("프롬프트")
+        await llm_client.generate_json_completion("프롬프트")
+        assert create.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_cache_validator_rejection_skips_cache(self, llm_client):
+        """호출자 검증에 실패한 응답은 캐시하지 않음"""
+        create = llm_client.provider.client.chat.completions.create
+        create.return_value = make_response('{"interview_questions": []}')
+
+        for _ in range(2):
+            await llm_client.generate_json_completion(
+                "프롬프트", cache_validator=is_valid_interview_questions_response
+            )
+
+        assert create.await_count == 2
+
+
+class TestLLMClientHealth:
+    """LLM 헬스체크 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_health_check_does_not_call_completion_api(self, llm_client):
+        """헬스체크는 completion API를 호출하지 않음"""
+        assert await llm_client.health_check() is True
+        assert llm_client.provider.client.chat.completions.create.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_real_call_outcomes_feed_health_monitor(self, llm_client):
+        """실제 호출의 공급자 오류가 헬스 모니터에 기록"""
+        llm_client.base_delay = 0
+        llm_client.circuit_breaker.min_calls = 100
+        llm_client.provider.client.chat.completions.create.side_effect = Exception(
+            "service unavailable"
+        )
+
+        for i in range(settings.health_min_samples):
+            with pytest.raises(Exception):
+                await llm_client.generate_completion(f"프롬프트 {i}")
+
+        assert llm_client.circuit_breaker.state == "closed"
+        assert await llm_client.health_check() is False
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_affect_readiness(self, llm_client):
+        """재시도 불가능한 요청 오류는 헬스 모니터에 기록하지 않아 레디니스 유지"""
+        llm_client.provider.client.chat.completions.create.side_effect = ValueError(
+            "invalid request"
+        )
+
+        for i in range(settings.health_min_samples * 2):
+            with pytest.raises(LLMClientError):
+                await llm_client.generate_completion(f"프롬프트 {i}")
+
+        assert llm_client.health_monitor.passive_stats()["samples"] == 0
+        assert await llm_client.health_check() is True
+
+
+class TestLLMClientCircuitBreaker:
+    """서킷 브레이커 연동 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_fails_fast_without_retry(self, llm_client):
+        """브레이커가 열리면 API 호출과 재시도 대기 없이 즉시 실패"""
+        llm_client.base_delay = 0
+        llm_client.provider.client.chat.completions.create.side_effect = Exception(
+            "service unavailable"
+        )
+
+        for i in range(2):
+            with pytest.raises(LLMClientError):
+                await llm_client.generate_completion(f"프롬프트 {i}")
+
+        assert llm_client.circuit_breaker.state == "open"
+        calls = llm_client.provider.client.chat.completions.create.await_count
+
+        with pytest.raises(CircuitOpenError):
+            await llm_client.generate_completion("다른 프롬프트")
+
+        assert llm_client.provider.client.chat.completions.create.await_count == calls
+        assert await llm_client.health_check() is False
+
+    @pytest.mark.asyncio
+    async def test_client_errors_do_not_open_breaker(self, llm_client):
+        """재시도 불가능한 요청 오류는 브레이커 실패로 집계하지 않음"""
+        llm_client.provider.client.chat.completions.create.side_effect = ValueError(
+            "invalid request"
+        )
+
+        for i in range(settings.circuit_breaker_min_calls + 1):
+            with pytest.raises(LLMClientError):
+                await llm_client.generate_completion(f"프롬프트 {i}")
+
+        assert llm_client.circuit_breaker.state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_client_error_on_probe_releases_without_closing(self, llm_client):
+        """반열림 탐색 호출의 요청 오류는 브레이커를 닫지 않고 탐색 슬롯만 반환"""
+        breaker = llm_client.circuit_breaker
+        breaker._open()
+        breaker._opened_at -= breaker.open_seconds
+        llm_client.provider.client.chat.completions.create.side_effect = ValueError(
+            "invalid request"
+        )
+
+        for i in range(breaker.half_open_max_calls):
+            with pytest.raises(LLMClientError):
+                await llm_client.generate_completion(f"프롬프트 {i}")
+
+        assert breaker.state == "half_open"
+        assert breaker._half_open_in_flight == 0
+        assert breaker._half_open_successes == 0
+
+    @pytest.mark.asyncio
+    async def test_probe_permit_is_not_held_while_queued(self, llm_client):
+        """수용 대기열에서 기다리는 요청은 반열림 탐색 슬롯을 차지하지 않음"""
+        breaker = llm_client.circuit_breaker
+        breaker._open()
+        breaker._opened_at -= breaker.open_seconds
+        llm_client.admission.limiter.max_concurrency = 1
+        release = asyncio.Event()
+
+        async def slow_create(**kwargs):
+            await release.wait()
+            return make_response("응답")
+
+        llm_client.provider.client.chat.completions.create.side_effect = slow_create
+
+        tasks = [
+            asyncio.create_task(llm_client.generate_completion(f"프롬프트 {i}"))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.01)
+
+        assert llm_client.admission.limiter.waiting == 1
+        assert breaker._half_open_in_flight == 1
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert breaker.state == "closed"
+
+
+class TestLLMClientDeadline:
+    """데드라인 전파 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_attempt_timeout_shrinks_to_deadline(self, llm_client):
+        """응답이 늦으면 데드라인에 맞춰 중단"""
+
+        async def hang(**kwargs):
+            await asyncio.sleep(10)
+
+        llm_client.provider.client.chat.completions.create.side_effect = hang
+
+        with pytest.raises(DeadlineExceededError):
+            await asyncio.wait_for(
+                llm_client.generate_completion("프롬프트", deadline=Deadline.after(0.05)),
+                timeout=2.0,
+            )
+
+    @pytest.mark.asyncio
+    async def test_skips_retry_that_cannot_finish_in_time(self, llm_client):
+        """백오프 후 데드라인 안에 끝날 수 없으면 재시도 생략"""
+        llm_client.provider.client.chat.completions.create.side_effect = Exception(
+            "service unavailable"
+        )
+
+        with pytest.raises(DeadlineExceededError):
+            await asyncio.wait_for(
+                llm_client.generate_completion("프롬프트", deadline=Deadline.after(1.0)),
+                timeout=0.5,
+            )
+
+        assert llm_client.provider.client.chat.completions.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_expired_deadline_skips_api_call(self, llm_client):
+        """이미 지난 데드라인이면 API를 호출하지 않음"""
+        with pytest.raises(DeadlineExceededError):
+            await llm_client.generate_completion("프롬프트", deadline=Deadline.after(0))
+
+        assert llm_client.provider.client.chat.completions.create.await_count == 0
+
+    @pytest.mark.asyncio
+    async def test_queue_wait_is_bounded_by_deadline_only(self, llm_client):
+        """승인 대기열에서 데드라인이 지나면 공급자 장애로 집계하지 않고 중단"""
+        llm_client.admission.limiter.max_concurrency = 1
+        release = asyncio.Event()
+
+        async def slow_create(**kwargs):
+            await release.wait()
+            return make_response("응답")
+
+        llm_client.provider.client.chat.completions.create.side_effect = slow_create
+        holder = asyncio.create_task(llm_client.generate_completion("먼저 온 프롬프트"))
+        await asyncio.sleep(0.01)
+
+        with pytest.raises(DeadlineExceededError):
+            await asyncio.wait_for(
+                llm_client.generate_completion("프롬프트", deadline=Deadline.after(0.05)),
+                timeout=2.0,
+            )
+
+        assert llm_client.provider.client.chat.completions.create.await_count == 1
+        assert llm_client.admission.get_metrics()["timed_out"] == 1
+        assert llm_client.circuit_breaker.get_status()["window_samples"] == 0
+        assert llm_client.health_monitor.passive_stats()["samples"] == 0
+
+        release.set()
+        assert await holder == "응답"
+
+
+class TestLLMClientLatency:
+    """응답 지연 기록 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_latency_excludes_admission_wait(self, llm_client):
+        """승인 대기 시간은 빼고 성공한 공급자 호출 시간만 기록"""
+        llm_client.admission.limiter.max_concurrency = 1
+        calls = 0
+
+        async def create(**kwargs):
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                await asyncio.sleep(0.1)
+            return make_response("응답")
+
+        llm_client.provider.client.chat.completions.create.side_effect = create
+
+        await asyncio.gather(
+            *(llm_client.generate_completion(f"프롬프트 {i}") for i in range(2))
+        )
+
+        samples = sorted(llm_client.latency_tracker._samples["gpt-3.5-turbo"])
+        assert len(samples) == 2
+        assert samples[0] < 0.05 <= samples[1]
+
+
+class TestLLMClientHedging:
+    """헤지 요청 테스트"""
+
+    @pytest.fixture
+    def hedging_client(self, llm_client):
+        """지연 기록이 쌓인 헤지 활성화 클라이언트"""
+        for _ in range(settings.llm_hedging_min_samples):
+            llm_client.latency_tracker.record("gpt-3.5-turbo", 0.01)
+        llm_client.hedge_budget.max_ratio = 1.0
+        with patch.object(settings, "llm_hedging_enabled", True):
+            yield llm_client
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self, hedging_client):
+        """첫 요청이 느리면 헤지 요청 결과를 사용하고 첫 요청은 취소"""
+        cancelled = []
+
+        async def create(**kwargs):
+            call_index = create.calls
+            create.calls += 1
+            if call_index == 0:
+                try:
+                    await asyncio.sleep(10)
+                except asyncio.CancelledError:
+                    cancelled.append(call_index)
+                    raise
+            return make_response(f"응답 {call_index}")
+
+        create.calls = 0
+        hedging_client.provider.client.chat.completions.create = create
+
+        result = await hedging_client.generate_completion("프롬프트")
+        await asyncio.sleep(0)
+
+        assert result == "응답 1"
+        assert cancelled == [0]
+        assert hedging_client.hedge_budget.hedge_wins == 1
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self, hedging_client):
+        """첫 요청이 빠르면 헤지하지 않음"""
+        result = await hedging_client.generate_completion("프롬프트")
+
+        assert result == "응답"
+        assert hedging_client.provider.client.chat.completions.create.await_count == 1
+        assert hedging_client.hedge_budget.hedged == 0
+
+    @pytest.mark.asyncio
+    async def test_exhausted_budget_waits_for_primary(self, hedging_client):
+        """예산이 없으면 느린 첫 요청을 그대로 기다림"""
+        hedging_client.hedge_budget.max_ratio = 0.0
+
+        async def create(**kwargs):
+            await asyncio.sleep(0.05)
+            return make_response("느린 응답")
+
+        hedging_client.provider.client.chat.completions.create = AsyncMock(
+            side_effect=create
+        )
+
+        result = await hedging_client.generate_completion("프롬프트")
+
+        assert result == "느린 응답"
+        assert hedging_client.provider.client.chat.completions.create.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_backed_up_queue_skips_hedge(self, hedging_client):
+        """승인 대기열이 밀려 있으면 느린 첫 요청이어도 헤지하지 않음"""
+        hedging_client.admission.limiter.max_concurrency = 1
+        release = asyncio.Event()
+
+        async def create(**kwargs):
+            await release.wait()
+            return make_response("응답")
+
+        hedging_client.provider.client.chat.completions.create = AsyncMock(
+            side_effect=create
+        )
+
+        tasks = [
+            asyncio.create_task(hedging_client.generate_completion(f"프롬프트 {i}"))
+            for i in range(2)
+        ]
+        await asyncio.sleep(0.05)
+        release.set()
+        await asyncio.gather(*tasks)
+
+        assert hedging_client.provider.client.chat.completions.create.await_count == 2
+        assert hedging_client.hedge_budget.hedged == 0
+        assert hedging_client.hedge_budget.queue_skips == 2
+
+
+class TestLLMClientStreaming:
+    """스트리밍 completion 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_stream_yields_content_deltas(self, llm_client):
+        """응답 조각을 순서대로 전달하고 빈 조각은 생략"""
+
+        async def stream():
+            for content in ["첫", None, "번째"]:
+                yield SimpleNamespace(
+                    choices=[SimpleNamespace(delta=SimpleNamespace(content=content))]
+                )
+
+        llm_client.provider.client.chat.completions.create.return_value = stream()
+
+        chunks = [chunk async for chunk in llm_client.stream_completion("프롬프트")]
+
+        assert chunks == ["첫", "번째"]
+        kwargs = llm_client.provider.client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert llm_client.health_monitor.passive_stats()["samples"] == 1
+
+    @pytest.mark.asyncio
+    async def test_stream_rejected_when_circuit_open(self, llm_client):
+        """서킷이 열려 있으면 스트리밍도 즉시 거부"""
+        llm_client.circuit_breaker._open()
+
+        with pytest.raises(CircuitOpenError):
+            async for _ in llm_client.stream_completion("프롬프트"):
+                pass
+        assert llm_client.provider.client.chat.completions.create.await_count == 0
@@ -0,0 +1,155 @@
+import pytest
+from unittest.mock import patch
+from app.core.config import settings
+from app.schemas.coaching import CoachingResult, ResumePayload
+from app.services.coaching_service import CoachingService
+from app.services.llm_client import LLMClient, LLMClientError
+from app.services.llm_providers import (
+    MockLLMProvider,
+    MockProviderError,
+    OpenAIProvider,
+    build_mock_content,
+    create_llm_provider,
+)
+from app.services.prompt_builder import PromptBuilder
+from app.services.result_parser import (
+    is_valid_interview_questions_response,
+    is_valid_learning_path_response,
+    parse_interview_questions,
+    parse_learning_path,
+)
+
+
+@pytest.fixture
+def sample_resume():
+    """샘플 이력서"""
+    return ResumePayload(
+        career_summary="3년차 백엔드 개발자, Spring Boot/MSA/Python 기반 커머스 서비스 개발",
+        job_duties="주문 및 결제 시스템 MSA 전환 프로젝트 리딩, Python 기반 데이터 배치 처리 시스템 구축",
+        technical_skills=["Spring Boot", "MSA", "Python", "AWS EC2", "MySQL"],
+    )
+
+
+@pytest.fixture
+def mock_settings():
+    """모의 공급자를 사용하는 설정"""
+    with patch.object(settings, "llm_provider", "mock"), patch.object(
+        settings, "llm_mock_latency_seconds", 0.0
+    ), patch.object(settings, "openai_api_key", None):
+        yield settings
+
+
+class TestMockLLMProvider:
+    """모의 LLM 공급자 테스트"""
+
+    def test_mock_content_is_schema_valid(self, sample_resume):
+        """두 프롬프트 종류 모두 파서가 대체 콘텐츠 없이 변환"""
+        builder = PromptBuilder()
+        service = CoachingService.__new__(CoachingService)
+
+        questions = parse_interview_questions(
+            build_mock_content(builder.build_interview_questions_prompt(sample_resume)),
+            sample_resume,
+        )
+        learning_path = parse_learning_path(
+            build_mock_content(builder.build_learning_path_prompt(sample_resume)),
+            sample_resume,
+        )
+
+        assert questions != service._generate_fallback_questions(sample_resume)
+        assert learning_path != service._generate_fallback_learning_path(sample_resume)
+
+    def test_mock_content_passes_cache_validators(self, sample_resume):
+        """스키마 유효 응답은 캐시 검증을 통과하고 다른 종류의 응답은 거부"""
+        builder = PromptBuilder()
+        questions = build_mock_content(
+            builder.build_interview_questions_prompt(sample_resume)
+        )
+        learning_path = build_mock_content(
+            builder.build_learning_path_prompt(sample_resume)
+        )
+
+        assert is_valid_interview_questions_response(questions)
+        assert is_valid_learning_path_response(learning_path)
+        assert not is_valid_interview_questions_response(learning_path)
+        assert not is_valid_learning_path_response(questions)
+
+    def test_seeded_latency_is_reproducible(self):
+        """같은 seed는 같은 지연 시간 순서 생성"""
+        first = MockLLMProvider(0.1, 0.5, "lognormal", seed=7)
+        second = MockLLMProvider(0.1, 0.5, "lognormal", seed=7)
+
+        samples = [first.sample_latency() for _ in range(5)]
+        assert samples == [second.sample_latency() for _ in range(5)]
+        assert len(set(samples)) > 1
+
+    def test_unknown_distribution_rejected(self):
+        """지원하지 않는 분포는 생성 시 거부"""
+        with pytest.raises(ValueError):
+            MockLLMProvider(latency_distribution="pareto")
+
+    @pytest.mark.asyncio
+    async def test_error_rate_injects_retryable_errors(self):
+        """오류율에 따라 재시도 대상 오류 발생"""
+        provider = MockLLMProvider(error_rate=1.0)
+
+        with pytest.raises(MockProviderError, match="service unavailable"):
+            await provider.complete(messages=[{"role": "user", "content": "x"}])
+        assert provider.errors == 1
+
+
+class TestProviderSelection:
+    """설정 기반 공급자 선택 테스트"""
+
+    def test_mock_provider_needs_no_api_key(self, mock_settings):
+        """모의 공급자는 API key 없이 LLM 클라이언트 생성"""
+        client = LLMClient()
+
+        assert isinstance(client.provider, MockLLMProvider)
+
+    def test_openai_provider_requires_api_key(self):
+        """OpenAI 공급자는 API key가 없으면 생성 실패"""
+        with patch.object(settings, "openai_api_key", None):
+            with pytest.raises(LLMClientError):
+                LLMClient()
+
+        with patch.object(settings, "openai_api_key", "test-key"):
+            assert isinstance(create_llm_provider(settings), OpenAIProvider)
+
+    @pytest.mark.asyncio
+    async def test_full_session_runs_against_mock(self, mock_settings, sample_resume):
+        """모의 공급자로 전체 코칭 세션 생성"""
+        client = LLMClient()
+        with patch("app.services.coaching_service.get_llm_client", return_value=client):
+            service = CoachingService()
+
+        result = await service.create_coaching_session(
+            sample_resume, enable_quality_optimization=False, use_cache=False
+        )
+
+        assert isinstance(result, CoachingResult)
+        assert client.provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_bypass_skips_llm_response_cache(self, mock_settings, sample_resume):
+        """use_cache=False이면 LLM 응답 캐시도 건너뛰고 공급자를 다시 호출"""
+        with patch.object(settings, "llm_cache_enabled", True), patch.object(
+            settings, "llm_cache_sqlite_path", None
+        ), patch.object(settings, "session_cache_enabled", False):
+            client = LLMClient()
+            with patch(
+                "app.services.coaching_service.get_llm_client", return_value=client
+            ):
+                service = CoachingService()
+
+        for _ in range(2):
+            await service.create_coaching_session(
+                sample_resume, enable_quality_optimization=False
+            )
+        assert client.provider.calls == 2
+        assert client.get_metrics()["response_cache"]["memory_hits"] == 2
+
+        await service.create_coaching_session(
+            sample_resume, enable_quality_optimization=False, use_cache=False
+        )
+        assert client.provider.calls == 4
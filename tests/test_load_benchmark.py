@@ -0,0 +1,55 @@
+import pytest
+from app.core.config import settings
+from benchmarks.load_test import compare_with_baseline, percentile, run_benchmark
+
+
+def make_report(throughput, p95):
+    """비교용 결과 생성"""
+    return {
+        "results": {
+            "standard": {"throughput_rps": throughput, "latency_p95_seconds": p95}
+        }
+    }
+
+
+class TestLoadBenchmark:
+    """부하 테스트 도구 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_smoke_run_reports_both_modes(self):
+        """모의 공급자로 두 모드를 실행하고 설정을 원래대로 복원"""
+        provider_before = settings.llm_provider
+        report = await run_benchmark(
+            {
+                "requests": 2,
+                "concurrency": 2,
+                "modes": ["optimized", "standard"],
+                "latency": 0.0,
+                "latency_spread": 0.0,
+                "latency_distribution": "fixed",
+                "error_rate": 0.0,
+                "seed": 1,
+                "with_cache": False,
+                "with_rate_limits": False,
+            }
+        )
+
+        assert report["results"]["standard"]["succeeded"] == 2
+        assert report["results"]["standard"]["llm_calls_per_session"] == 2
+        assert report["results"]["optimized"]["llm_calls_per_session"] > 2
+        assert settings.llm_provider == provider_before
+
+    def test_regression_detection(self):
+        """처리량 감소와 p95 증가가 허용 비율을 넘으면 회귀"""
+        baseline = make_report(100.0, 0.5)
+
+        assert compare_with_baseline(make_report(95.0, 0.52), baseline, 0.1) == []
+        assert len(compare_with_baseline(make_report(80.0, 0.7), baseline, 0.1)) == 2
+
+    def test_percentile_nearest_rank(self):
+        """nearest-rank 백분위수"""
+        values = [float(i) for i in range(1, 101)]
+
+        assert percentile(values, 50) == 50.0
+        assert percentile(values, 99) == 99.0
+        assert percentile([], 95) == 0.0
@@ -0,0 +1,37 @@
+import asyncio
+import time
+import pytest
+from app.core.loop_monitor import EventLoopLagMonitor
+
+
+class TestEventLoopLagMonitor:
+    """이벤트 루프 지연 측정 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_blocking_call_is_measured(self):
+        """이벤트 루프를 막는 동기 작업은 지연으로 기록"""
+        monitor = EventLoopLagMonitor(interval_seconds=0.005)
+        monitor.start()
+        await asyncio.sleep(0.02)
+
+        time.sleep(0.05)
+        await asyncio.sleep(0.02)
+        await monitor.stop()
+
+        metrics = monitor.get_metrics()
+        assert metrics["samples"] > 0
+        assert metrics["lag_max_seconds"] >= 0.04
+        assert not monitor.running
+
+    def test_reset_clears_samples(self):
+        """초기화 시 측정값 제거"""
+        monitor = EventLoopLagMonitor()
+        monitor.record(0.1)
+        monitor.reset()
+
+        assert monitor.get_metrics() == {
+            "samples": 0,
+            "lag_avg_seconds": 0.0,
+            "lag_p99_seconds": 0.0,
+            "lag_max_seconds": 0.0,
+        }
@@ -0,0 +1,48 @@
+from app.schemas.coaching import ResumePayload
+from benchmarks.micro import (
+    RESUME_SIZES,
+    compare_with_baseline,
+    make_resume,
+    run_micro_benchmarks,
+)
+
+
+def make_report(**min_seconds):
+    """비교용 결과 생성"""
+    return {
+        "results": {name: {"min_seconds": value} for name, value in min_seconds.items()}
+    }
+
+
+class TestMicroBenchmark:
+    """마이크로 벤치마크 도구 테스트"""
+
+    def test_resume_sizes_within_payload_limits(self):
+        """max 크기 이력서는 ResumePayload 길이 제한에 정확히 맞음"""
+        for size in RESUME_SIZES:
+            ResumePayload.model_validate(make_resume(size).model_dump())
+
+        resume = make_resume("max")
+        assert len(resume.career_summary) == 500
+        assert len(resume.job_duties) == 1000
+        assert len(resume.technical_skills) == 20
+
+    def test_regression_detection(self):
+        """최소 시간이 허용 비율을 넘어 증가한 항목만 회귀"""
+        baseline = make_report(fast=1e-5, slow=1e-4)
+        current = make_report(fast=1.1e-5, slow=1.5e-4, new=1e-3)
+
+        regressions = compare_with_baseline(current, baseline, 0.2)
+
+        assert [name for name, _, _ in regressions] == ["slow"]
+
+    def test_smoke_run_with_keyword(self):
+        """키워드로 선택한 벤치마크만 실행"""
+        report = run_micro_benchmarks("learning_path_prompt", repeat=1, min_time=0.0)
+
+        assert set(report["results"]) == {
+            f"build_learning_path_prompt[{size}]" for size in RESUME_SIZES
+        }
+        for result in report["results"].values():
+            assert result["min_seconds"] > 0
+            assert result["min_seconds"] <= result["median_seconds"]
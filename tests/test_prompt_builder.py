@@ -1,4 +1,6 @@
-from app.services.prompt_builder import PromptBuilder
+import hashlib
+
+from app.services.prompt_builder import PromptBuilder, PromptTemplate
 from app.schemas.coaching import ResumePayload
 
 
@@ -184,3 +186,50 @@ class TestPromptBuilder:
         assert "question" in prompt
         assert "intent" in prompt
         assert "category" in prompt
+
+    def test_prompts_match_golden_digest(self):
+        """템플릿 컴파일 전 f-string 구현과 바이트 단위로 동일한 프롬프트"""
+        digest = hashlib.sha256()
+        for persona in sorted(self.prompt_builder.personas):
+            digest.update(
+                self.prompt_builder.build_learning_path_prompt(
+                    self.sample_resume, persona
+                ).encode("utf-8")
+            )
+            for strategy in sorted(self.prompt_builder.question_strategies):
+                digest.update(
+                    self.prompt_builder.build_interview_questions_prompt(
+                        self.sample_resume, persona, strategy
+                    ).encode("utf-8")
+                )
+
+        assert (
+            digest.hexdigest()
+            == "8dd0ac79b2448bdcbfc9052df8a8c5e7aa023ea2101fa961b680814b1e42fc6e"
+        )
+
+    def test_resume_braces_are_not_formatted(self):
+        """이력서 텍스트의 중괄호는 템플릿 필드로 해석되지 않고 그대로 포함"""
+        resume = ResumePayload(
+            career_summary="{persona} 와 {{이중}} 중괄호가 포함된 경력",
+            job_duties="{job_duties} 필드 이름이 포함된 직무",
+            technical_skills=["{x}", "Go"],
+        )
+
+        prompt = self.prompt_builder.build_interview_questions_prompt(resume)
+
+        assert "- 경력 요약: {persona} 와 {{이중}} 중괄호가 포함된 경력" in prompt
+        assert "- 수행 직무: {job_duties} 필드 이름이 포함된 직무" in prompt
+        assert "- 보유 기술 스킬: {x}, Go" in prompt
+
+
+class TestPromptTemplate:
+    """컴파일된 프롬프트 템플릿 테스트"""
+
+    def test_static_fields_are_compiled_into_segments(self):
+        """정적 필드는 구간에 합쳐지고 요청별 필드만 남음"""
+        template = PromptTemplate("{{ {persona}: {name} / {skills} }}", persona="면접관")
+
+        assert template.fields == ("name", "skills")
+        assert template.segments == ("{ 면접관: ", " / ", " }")
+        assert template.render({"name": "홍길동", "skills": "Go"}) == ("{ 면접관: 홍길동 / Go }")
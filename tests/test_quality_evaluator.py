@@ -7,6 +7,11 @@ from app.schemas.coaching import (
     LearningStep,
 )
 from uuid import uuid4
+from unittest.mock import patch
+import hashlib
+import random
+
+import pytest
 
 
 class TestQualityEvaluator:
@@ -247,3 +252,167 @@ class TestQualityEvaluator:
         assert depth_score == 1.0
         assert actionability_score == 1.0
         assert practicality_score == 1.0
+
+
+# 채점 키워드와 그 접두사/부분 문자열 관계를 포함한 무작위 텍스트 조각
+SCORING_FRAGMENTS = (
+    "구체적으로|단계별|Trade-Off|장단점|최적화|아키텍처|패턴|전략|"
+    "방법론|구현|경험|프로젝트|프로젝트에서|사이드 프로젝트|토이 프로젝트|"
+    "구축|학습|실습|적용|연습|실행|진행|개발|예시|사례|상황|일반적으로|"
+    "보통|대부분|실제로|어떻게|방법|실무|프로덕션|운영|실제|평가|검증|"
+    "확인|측정|이론적으로|개념적으로|일반론|설계|승진|이직|성장|역량|스킬|"
+    "Kubernetes|Docker|AWS|Spring|Python|MSA|"
+    "커머스|결제|주문|배치|?|??| |을|를"
+).split("|") + ["x" * 60]
+SKILL_FRAGMENTS = SCORING_FRAGMENTS[49:59]
+
+
+def random_text(rng, count):
+    """조각을 무작위로 이어 붙인 텍스트"""
+    return "".join(
+        rng.choice(SCORING_FRAGMENTS) + rng.choice(["", " ", ", "])
+        for _ in range(count)
+    )
+
+
+def make_random_case(rng):
+    """무작위 코칭 결과와 이력서"""
+    resume = ResumePayload(
+        career_summary=random_text(rng, rng.randint(3, 20))[:500].ljust(10, "."),
+        job_duties=random_text(rng, rng.randint(3, 30))[:1000].ljust(10, "."),
+        technical_skills=[
+            rng.choice(SKILL_FRAGMENTS) for _ in range(rng.randint(1, 8))
+        ],
+    )
+    result = CoachingResult(
+        interview_questions=[
+            InterviewQuestion(
+                question=random_text(rng, rng.randint(1, 15)),
+                intent=random_text(rng, rng.randint(1, 6)),
+                category="Technical Deep-Dive",
+            )
+            for _ in range(5)
+        ],
+        learning_path=LearningPath(
+            summary=random_text(rng, rng.randint(1, 8)),
+            steps=[
+                LearningStep(
+                    title=random_text(rng, rng.randint(1, 4)),
+                    description=random_text(rng, rng.randint(1, 12)),
+                    resources=[random_text(rng, 1)] * rng.randint(0, 2),
+                )
+                for _ in range(rng.randint(1, 4))
+            ],
+        ),
+    )
+    return result, resume
+
+
+GOLDEN_SAMPLE_SCORE = {
+    "relevance": 1.9200000000000002,
+    "depth": 2.56,
+    "actionability": 2.55,
+    "practicality": 2.84,
+    "overall": 2.4675000000000002,
+}
+
+
+class TestQualityEvaluatorGoldenScores:
+    """키워드 매처 도입 전 구현과 점수가 동일한지 검증"""
+
+    def test_random_corpus_scores_match_golden_digest(self):
+        """무작위 코칭 결과 300개의 점수가 기존 `in` 검사 구현의 결과와 동일"""
+        evaluator = QualityEvaluator()
+        rng = random.Random(2024)
+        digest = hashlib.sha256()
+
+        for _ in range(300):
+            result, resume = make_random_case(rng)
+            score = evaluator.evaluate_coaching_result(result, resume)
+            digest.update(repr(score.to_dict()).encode())
+
+        assert (
+            digest.hexdigest()
+            == "6e56ed6334d42539ce43f6de1fc6c661688b6af7811cebffaadd9ceaf72c1e15"
+        )
+
+    def test_sample_result_scores(self):
+        """대표 코칭 결과의 점수"""
+        evaluator = QualityEvaluator()
+        resume = ResumePayload(
+            career_summary="3년차 백엔드 개발자, Spring Boot/MSA/Python 기반 커머스 서비스 개발",
+            job_duties="주문 및 결제 시스템 MSA 전환 프로젝트 리딩",
+            technical_skills=["Spring Boot", "MSA", "Python", "AWS", "MySQL"],
+        )
+        result, _ = make_random_case(random.Random(1))
+
+        score = evaluator.evaluate_coaching_result(result, resume)
+
+        assert score.to_dict() == GOLDEN_SAMPLE_SCORE
+
+
+class TestCandidateBatchScoring:
+    """후보 일괄 평가 테스트"""
+
+    def make_candidates(self, rng, count):
+        _, resume = make_random_case(rng)
+        return [make_random_case(rng)[0] for _ in range(count)], resume
+
+    def test_vectorized_scores_match_scalar_scores(self):
+        """벡터화 평가 점수가 후보별 evaluate_coaching_result 결과와 정확히 동일"""
+        pytest.importorskip("numpy")
+        evaluator = QualityEvaluator()
+        rng = random.Random(7)
+
+        for count in [1, 2, 4, 9, 36]:
+            for _ in range(10):
+                candidates, resume = self.make_candidates(rng, count)
+                expected = [
+                    evaluator.evaluate_coaching_result(candidate, resume)
+                    for candidate in candidates
+                ]
+
+                batch = evaluator.evaluate_candidates(candidates, resume)
+
+                assert batch.scores == expected
+                assert batch.best_index == max(
+                    range(count), key=lambda i: expected[i].overall
+                )
+
+    def test_vectorized_path_handles_shared_and_empty_sections(self):
+        """학습 경로를 공유하거나 단계가 없는 후보도 같은 점수"""
+        pytest.importorskip("numpy")
+        evaluator = QualityEvaluator()
+        candidates, resume = self.make_candidates(random.Random(3), 6)
+        candidates[1].learning_path = candidates[0].learning_path
+        candidates[2].learning_path.steps = []
+
+        with patch("app.services.quality_evaluator.VECTORIZED_MIN_CANDIDATES", 1):
+            batch = evaluator.evaluate_candidates(candidates, resume)
+
+        assert batch.scores == [
+            evaluator.evaluate_coaching_result(candidate, resume)
+            for candidate in candidates
+        ]
+
+    def test_scalar_fallback_without_numpy(self):
+        """numpy가 없으면 후보별 평가로 같은 결과 반환"""
+        evaluator = QualityEvaluator()
+        candidates, resume = self.make_candidates(random.Random(5), 9)
+
+        with patch("app.services.quality_evaluator.np", None):
+            batch = evaluator.evaluate_candidates(candidates, resume)
+
+        assert batch.scores == [
+            evaluator.evaluate_coaching_result(candidate, resume)
+            for candidate in candidates
+        ]
+
+    def test_empty_candidates(self):
+        """후보가 없으면 최고 후보 없음"""
+        _, resume = make_random_case(random.Random(1))
+
+        batch = QualityEvaluator().evaluate_candidates([], resume)
+
+        assert batch.scores == []
+        assert batch.best_index is None
@@ -0,0 +1,178 @@
+import asyncio
+import pytest
+from app.services.rate_limiter import (
+    AdmissionTimeoutError,
+    FairConcurrencyLimiter,
+    LLMAdmissionController,
+    TokenBucket,
+    estimate_tokens,
+)
+
+
+class FakeClock:
+    """수동으로 시간을 진행시키는 테스트용 시계"""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestEstimateTokens:
+    """토큰 추정 테스트"""
+
+    def test_includes_prompt_and_max_tokens(self):
+        """프롬프트 길이와 max_tokens를 합산"""
+        assert estimate_tokens("a" * 100, 500) == 550
+
+    def test_default_completion_tokens(self):
+        """max_tokens가 없으면 기본값 사용"""
+        assert estimate_tokens("a" * 10) == 5 + 256
+
+
+class TestTokenBucket:
+    """토큰 버킷 테스트"""
+
+    def test_refills_over_time(self):
+        """시간 경과에 따라 충전"""
+        clock = FakeClock()
+        bucket = TokenBucket(rate_per_minute=60, clock=clock)
+        asyncio.run(bucket.acquire(60))
+
+        assert bucket.available == 0
+        clock.now = 30.0
+        assert bucket.available == pytest.approx(30)
+
+    @pytest.mark.asyncio
+    async def test_waits_when_empty(self):
+        """버킷이 비면 충전될 때까지 대기"""
+        bucket = TokenBucket(rate_per_minute=600)  # 초당 10개
+        await bucket.acquire(600)
+
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        await bucket.acquire(1)
+
+        assert loop.time() - started >= 0.05
+
+    @pytest.mark.asyncio
+    async def test_oversized_request_is_clamped(self):
+        """용량보다 큰 요청도 영구 대기하지 않음"""
+        bucket = TokenBucket(rate_per_minute=100)
+        await asyncio.wait_for(bucket.acquire(1000), timeout=1.0)
+
+
+class TestFairConcurrencyLimiter:
+    """공정 동시성 제한기 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_round_robin_between_keys(self):
+        """한 키의 대량 요청이 다른 키를 굶기지 않음"""
+        limiter = FairConcurrencyLimiter(max_concurrency=1)
+        await limiter.acquire("holder")
+        order = []
+
+        async def worker(key):
+            await limiter.acquire(key)
+            order.append(key)
+            limiter.release()
+
+        tasks = [asyncio.ensure_future(worker("a")) for _ in range(3)]
+        tasks.append(asyncio.ensure_future(worker("b")))
+        await asyncio.sleep(0)
+
+        limiter.release()
+        await asyncio.gather(*tasks)
+
+        assert order == ["a", "b", "a", "a"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_leak_slot(self):
+        """대기 중 취소된 요청은 슬롯을 점유하지 않음"""
+        limiter = FairConcurrencyLimiter(max_concurrency=1)
+        await limiter.acquire("holder")
+
+        waiter = asyncio.ensure_future(limiter.acquire("a"))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        limiter.release()
+        assert limiter.active == 0
+        assert limiter.waiting == 0
+
+
+class TestLLMAdmissionController:
+    """승인 계층 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_limits_concurrency(self):
+        """동시 실행 수가 max_concurrency를 넘지 않음"""
+        controller = LLMAdmissionController(max_concurrency=2)
+        running = 0
+        peak = 0
+
+        async def call():
+            nonlocal running, peak
+            async with controller.admit("session", 100):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*(call() for _ in range(6)))
+
+        assert peak == 2
+        metrics = controller.get_metrics()
+        assert metrics["admitted"] == 6
+        assert metrics["active"] == 0
+        assert metrics["queue_wait_max_seconds"] > 0
+
+    @pytest.mark.asyncio
+    async def test_zero_concurrency_disables_limit(self):
+        """max_concurrency가 0이면 동시성 제한 없이 바로 승인"""
+        controller = LLMAdmissionController(max_concurrency=0)
+        release = asyncio.Event()
+        running = 0
+
+        async def call():
+            nonlocal running
+            async with controller.admit("session", 100, timeout=1.0):
+                running += 1
+                await release.wait()
+
+        tasks = [asyncio.create_task(call()) for _ in range(5)]
+        await asyncio.sleep(0.01)
+        assert running == 5
+        assert controller.get_metrics()["waiting"] == 0
+
+        release.set()
+        await asyncio.gather(*tasks)
+        assert controller.get_metrics()["active"] == 0
+
+    @pytest.mark.asyncio
+    async def test_admission_timeout_does_not_take_slot(self):
+        """제한 시간 안에 승인되지 않으면 대기열에서 빠지고 슬롯을 점유하지 않음"""
+        controller = LLMAdmissionController(max_concurrency=1)
+        release = asyncio.Event()
+
+        async def hold():
+            async with controller.admit("first", 100):
+                await release.wait()
+
+        holder = asyncio.create_task(hold())
+        await asyncio.sleep(0)
+
+        with pytest.raises(AdmissionTimeoutError):
+            async with controller.admit("second", 100, timeout=0.01):
+                pass
+
+        release.set()
+        await holder
+        metrics = controller.get_metrics()
+        assert metrics["timed_out"] == 1
+        assert metrics["admitted"] == 1
+        assert metrics["active"] == 0
+        assert metrics["waiting"] == 0
@@ -0,0 +1,103 @@
+from collections import Counter
+
+from app.schemas.coaching import (
+    CoachingResult,
+    InterviewQuestion,
+    LearningPath,
+    LearningStep,
+    ResumePayload,
+)
+from app.services.prompt_builder import PromptBuilder
+from app.services.quality_evaluator import QualityEvaluator
+from app.services.resume_features import extract_resume_features
+
+
+class TestResumeFeatures:
+    """이력서 특징 추출 테스트"""
+
+    def setup_method(self):
+        """각 테스트 전 실행"""
+        self.resume = ResumePayload(
+            career_summary="7년차 백엔드 개발자, 스타트업에서 결제 플랫폼 리드",
+            job_duties="주문 시스템 MSA 전환 및 분산 트랜잭션 아키텍처 설계, 신규 입사자 멘토링",
+            technical_skills=["Spring Boot", "Kafka", "Redis", "MongoDB"],
+        )
+
+    def test_normalizes_text_and_counts_keywords(self):
+        """소문자 정규화 후 토큰과 2글자 초과 키워드 등장 횟수 계산"""
+        features = extract_resume_features(self.resume)
+
+        assert features.technical_skills == ("spring boot", "kafka", "redis", "mongodb")
+        assert features.tokens[-4:] == features.technical_skills
+        assert "msa" in features.tokens
+        assert features.keyword_counts == Counter(
+            token for token in features.tokens if len(token) > 2
+        )
+        assert "및" not in features.keyword_counts
+
+    def test_keywords_are_counted_on_first_use(self):
+        """프롬프트 구성만으로는 관련성 평가용 키워드를 집계하지 않음"""
+        features = extract_resume_features(self.resume)
+        PromptBuilder().build_learning_path_prompt(self.resume, features=features)
+        assert "keyword_counts" not in vars(features)
+
+        assert features.keyword_counts is features.keyword_counts
+        assert "keyword_counts" in vars(features)
+
+    def test_keeps_original_text_for_prompts(self):
+        """프롬프트에는 정규화 전 원문 필드를 사용"""
+        features = extract_resume_features(self.resume)
+
+        assert features.prompt_fields == {
+            "career_summary": self.resume.career_summary,
+            "job_duties": self.resume.job_duties,
+            "technical_skills": "Spring Boot, Kafka, Redis, MongoDB",
+        }
+
+    def test_decides_persona_and_strategy(self):
+        """PromptBuilder의 자동 선택과 같은 페르소나/전략 결정"""
+        features = extract_resume_features(self.resume)
+        builder = PromptBuilder()
+
+        assert features.persona == "startup_cto"
+        assert features.strategy == "system_design"
+        assert features.persona == builder._select_optimal_persona(self.resume)
+        assert features.strategy == builder._determine_strategy(self.resume)
+
+    def test_prompts_and_scores_match_without_features(self):
+        """특징을 전달해도 직접 추출할 때와 같은 프롬프트와 점수"""
+        features = extract_resume_features(self.resume)
+        builder = PromptBuilder()
+        evaluator = QualityEvaluator()
+        result = CoachingResult(
+            interview_questions=[
+                InterviewQuestion(
+                    question=f"{skill} 기반 MSA 전환 프로젝트에서 겪은 장애를 구체적으로 설명해주세요?",
+                    intent="분산 시스템 문제 해결 경험을 평가합니다",
+                    category="Technical Deep-Dive",
+                )
+                for skill in ["Kafka", "Redis", "MongoDB", "Spring Boot", "Java"]
+            ],
+            learning_path=LearningPath(
+                summary="분산 트랜잭션 역량 강화",
+                steps=[
+                    LearningStep(
+                        title="Redis 캐시 사이드 프로젝트",
+                        description="MongoDB와 Redis를 활용한 주문 조회 API를 구현합니다",
+                        resources=["Redis 공식 문서"],
+                    )
+                ],
+            ),
+        )
+
+        assert builder.build_interview_questions_prompt(
+            self.resume, "tech_lead", "balanced", features
+        ) == builder.build_interview_questions_prompt(
+            self.resume, "tech_lead", "balanced"
+        )
+        assert builder.build_learning_path_prompt(
+            self.resume, features=features
+        ) == builder.build_learning_path_prompt(self.resume)
+        assert evaluator.evaluate_coaching_result(
+            result, self.resume, features
+        ) == evaluator.evaluate_coaching_result(result, self.resume)
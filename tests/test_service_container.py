@@ -0,0 +1,143 @@
+import asyncio
+import pytest
+from contextlib import ExitStack
+from unittest.mock import patch
+from fastapi.testclient import TestClient
+import app.core.executor as executor_module
+import app.core.loop_monitor as loop_monitor_module
+import app.services.coaching_service as coaching_service_module
+import app.services.container as container_module
+import app.services.job_queue as job_queue_module
+import app.services.llm_client as llm_client_module
+import app.services.prompt_builder as prompt_builder_module
+import app.services.quality_evaluator as quality_evaluator_module
+from app.core.config import settings
+from app.main import app
+from app.services.container import ServiceContainer
+from app.services.llm_providers import MockLLMProvider
+from app.services.prompt_builder import get_prompt_builder
+from app.services.quality_evaluator import (
+    VECTORIZED_MIN_CANDIDATES,
+    get_quality_evaluator,
+)
+
+
+@pytest.fixture
+def fresh_singletons():
+    """서비스 싱글톤을 비운 상태로 테스트하고 종료 시 원래 인스턴스 복원"""
+    with ExitStack() as stack:
+        for module, name in [
+            (executor_module, "_cpu_executor"),
+            (loop_monitor_module, "_loop_monitor"),
+            (coaching_service_module, "_coaching_service"),
+            (container_module, "_service_container"),
+            (job_queue_module, "_job_queue"),
+            (llm_client_module, "_llm_client"),
+            (prompt_builder_module, "_prompt_builder"),
+            (quality_evaluator_module, "_quality_evaluator"),
+        ]:
+            stack.enter_context(patch.object(module, name, None))
+        yield
+
+
+@pytest.fixture
+def mock_settings(fresh_singletons):
+    """모의 공급자를 사용하는 설정"""
+    with patch.object(settings, "llm_provider", "mock"), patch.object(
+        settings, "llm_mock_latency_seconds", 0.0
+    ), patch.object(settings, "openai_api_key", None), patch.object(
+        settings, "job_store_sqlite_path", None
+    ):
+        yield settings
+
+
+class TestServiceSingletons:
+    """서비스 싱글톤 테스트"""
+
+    def test_prompt_builder_and_evaluator_are_built_once(self, fresh_singletons):
+        """프롬프트 빌더와 품질 평가자는 호출마다 같은 인스턴스 반환"""
+        assert get_prompt_builder() is get_prompt_builder()
+        assert get_quality_evaluator() is get_quality_evaluator()
+
+
+class TestServiceContainer:
+    """서비스 컨테이너 시작/워밍업 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_start_builds_and_warms_up_services(self, mock_settings):
+        """시작 시 서비스를 한 번 생성하고 워밍업 단계별 시간을 기록"""
+        container = ServiceContainer()
+        await container.start()
+        try:
+            service = container.coaching_service
+            assert service is coaching_service_module.get_coaching_service()
+            assert service.llm_client is container.llm_client
+            assert service.prompt_builder is container.prompt_builder
+            assert service.quality_evaluator is container.quality_evaluator
+
+            # 일괄 품질 평가가 작업자 풀에서 한 번 실행되고 LLM 연결 프로브 완료
+            assert container.cpu_executor.get_metrics()["items"] == (
+                VECTORIZED_MIN_CANDIDATES
+            )
+            assert container.llm_client.health_monitor.last_probe_ok is True
+            assert container.loop_monitor.running
+            assert container.job_queue.running
+
+            metrics = container.get_metrics()
+            assert metrics["started"] is True
+            assert set(metrics["warmup_seconds"]) == {
+                "services",
+                "prompts_and_scoring",
+                "llm_connection",
+                "background_tasks",
+                "total",
+            }
+        finally:
+            await container.stop()
+
+        assert container.started is False
+        assert not container.loop_monitor.running
+        assert not container.job_queue.running
+
+    @pytest.mark.asyncio
+    async def test_missing_api_key_skips_llm_services(self, fresh_singletons):
+        """LLM 설정 오류가 있어도 나머지 서비스는 워밍업 후 시작"""
+        with patch.object(settings, "llm_provider", "openai"), patch.object(
+            settings, "openai_api_key", None
+        ), patch.object(settings, "job_store_sqlite_path", None):
+            container = ServiceContainer()
+            await container.start()
+            await container.stop()
+
+        assert container.coaching_service is None
+        assert "API key" in container.llm_error
+        assert "llm_connection" not in container.warmup_seconds
+        assert container.cpu_executor.get_metrics()["tasks"] == 1
+
+    @pytest.mark.asyncio
+    async def test_slow_probe_does_not_block_startup(self, mock_settings):
+        """LLM 연결 워밍업은 제한 시간 안에서만 대기"""
+
+        async def slow_probe(self):
+            await asyncio.sleep(1.0)
+
+        with patch.object(MockLLMProvider, "probe", slow_probe), patch.object(
+            settings, "startup_probe_timeout_seconds", 0.01
+        ):
+            container = ServiceContainer()
+            await container.start()
+            await container.stop()
+
+        assert container.warmup_seconds["llm_connection"] < 0.5
+        assert container.llm_client.health_monitor.last_probe_ok is None
+
+    def test_lifespan_exposes_warmup_metrics(self, mock_settings):
+        """앱 lifespan에서 컨테이너를 시작하고 운영 지표로 워밍업 시간 노출"""
+        with TestClient(app) as client:
+            response = client.get("/api/v1/metrics")
+
+        assert response.status_code == 200
+        startup = response.json()["startup"]
+        assert startup["started"] is True
+        assert startup["warmup_seconds"]["total"] > 0
+        assert container_module.get_service_container().started is False
@@ -0,0 +1,50 @@
+from app.schemas.coaching import ResumePayload
+from app.services.session_cache import (
+    normalize_resume_payload,
+    make_session_cache_key,
+)
+
+
+def make_resume(**overrides):
+    """샘플 이력서 생성"""
+    data = {
+        "career_summary": "3년차 백엔드 개발자, Spring Boot/MSA/Python 기반 커머스 서비스 개발",
+        "job_duties": "주문 및 결제 시스템 MSA 전환 프로젝트 리딩",
+        "technical_skills": ["Spring Boot", "MSA", "Python"],
+    }
+    data.update(overrides)
+    return ResumePayload(**data)
+
+
+class TestSessionCacheKey:
+    """세션 캐시 키 테스트"""
+
+    def test_normalizes_whitespace_and_case(self):
+        """공백과 대소문자 차이는 같은 키"""
+        original = make_resume()
+        variant = make_resume(
+            career_summary="  3년차 백엔드 개발자,  spring boot/msa/python 기반 커머스 서비스 개발 ",
+            job_duties="주문 및 결제 시스템\nMSA 전환 프로젝트 리딩",
+        )
+
+        assert make_session_cache_key(original, True) == make_session_cache_key(
+            variant, True
+        )
+
+    def test_skills_are_sorted_and_deduplicated(self):
+        """기술 스킬은 순서와 중복에 무관"""
+        resume = make_resume(technical_skills=["Python", "msa", "MSA", "Spring  Boot"])
+
+        assert normalize_resume_payload(resume)["technical_skills"] == [
+            "msa",
+            "python",
+            "spring boot",
+        ]
+
+    def test_optimization_mode_is_part_of_key(self):
+        """최적화 모드가 다르면 다른 키"""
+        resume = make_resume()
+
+        assert make_session_cache_key(resume, True) != make_session_cache_key(
+            resume, False
+        )
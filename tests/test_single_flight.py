@@ -0,0 +1,117 @@
+import asyncio
+import pytest
+from app.core.deadline import Deadline
+from app.services.single_flight import SingleFlight
+
+
+class TestSingleFlight:
+    """동일 요청 병합 테스트"""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_calls_share_one_execution(self):
+        """동시에 들어온 같은 키의 호출은 한 번만 실행"""
+        flight = SingleFlight()
+        executions = 0
+
+        async def work():
+            nonlocal executions
+            executions += 1
+            await asyncio.sleep(0.01)
+            return "결과"
+
+        results = await asyncio.gather(*(flight.do("key", work) for _ in range(5)))
+
+        assert executions == 1
+        assert [value for value, _ in results] == ["결과"] * 5
+        assert [joined for _, joined in results] == [False] + [True] * 4
+        assert flight.get_metrics() == {"executed": 1, "collapsed": 4, "in_flight": 0}
+
+    @pytest.mark.asyncio
+    async def test_completed_key_runs_again(self):
+        """완료된 키는 다음 호출에서 다시 실행"""
+        flight = SingleFlight()
+
+        async def work():
+            return 1
+
+        await flight.do("key", work)
+        await flight.do("key", work)
+
+        assert flight.executed == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelling_one_waiter_keeps_shared_call(self):
+        """한 대기자가 취소되어도 다른 대기자는 결과를 받음"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0.02)
+            return "결과"
+
+        first = asyncio.ensure_future(flight.do("key", work))
+        second = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        value, _ = await second
+        assert value == "결과"
+        assert first.cancelled()
+
+    @pytest.mark.asyncio
+    async def test_cancelling_all_waiters_cancels_shared_call(self):
+        """모든 대기자가 취소되면 공유 호출도 취소"""
+        flight = SingleFlight()
+        cancelled = asyncio.Event()
+
+        async def work():
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+
+        waiter = asyncio.ensure_future(flight.do("key", work))
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+        assert cancelled.is_set()
+        assert flight.in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_to_all_waiters(self):
+        """공유 호출의 예외는 모든 대기자에게 전달"""
+        flight = SingleFlight()
+
+        async def work():
+            await asyncio.sleep(0)
+            raise ValueError("실패")
+
+        results = await asyncio.gather(
+            flight.do("key", work), flight.do("key", work), return_exceptions=True
+        )
+
+        assert all(isinstance(result, ValueError) for result in results)
+
+    @pytest.mark.asyncio
+    async def test_longer_deadline_does_not_join_shorter_call(self):
+        """진행 중인 호출보다 데드라인이 긴 요청은 새로 실행하고, 짧은 요청만 합류"""
+        flight = SingleFlight()
+        executions = 0
+
+        async def work():
+            nonlocal executions
+            executions += 1
+            await asyncio.sleep(0.01)
+            return executions
+
+        results = await asyncio.gather(
+            flight.do("key", work, Deadline.after(1)),
+            flight.do("key", work, Deadline.after(10)),
+            flight.do("key", work, Deadline.after(5)),
+            flight.do("key", work),
+        )
+
+        assert executions == 3
+        assert [joined for _, joined in results] == [False, False, True, False]
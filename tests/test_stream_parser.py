@@ -0,0 +1,105 @@
+import json
+import pytest
+from app.services.stream_parser import (
+    JSONArrayStreamParser,
+    parse_llm_json,
+    strip_trailing_commas,
+)
+
+
+LEARNING_PATH_DOCUMENT = json.dumps(
+    {
+        "learning_path": {
+            "summary": '요약 {괄호} "인용" [배열]',
+            "steps": [
+                {"title": f"단계 {i}", "description": "설명, }", "resources": ["a", "b"]}
+                for i in range(3)
+            ],
+        }
+    },
+    ensure_ascii=False,
+    indent=2,
+)
+
+
+def feed_all(parser, text, chunk_size):
+    """문서를 chunk_size 단위로 나누어 파서에 전달"""
+    items = []
+    for start in range(0, len(text), chunk_size):
+        items.extend(parser.feed(text[start : start + chunk_size]))
+    return items
+
+
+class TestJSONArrayStreamParser:
+    """점진적 배열 파서 테스트"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 7, 1000])
+    def test_extracts_items_regardless_of_chunking(self, chunk_size):
+        """조각 크기와 관계없이 같은 요소 추출"""
+        parser = JSONArrayStreamParser("steps")
+
+        items = feed_all(parser, LEARNING_PATH_DOCUMENT, chunk_size)
+
+        expected = json.loads(LEARNING_PATH_DOCUMENT)["learning_path"]["steps"]
+        assert items == expected
+        assert parser.closed
+
+    def test_yields_item_when_closing_brace_arrives(self):
+        """요소는 닫는 괄호가 도착하는 즉시 반환"""
+        parser = JSONArrayStreamParser("interview_questions")
+
+        assert parser.feed('{"interview_questions": [{"question": "a"') == []
+        assert parser.feed('}, {"question"') == [{"question": "a"}]
+        assert parser.feed(': "b"}]}') == [{"question": "b"}]
+
+    def test_ignores_keys_inside_strings(self):
+        """문자열 값 안의 키 이름은 배열로 인식하지 않음"""
+        parser = JSONArrayStreamParser("steps")
+
+        items = parser.feed(
+            '{"summary": "\\"steps\\": [{\\"x\\": 1}]", "steps": [{"y": 2}]}'
+        )
+
+        assert items == [{"y": 2}]
+
+    def test_tolerates_code_fence_and_trailing_commas(self):
+        """코드 블록 표시와 닫는 괄호 앞 쉼표 허용"""
+        parser = JSONArrayStreamParser("steps")
+
+        items = parser.feed(
+            '```json\n{"steps": [{"title": "a",}, {"title": "b"},]}\n```'
+        )
+
+        assert items == [{"title": "a"}, {"title": "b"}]
+
+    def test_malformed_item_is_skipped(self):
+        """복구할 수 없는 요소는 건너뛰고 다음 요소 계속 추출"""
+        parser = JSONArrayStreamParser("steps")
+
+        items = parser.feed('{"steps": [{"title": a}, {"title": "b"}]}')
+
+        assert items == [{"title": "b"}]
+        assert parser.malformed == 1
+
+
+class TestParseLLMJson:
+    """관대한 JSON 파싱 테스트"""
+
+    def test_valid_json_parses_directly(self):
+        """정상 JSON은 그대로 파싱"""
+        assert parse_llm_json('{"a": [1, 2]}') == {"a": [1, 2]}
+
+    def test_recovers_code_fence_prose_and_trailing_commas(self):
+        """코드 블록, 앞뒤 설명, 닫는 괄호 앞 쉼표 복구"""
+        text = '다음은 결과입니다.\n```json\n{"a": [1, 2,], "b": "x,]",}\n```'
+
+        assert parse_llm_json(text) == {"a": [1, 2], "b": "x,]"}
+
+    def test_unrecoverable_raises_decode_error(self):
+        """복구할 수 없으면 JSONDecodeError"""
+        with pytest.raises(json.JSONDecodeError):
+            parse_llm_json("JSON이 아닌 응답")
+
+    def test_strip_trailing_commas_keeps_string_content(self):
+        """문자열 안의 쉼표는 유지"""
+        assert strip_trailing_commas('["a,]", 1 ,\n]') == '["a,]", 1 \n]'